@@ -0,0 +1,51 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Call count benchmark of the coalescing batch (SAP2000Py.coalesce_Begin)
+#  on the stand-in backend. Run: python benchmarks/bench_coalesce.py
+#########################################################################
+import os
+import sys
+import time
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+from standInSapModel import standInSAP2000Py
+
+
+def pileGroupScript(sapPy,numPoints):
+    """---restraints, springs and a mass on every base point of a pile group, per object---"""
+    for i in range(numPoints):
+        sapPy.assign_PointObj_SetRestraint(str(i),[True,True,True,False,False,False])
+        sapPy.assign_PointObj_SetSpring(str(i),[1e5,1e5,0,0,0,0])
+        sapPy.assign_PointObj_SetMass(str(i),[1.0,1.0,1.0,0,0,0])
+
+
+def frameScript(sapPy,numFrames):
+    """---releases and a section on every beam, properties on areas and links, per object---"""
+    for i in range(numFrames):
+        sapPy.assign_FrameObj_SetReleases(str(i),[False]*5+[True],[False]*5+[True])
+        sapPy.assign_FrameObj_SetSection(str(i),"BEAM")
+        sapPy.assign_AreaObj_SetProperty(str(i),"DECK")
+        sapPy.assign_LinkObj_SetProperty(str(i),"BEARING")
+        sapPy.assign_LinkObj_SetLocalAxes(str(i),90)
+
+
+def runScenario(script,size,latency,coalesce):
+    sapPy=standInSAP2000Py(latency)
+    start=time.perf_counter()
+    if coalesce:
+        sapPy.coalesce_Begin()
+    script(sapPy,size)
+    if coalesce:
+        sapPy.coalesce_End()
+    return sapPy.SapModel.totalCalls(),time.perf_counter()-start
+
+
+if __name__ == '__main__':
+    latency=float(sys.argv[1]) if len(sys.argv)>1 else 0.0
+    print("%-18s%8s%14s%14s%8s%12s%12s" % ("scenario","size","direct calls","batch calls","ratio",
+                                          "direct [s]","batch [s]"))
+    for script in (pileGroupScript,frameScript):
+        for size in (10,100,1000,10000):
+            directCalls,directTime=runScenario(script,size,latency,False)
+            batchCalls,batchTime=runScenario(script,size,latency,True)
+            print("%-18s%8d%14d%14d%8.2f%12.3f%12.3f" % (script.__name__,size,directCalls,batchCalls,
+                                                          directCalls/batchCalls,directTime,batchTime))
@@ -0,0 +1,304 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Wrapper overhead benchmark of the SAP2000Py method families on the
+#  stand-in backend: the time per call and its scaling with the payload
+#  size (1 to 10^6 elements), compared with a stored baseline in units of
+#  the bare stand-in call time measured next to every repeat.
+#  Run: python benchmarks/bench_wrapperOverhead.py [--save] [--threshold 0.25]
+#       [--noise-factor 3] [--max-size 1000000] [--family assign]
+#  The module is also an asv benchmark (class WrapperOverhead) and a
+#  pytest-benchmark test (pytest benchmarks/bench_wrapperOverhead.py).
+#########################################################################
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+sys.path.insert(0,os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+from standInSapModel import standInSAP2000Py
+
+SIZES=[1,10,100,1000,10000,100000,1000000]
+BASELINE=os.path.join(os.path.dirname(os.path.abspath(__file__)),"baselines","wrapperOverhead.json")
+
+
+def resultsArrays(numResults,numNames,numValues):
+    """---a COM style results tuple: [0,N,names...,values...] with numResults rows---"""
+    names=["%d" % each for each in range(numResults)]
+    values=np.random.default_rng(0).random(numResults).tolist()
+    return tuple([0,numResults]+[names]*numNames+[values]*numValues)
+
+
+# every case builds the timed function for one payload size, the work outside of it is not timed
+def fileSave(sapPy,size):
+    return lambda:sapPy.file_Save("C:/bench/model.sdb")
+
+
+def fileOpenFile(sapPy,size):
+    return lambda:sapPy.file_OpenFile("C:/bench/model.sdb")
+
+
+def materialSetMPIsotropic(sapPy,size):
+    return lambda:sapPy.define_material_SetMPIsotropic("C30",3.0e7,0.2,1e-5)
+
+
+def materialSetSSCurve(sapPy,size):
+    strain=np.linspace(-0.0035,0.01,size).tolist()
+    stress=np.linspace(-30,500,size).tolist()
+    return lambda:sapPy.define_material_SetSSCurve("HRB400",strain,stress)
+
+
+def propLinkSetLinear(sapPy,size):
+    return lambda:sapPy.define_section_PropLink_SetLinear("BEARING",["U1","U2","U3"],[],{"U1":1e6,"U2":2e3,"U3":2e3})
+
+
+def propLinkSetBulk(sapPy,size):
+    props=np.zeros(size,dtype=sapPy.define_section_PropLink_GetDtype("RubberIsolator",nameLength=8))
+    props["name"]=["L%d" % each for each in range(size)]
+    props["DOF"][:,:3]=True
+    props["Nonlinear"][:,1:3]=True
+    props["Ke"][:,:3]=[1e6,2e3,2e3]
+    props["k"][:,1:3]=2e3
+    props["yieldF"][:,1:3]=50.0
+    props["Ratio"][:,1:3]=0.1
+    return lambda:sapPy.define_section_PropLink_SetBulk("RubberIsolator",props)
+
+
+def loadCasesStaticNonlinearSetLoads(sapPy,size):
+    loadType=["Load"]*size
+    loadName=["P%d" % each for each in range(size)]
+    SF=[1.0]*size
+    return lambda:sapPy.define_loadCases_StaticNonlinear_SetLoads("PUSH",size,loadType,loadName,SF)
+
+
+def functionsFuncTHSetUser(sapPy,size):
+    myTime=np.arange(size)*0.01
+    value=np.sin(myTime).tolist()
+    myTime=myTime.tolist()
+    return lambda:sapPy.define_functions_FuncTH_SetUser("RSN1",myTime,value)
+
+
+def pointObjSetRestraint(sapPy,size):
+    def run():
+        for each in range(size):
+            sapPy.assign_PointObj_SetRestraint(str(each),[True,True,True,False,False,False])
+    return run
+
+
+def pointObjAddCartesianBulk(sapPy,size):
+    xyz=np.random.default_rng(0).random((size,3))
+    return lambda:sapPy.assign_PointObj_AddCartesianBulk(xyz)
+
+
+def pointObjSetRestraintBulk(sapPy,size):
+    names=[str(each) for each in range(size)]
+    mask=np.zeros((size,6),dtype=bool)
+    mask[:,:3]=True
+    mask[::7,3:]=True
+    return lambda:sapPy.assign_PointObj_SetRestraintBulk(names,mask,KeepGroups=False)
+
+
+def analyzeSetRunCaseFlag(sapPy,size):
+    return lambda:sapPy.analyze_SetRunCaseFlag("MODAL",True)
+
+
+def analyzeGetCaseStatus(sapPy,size):
+    sapPy.SapModel.responses["Analyze.GetCaseStatus"]=resultsArrays(size,1,1)
+    return lambda:sapPy.analyze_GetCaseStatus()
+
+
+def analyzeDirtyCasesGetRunCases(sapPy,size):
+    names=["%d" % each for each in range(size)]
+    sapPy.SapModel.responses["Analyze.GetCaseStatus"]=(0,size,names,[4]*size)
+    sapPy.analyze_DirtyCases_Enable()
+    sapPy.analyze_RunAnalysis()
+    sapPy.analyze_DirtyCases_Mark("case","0")
+    return lambda:sapPy.analyze_DirtyCases_GetRunCases()
+
+
+def resultsJointDispl(sapPy,size):
+    sapPy.SapModel.responses["Results.JointDispl"]=resultsArrays(size,5,7)
+    return lambda:sapPy.results_JointDispl("ALL",2)
+
+
+def resultsBaseReact(sapPy,size):
+    sapPy.SapModel.responses["Results.BaseReact"]=resultsArrays(size,2,7)+(0.0,0.0,0.0)
+    return lambda:sapPy.results_BaseReact()
+
+
+# family: [(case,build,sizes),...], a case without payload runs with size 1 only; the results_* functions and
+# analyze_GetCaseStatus return the COM arrays as they are, so they run with size 1 only as well
+CASES={
+    "file":[("file_Save",fileSave,[1]),("file_OpenFile",fileOpenFile,[1])],
+    "define_material":[("define_material_SetMPIsotropic",materialSetMPIsotropic,[1]),
+                       ("define_material_SetSSCurve",materialSetSSCurve,SIZES)],
+    "define_section_PropLink":[("define_section_PropLink_SetLinear",propLinkSetLinear,[1]),
+                               ("define_section_PropLink_SetBulk",propLinkSetBulk,SIZES)],
+    "define_loadCases":[("define_loadCases_StaticNonlinear_SetLoads",loadCasesStaticNonlinearSetLoads,SIZES)],
+    "define_functions":[("define_functions_FuncTH_SetUser",functionsFuncTHSetUser,SIZES)],
+    "assign":[("assign_PointObj_SetRestraint",pointObjSetRestraint,SIZES),
+              ("assign_PointObj_AddCartesianBulk",pointObjAddCartesianBulk,SIZES),
+              ("assign_PointObj_SetRestraintBulk",pointObjSetRestraintBulk,SIZES)],
+    "analyze":[("analyze_SetRunCaseFlag",analyzeSetRunCaseFlag,[1]),
+               ("analyze_GetCaseStatus",analyzeGetCaseStatus,[1]),
+               ("analyze_DirtyCases_GetRunCases",analyzeDirtyCasesGetRunCases,SIZES)],
+    "results":[("results_JointDispl",resultsJointDispl,[1]),("results_BaseReact",resultsBaseReact,[1])],
+}
+BUILDS={case:(build,sizes) for family in CASES.values() for case,build,sizes in family}
+
+
+def standInCallTime(repeats=5,number=20000):
+    """---time of one bare stand-in COM call, subtracted to get the wrapper overhead---"""
+    sapModel=standInSAP2000Py().SapModel
+    best=float("inf")
+    for each in range(repeats):
+        start=time.perf_counter()
+        for i in range(number):
+            sapModel.Analyze.SetRunCaseFlag("MODAL",True,False)
+        best=min(best,time.perf_counter()-start)
+    return best/number
+
+
+def timeLoop(run,number):
+    """---seconds per call of number calls of run---"""
+    start=time.perf_counter()
+    for each in range(number):
+        run()
+    return (time.perf_counter()-start)/number
+
+
+def measure(case,size,repeats=9,minTime=0.05):
+    """---[seconds per invocation, relative time, noise, COM calls per invocation] of one case and payload size.
+    Every repeat is preceded by a timing of the bare stand-in call; the relative time of a repeat is its time in
+    bare call times, so a change of the machine speed between (or during) the runs cancels out. seconds and
+    relative are the medians of the repeats, noise is the median absolute deviation of relative, not below the
+    timer resolution---"""
+    build,sizes=BUILDS[case]
+    sapPy=standInSAP2000Py()
+    run=build(sapPy,size)
+    sapPy.SapModel.reset()
+    run()
+    comCalls=sapPy.SapModel.totalCalls()
+    bare=standInSAP2000Py().SapModel.Analyze.SetRunCaseFlag
+    bareCall=lambda:bare("MODAL",True,False)
+    referenceNumber=max(int(minTime/5/timeLoop(bareCall,1000)),1000)
+    number=1
+    while True:
+        elapsed=timeLoop(run,number)*number
+        if elapsed>=minTime or number>=1000000:
+            break
+        number*=10 if elapsed<minTime/10 else 2
+    times=[]
+    relatives=[]
+    for each in range(repeats):
+        reference=timeLoop(bareCall,referenceNumber)
+        times.append(timeLoop(run,number))
+        relatives.append(times[-1]/reference)
+    relative=float(np.median(relatives))
+    resolution=time.get_clock_info("perf_counter").resolution/number/min(times)*relative
+    noise=max(float(np.median(np.abs(np.array(relatives)-relative))),resolution)
+    return float(np.median(times)),relative,noise,comCalls
+
+
+def runSuite(families=None,maxSize=SIZES[-1],repeats=9,minTime=0.05):
+    """---{"case:size":{"seconds","relative","noise","comCalls","overhead"}} of the selected families, see
+    measure---"""
+    callTime=standInCallTime()
+    results={}
+    for family,cases in CASES.items():
+        if families and family not in families:
+            continue
+        for case,build,sizes in cases:
+            for size in sizes:
+                if size>maxSize:
+                    continue
+                seconds,relative,noise,comCalls=measure(case,size,repeats,minTime)
+                results["%s:%d" % (case,size)]={"seconds":seconds,"relative":relative,"noise":noise,
+                                                "comCalls":comCalls,"overhead":max(seconds-comCalls*callTime,0.0)}
+    return results
+
+
+def compareBaseline(results,baseline,threshold,noiseFactor=3.0):
+    """---[(key,ratio),...] of the cases whose relative time (see measure) exceeds the one of the baseline by more
+    than threshold times the baseline and noiseFactor times the larger noise of the two runs, so that neither the
+    repeat scatter nor the timer resolution of a fast case is flagged---"""
+    regressions=[]
+    for key,result in results.items():
+        if key not in baseline:
+            continue
+        base=baseline[key]
+        ratio=result["relative"]/base["relative"]
+        allowed=max(threshold*base["relative"],noiseFactor*max(result["noise"],base["noise"]))
+        if result["relative"]-base["relative"]>allowed:
+            regressions.append((key,ratio))
+    return regressions
+
+
+class WrapperOverhead():
+    """---asv benchmark: time per invocation of every case and payload size---"""
+    params=[list(BUILDS),SIZES]
+    param_names=["case","size"]
+    timeout=600
+
+    def setup(self,case,size):
+        build,sizes=BUILDS[case]
+        if size not in sizes:
+            # asv skips a parameter combination whose setup raises NotImplementedError
+            raise NotImplementedError
+        self.run=build(standInSAP2000Py(),size)
+
+    def time_call(self,case,size):
+        self.run()
+
+
+try:
+    import pytest
+except ImportError:
+    pytest=None
+
+if pytest is not None:
+    @pytest.mark.parametrize("case,size",[(case,size) for case,(build,sizes) in BUILDS.items() for size in sizes])
+    def test_wrapperOverhead(benchmark,case,size):
+        build,sizes=BUILDS[case]
+        benchmark(build(standInSAP2000Py(),size))
+
+
+if __name__ == '__main__':
+    parser=argparse.ArgumentParser(description="SAP2000Py wrapper overhead benchmark on the stand-in backend")
+    parser.add_argument("--family",action="append",choices=list(CASES),help="run only these method families")
+    parser.add_argument("--max-size",type=float,default=SIZES[-1],help="largest payload size")
+    parser.add_argument("--repeats",type=int,default=9,help="timed repeats, the medians are kept")
+    parser.add_argument("--baseline",default=BASELINE,help="baseline JSON file")
+    parser.add_argument("--save",action="store_true",help="store the results as the new baseline")
+    parser.add_argument("--threshold",type=float,default=0.25,help="relative slowdown flagged as regression")
+    parser.add_argument("--noise-factor",type=float,default=3.0,
+                        help="slowdowns below this many times the repeat noise are not flagged")
+    arguments=parser.parse_args()
+    results=runSuite(arguments.family,arguments.max_size,arguments.repeats)
+    baseline={}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as f:
+            baseline=json.load(f)
+    regressions=dict(compareBaseline(results,baseline,arguments.threshold,arguments.noise_factor))
+    # relative and noise in bare stand-in call times
+    print("%-44s%9s%14s%12s%10s%14s%10s%10s" % ("case","size","time [s]","relative","noise","overhead [s]",
+                                                 "calls","baseline"))
+    for key,result in results.items():
+        case,size=key.rsplit(":",1)
+        ratio="-"
+        if key in baseline:
+            ratio="%.2fx" % (result["relative"]/baseline[key]["relative"])
+        print("%-44s%9s%14.3e%12.4g%10.2g%14.3e%10d%10s%s" % (case,size,result["seconds"],result["relative"],
+                                                                result["noise"],result["overhead"],
+                                                                result["comCalls"],ratio,
+                                                                "  REGRESSION" if key in regressions else ""))
+    if arguments.save:
+        baseline.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(arguments.baseline)),exist_ok=True)
+        with open(arguments.baseline,"w") as f:
+            json.dump(baseline,f,indent=1,sort_keys=True)
+        print("baseline saved to "+arguments.baseline)
+    if regressions:
+        print("%d regression(s) above %.0f%% and the noise" % (len(regressions),100*arguments.threshold))
+        sys.exit(1)
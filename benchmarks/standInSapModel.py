@@ -0,0 +1,86 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Stand-in SapModel backend for benchmarking the SAP2000Py wrapper layer
+#  without a running SAP2000 program. Every COM call is counted (and can be
+#  delayed by a fixed latency to mimic the COM round trip).
+#########################################################################
+import itertools
+import time
+
+
+class _StandInNode():
+    """---one attribute of the stand-in object tree, e.g. SapModel.PointObj---"""
+    def __init__(self,root,path):
+        self._root=root
+        self._path=path
+
+    def __getattr__(self,name):
+        return _StandInNode(self._root,self._path+"."+name)
+
+    def __call__(self,*args):
+        return self._root._call(self._path,args)
+
+
+class StandInSapModel():
+    """---stand-in for the SapObject.SapModel COM object, counts the calls per API function---"""
+    def __init__(self,latency=0.0):
+        self.latency=latency
+        self.calls={}
+        self.responses={}
+        # None, or a list the calls are appended to as (path,args)
+        self.stream=None
+        self._names=itertools.count(1)
+
+    def __getattr__(self,name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _StandInNode(self,name)
+
+    def totalCalls(self):
+        return sum(self.calls.values())
+
+    def reset(self):
+        self.calls={}
+
+    def _call(self,path,args):
+        self.calls[path]=self.calls.get(path,0)+1
+        if self.stream is not None:
+            self.stream.append((path,args))
+        if self.latency:
+            time.sleep(self.latency)
+        # prepared return values, e.g. results arrays of a given size, a callable is called with the arguments
+        if path in self.responses:
+            if callable(self.responses[path]):
+                return self.responses[path](*args)
+            return self.responses[path]
+        # functions adding objects return the ByRef items with the assigned name last
+        if path=="PointObj.AddCartesian":
+            return (0,args[4] or str(next(self._names)))
+        if path=="AreaObj.AddByPoint":
+            return (0,args[1],args[4] or str(next(self._names)))
+        if path=="SolidObj.AddByPoint":
+            return (0,args[0],args[3] or str(next(self._names)))
+        if path in ("FrameObj.AddByPoint","LinkObj.AddByPoint"):
+            return (0,str(next(self._names)))
+        return 0
+
+
+class StandInSapObject():
+    """---stand-in for the CSI.SAP2000.API.SapObject COM object---"""
+    def __init__(self,latency=0.0):
+        self.SapModel=StandInSapModel(latency)
+
+    def ApplicationStart(self):
+        pass
+
+    def ApplicationExit(self,save):
+        pass
+
+
+def standInSAP2000Py(latency=0.0):
+    """---a SAP2000Py instance whose SapObject and SapModel are stand-ins---"""
+    from pythonInterSAP2000 import SAP2000Py
+    sapPy=SAP2000Py()
+    sapPy.SapObject=StandInSapObject(latency)
+    sapPy.SapModel=sapPy.SapObject.SapModel
+    return sapPy
@@ -9,10 +9,27 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import win32com.client
+import pythoncom
 import sys
 from itertools import chain
 import math
 import os
+import shutil
+import re
+import inspect
+import hashlib
+import json
+import difflib
+import time
+import asyncio
+import queue
+import threading
+import sqlite3
+import socket
+try:
+    import psutil
+except ImportError:
+    psutil=None
 #########################################################################
 #COM (component object model) is a technology from Microsoft that allows objects to communicate without the
 #need for either object to know any details about the other, even the language it's implemented in.
@@ -30,6 +47,17 @@ class SAP2000Py():
     def __init__(self):
         self.SapObject=None
         self.SapModel = None
+        self._coalesce=None
+        self._registry=None
+        self._bulkGroups={}
+        self._sectionCache={}
+        self._codeSpectrumCache={}
+        self._dirty=None
+        self._solverProfile=None
+        self._history=None
+        self._checkpoint=None
+        self._journal=None
+        self._modelCallDepth=0
 
     def initializeNewModel(self,unitsTag=6):
         """
@@ -42,12 +70,39 @@ class SAP2000Py():
         self.SapObject.ApplicationStart()  # start a SAP2000 program
         self.SapModel = self.SapObject.SapModel  # create SAP2000 model object
         self.SapModel.InitializeNewModel(unitsTag)#Clears the previous model and initializes a new model
+        self._resetModelCaches(self._checkpointSeed("initializeNewModel"+str(unitsTag)),
+                               ("initializeNewModel",{"unitsTag":unitsTag}))
+
+    def _resetModelCaches(self,Seed=None,Start=None):
+        """
+        ---forget the python side knowledge of the model when a new model is initialized or a file is opened, Seed is
+        the stream hash the model starts from, Start the (functionName,arguments) record of the start for the journal---
+        """
+        self._bulkGroups={}
+        if self._journal is not None and Start is not None:
+            self._journalNote(*Start)
+        if self._checkpoint is not None:
+            self._checkpoint["hash"]=Seed
+        if self._registry is not None:
+            self.define_registry_Enable(self._registry["aliasDuplicates"])
+        if self._dirty is not None:
+            self.analyze_DirtyCases_Enable()
+
+    def _modelStart(self,methodName,arguments):
+        """
+        ---reset the python side knowledge of the model after a model template function (file_New*), the start is the
+        function with its arguments---
+        """
+        arguments={key:value for key,value in arguments.items() if key!="self"}
+        self._resetModelCaches(self._modelCallHash(self._checkpointSeed(methodName),methodName,arguments),
+                               (methodName,arguments))
 
     def newBlank(self):
         """
         ---create a new blank model---
         """
         self.SapModel.File.NewBlank()
+        self._resetModelCaches(self._checkpointSeed("newBlank"),("newBlank",{}))
 
     def closeModel(self):
         """
@@ -160,6 +215,7 @@ class SAP2000Py():
             name of a defined frame section property. This item does not apply to the portal frame.
         """
         self.SapModel.File.New2DFrame(TempType,NumberStorys,StoryHeight,NumberBays,BayWidth,Restraint,Beam,Column,Brace)
+        self._modelStart("file_New2DFrame",locals())
 
     def file_NewWall(self,NumberXDivisions,DivisionWidthX,NumberZDivisions,DivisionWidthZ,Restraint=True,Area="Default"):
         """
@@ -176,6 +232,7 @@ class SAP2000Py():
             a defined shell section property.
         """
         self.SapModel.File.NewWall(NumberXDivisions,DivisionWidthX,NumberZDivisions,DivisionWidthZ,Restraint,Area)
+        self._modelStart("file_NewWall",locals())
 
     def file_New3DFrame(self,TempType,NumberStorys,StoryHeight,NumberBayX,BayWidthX,NumberBaysY,BayWidthY,
                         Restraint=True,Beam="Default",Column="Default",Area="Default",NumberXDivisions=4,NumberYDivisions=4):
@@ -206,6 +263,7 @@ class SAP2000Py():
         """
         self.SapModel.File.New3DFrame(TempType,NumberStorys,StoryHeight,NumberBayX,BayWidthX,NumberBaysY,BayWidthY,
                         Restraint,Beam,Column,Area,NumberXDivisions,NumberYDivisions)
+        self._modelStart("file_New3DFrame",locals())
 
     def file_NewSolidBlock(self,XWidth,YWidth,Height,Restraint=True,Solid="Default",NumberXDivisions=5,
                            NumberYDivisions=8,NumberZDivisions=10):
@@ -223,6 +281,7 @@ class SAP2000Py():
         """
         self.SapModel.File.NewSolidBlock(XWidth,YWidth,Height,Restraint,Solid,NumberXDivisions,
                            NumberYDivisions,NumberZDivisions)
+        self._modelStart("file_NewSolidBlock",locals())
 
     def file_Save(self,FileName):
         """
@@ -247,9 +306,881 @@ class SAP2000Py():
         FileName(str)-The full path of a model file to be opened in the Sap2000 application
         """
         self.SapModel.File.OpenFile(FileName)
+        self._resetModelCaches(self._checkpointFileHash(FileName) if self._checkpoint is not None else None,
+                               ("file_OpenFile",{"FileName":FileName}))
+
+
+    def file_checkpoint_Enable(self,StoreDir=None,MaxBytes=None,MaxAgeDays=None):
+        """
+        ---This function enables the model checkpoints. While they are enabled, the calls of the functions that
+        modify the model (see analyze_DirtyCases_Enable) are hashed into a stream hash: the hash of the previous
+        stream and of the function name and its full argument set. The stream starts when the checkpoints are
+        enabled and restarts from the hash of initializeNewModel (with its units), newBlank, the file_New* templates
+        (with their arguments) or the content of the file opened by file_OpenFile, so equal call streams applied to
+        the same start give the same hash. file_checkpoint_Save stores the model under the current hash, and
+        file_checkpoint_Build rebuilds a model from a list of calls by opening the checkpoint of its longest stored
+        prefix and applying only the remaining calls. The store keeps one folder per hash with the model file and
+        an index.json, which is updated under a lock file (index.lock) so several sessions can share a store; the
+        least recently used checkpoints are evicted beyond MaxBytes and the checkpoints not used for MaxAgeDays are
+        evicted, after every save---
+        inputs:
+        StoreDir(str)-The checkpoint store folder, None for .sap2000py/checkpoints in the user folder.
+        MaxBytes(int)-The maximum size of the store, None for no limit.
+        MaxAgeDays(float)-The maximum number of days since the last use of a checkpoint, None for no limit.
+        """
+        StoreDir=StoreDir or os.path.join(os.path.expanduser("~"),".sap2000py","checkpoints")
+        os.makedirs(StoreDir,exist_ok=True)
+        self._checkpoint={"dir":StoreDir,"maxBytes":MaxBytes,"maxAgeDays":MaxAgeDays,
+                          "hash":self._checkpointSeed("file_checkpoint_Enable"),"building":False}
+        self._modelCallInstall()
+
+    def file_checkpoint_Disable(self):
+        """
+        ---This function disables the model checkpoints, the store is kept---
+        """
+        self._checkpoint=None
+        self._modelCallInstall()
+
+    def file_checkpoint_GetHash(self):
+        """
+        ---This function retrieves the stream hash of the current model---
+        return:
+        hash(str)-The stream hash.
+        """
+        if self._checkpoint is None:
+            raise ValueError("the model checkpoints are not enabled")
+        return self._checkpoint["hash"]
+
+    def file_checkpoint_Save(self,FileName=None):
+        """
+        ---This function saves the model with file_Save and stores a copy of the model file under the current
+        stream hash---
+        inputs:
+        FileName(str)-The full path to which the model file is saved, None for the current model file.
+        return:
+        hash(str)-The stream hash of the checkpoint.
+        """
+        if self._checkpoint is None:
+            raise ValueError("the model checkpoints are not enabled")
+        FileName=FileName or self.SapModel.GetModelFilename()
+        if not FileName:
+            raise ValueError("the model has no file name, give FileName")
+        self.file_Save(FileName)
+        streamHash=self._checkpoint["hash"]
+        checkpointDir=os.path.join(self._checkpoint["dir"],streamHash)
+        lockFile=self._checkpointLock()
+        try:
+            os.makedirs(checkpointDir,exist_ok=True)
+            shutil.copyfile(FileName,os.path.join(checkpointDir,"checkpoint.sdb"))
+            index=self._checkpointIndex()
+            now=time.time()
+            index[streamHash]={"created":index.get(streamHash,{}).get("created",now),"lastUsed":now,
+                               "bytes":os.path.getsize(FileName)}
+            self._checkpointWriteIndex(index)
+        finally:
+            os.remove(lockFile)
+        self.file_checkpoint_Evict()
+        return streamHash
+
+    def file_checkpoint_Open(self,Hash,WorkFile):
+        """
+        ---This function opens a copy of a stored checkpoint, the checkpoint itself is not modified---
+        inputs:
+        Hash(str)-The stream hash of the checkpoint.
+        WorkFile(str)-The full path of the model file the checkpoint is copied to and opened from.
+        """
+        if self._checkpoint is None:
+            raise ValueError("the model checkpoints are not enabled")
+        checkpointFile=os.path.join(self._checkpoint["dir"],Hash,"checkpoint.sdb")
+        lockFile=self._checkpointLock()
+        try:
+            index=self._checkpointIndex()
+            if Hash not in index or not os.path.exists(checkpointFile):
+                raise ValueError("no checkpoint "+Hash)
+            workDir=os.path.dirname(os.path.abspath(WorkFile))
+            os.makedirs(workDir,exist_ok=True)
+            shutil.copyfile(checkpointFile,WorkFile)
+            index[Hash]["lastUsed"]=time.time()
+            self._checkpointWriteIndex(index)
+        finally:
+            os.remove(lockFile)
+        self.file_OpenFile(WorkFile)
+        self._checkpoint["hash"]=Hash
+
+    def file_checkpoint_Build(self,steps,WorkFile,SaveAt=()):
+        """
+        ---This function builds a model from a list of SAP2000Py calls applied to a blank model (newBlank). The
+        stream hashes of all prefixes of the list are computed first; the model is opened from the checkpoint of
+        the longest stored prefix and only the remaining calls are applied, then the model is stored as a
+        checkpoint. Variants sharing a common base should list the base calls first and give the length of the
+        base in SaveAt, so that the base is stored once and reused by the next variants. Each step is hashed as
+        given, a step can be any SAP2000Py function, e.g. a bulk function or assign_FrameObj_SetLoadTable. The hashes
+        equal the ones of the same calls made directly when all steps are followed functions; a function that only
+        calls other functions (e.g. assign_FrameObj_SetLoadTable) is one step here but several calls directly---
+        inputs:
+        steps(list)-[(functionName,args),...] or [(functionName,args,kwargs),...], e.g.
+            [("define_material_SetMatrial",("C30",2)),("assign_FrameObj_SetSection",("1","B300"),{"itemType":0})]
+        WorkFile(str)-The full path of the model file of the built model.
+        SaveAt(int list)-Numbers of applied steps after which a checkpoint is also stored.
+        return:
+        {"hash":str,"restoredSteps":int,"appliedSteps":int,"saved":[str,...]}
+        restoredSteps(int)-The number of steps taken from a checkpoint, 0 if the model was built from newBlank.
+        """
+        if self._checkpoint is None:
+            raise ValueError("the model checkpoints are not enabled")
+        calls=[]
+        hashes=[self._checkpointSeed("newBlank")]
+        for step in steps:
+            methodName,args,kwargs=tuple(step)+({},) if len(step)==2 else tuple(step)
+            method=getattr(type(self),methodName,None)
+            if not inspect.isfunction(method) or methodName.startswith("_"):
+                raise ValueError("unknown SAP2000Py function: "+str(methodName))
+            bound=inspect.signature(method).bind(self,*args,**kwargs)
+            bound.apply_defaults()
+            arguments=dict(bound.arguments)
+            del arguments["self"]
+            calls.append((methodName,args,kwargs))
+            hashes.append(self._modelCallHash(hashes[-1],methodName,arguments))
+        index=self._checkpointIndex()
+        restored=[count for count in range(len(hashes)) if hashes[count] in index and
+                  os.path.exists(os.path.join(self._checkpoint["dir"],hashes[count],"checkpoint.sdb"))]
+        saved=[]
+        if restored:
+            restoredSteps=restored[-1]
+            self.file_checkpoint_Open(hashes[restoredSteps],WorkFile)
+        else:
+            restoredSteps=0
+            self.newBlank()
+        self._checkpoint["building"]=True
+        try:
+            for count in range(restoredSteps,len(calls)):
+                methodName,args,kwargs=calls[count]
+                getattr(self,methodName)(*args,**kwargs)
+                self._checkpoint["hash"]=hashes[count+1]
+                if count+1 in SaveAt and count+1<len(calls):
+                    saved.append(self.file_checkpoint_Save(WorkFile))
+        finally:
+            self._checkpoint["building"]=False
+        if restoredSteps<len(calls) or not restored:
+            saved.append(self.file_checkpoint_Save(WorkFile))
+        return {"hash":hashes[-1],"restoredSteps":restoredSteps,"appliedSteps":len(calls)-restoredSteps,
+                "saved":saved}
+
+    def file_checkpoint_List(self):
+        """
+        ---This function retrieves the stored checkpoints---
+        return:
+        {hash:{"created":float,"lastUsed":float,"bytes":int}}, times in seconds since the epoch
+        """
+        if self._checkpoint is None:
+            raise ValueError("the model checkpoints are not enabled")
+        return self._checkpointIndex()
+
+    def file_checkpoint_Evict(self,MaxBytes=None,MaxAgeDays=None):
+        """
+        ---This function removes the checkpoints not used for MaxAgeDays, then the least recently used ones until
+        the store is not larger than MaxBytes---
+        inputs:
+        MaxBytes(int)-The maximum size of the store, None for the value given to file_checkpoint_Enable.
+        MaxAgeDays(float)-The maximum age, None for the value given to file_checkpoint_Enable.
+        return:
+        removed(str list)-The hashes of the removed checkpoints.
+        """
+        if self._checkpoint is None:
+            raise ValueError("the model checkpoints are not enabled")
+        MaxBytes=self._checkpoint["maxBytes"] if MaxBytes is None else MaxBytes
+        MaxAgeDays=self._checkpoint["maxAgeDays"] if MaxAgeDays is None else MaxAgeDays
+        lockFile=self._checkpointLock()
+        try:
+            index=self._checkpointIndex()
+            byAge=sorted(index,key=lambda streamHash:index[streamHash]["lastUsed"])
+            removed=[]
+            if MaxAgeDays is not None:
+                limit=time.time()-MaxAgeDays*86400.0
+                removed+=[streamHash for streamHash in byAge if index[streamHash]["lastUsed"]<limit]
+            if MaxBytes is not None:
+                total=sum(index[streamHash]["bytes"] for streamHash in byAge if streamHash not in removed)
+                for streamHash in byAge:
+                    if total<=MaxBytes:
+                        break
+                    if streamHash not in removed:
+                        removed.append(streamHash)
+                        total-=index[streamHash]["bytes"]
+            for streamHash in removed:
+                shutil.rmtree(os.path.join(self._checkpoint["dir"],streamHash),ignore_errors=True)
+                del index[streamHash]
+            if removed:
+                self._checkpointWriteIndex(index)
+        finally:
+            os.remove(lockFile)
+        return removed
+
+    def _checkpointIndex(self):
+        """
+        ---the index of the checkpoint store---
+        """
+        indexFile=os.path.join(self._checkpoint["dir"],"index.json")
+        if not os.path.exists(indexFile):
+            return {}
+        with open(indexFile) as f:
+            return json.load(f)
+
+    def _checkpointLock(self,StaleSeconds=60.0):
+        """
+        ---take the lock of the store index, a lock file created exclusively; a lock file older than StaleSeconds
+        was left by a stopped session and is removed. The caller removes the returned lock file---
+        """
+        lockFile=os.path.join(self._checkpoint["dir"],"index.lock")
+        while True:
+            try:
+                os.close(os.open(lockFile,os.O_CREAT|os.O_EXCL|os.O_WRONLY))
+                return lockFile
+            except FileExistsError:
+                try:
+                    if time.time()-os.path.getmtime(lockFile)>StaleSeconds:
+                        os.remove(lockFile)
+                        continue
+                except OSError:
+                    continue
+                time.sleep(0.01)
+
+    def _checkpointWriteIndex(self,index):
+        """
+        ---write the index of the checkpoint store, through a temporary file, under the lock of the index---
+        """
+        indexFile=os.path.join(self._checkpoint["dir"],"index.json")
+        with open(indexFile+".tmp","w") as f:
+            json.dump(index,f,indent=1)
+        os.replace(indexFile+".tmp",indexFile)
+
+    @staticmethod
+    def _checkpointSeed(start):
+        """
+        ---stream hash of the start of a model: initializeNewModel with its units, newBlank or an opened file---
+        """
+        return hashlib.sha1(start.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _checkpointFileHash(FileName):
+        """
+        ---stream hash of a model opened from a file, from the content of the file---
+        """
+        digest=hashlib.sha1(b"file_OpenFile")
+        with open(FileName,"rb") as f:
+            for block in iter(lambda:f.read(1<<20),b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _checkpointNote(self,methodName,arguments):
+        """
+        ---add one followed call to the stream hash---
+        """
+        if not self._checkpoint["building"]:
+            self._checkpoint["hash"]=self._modelCallHash(self._checkpoint["hash"],methodName,arguments)
+
+    @staticmethod
+    def _modelCallHash(previousHash,methodName,arguments):
+        """
+        ---stream hash after one call: the previous hash, the function name and the arguments, numpy arrays by
+        their dtype, shape and content---
+        """
+        digest=hashlib.sha1(previousHash.encode("utf-8"))
+        digest.update(methodName.encode("utf-8"))
+
+        def feed(value):
+            if isinstance(value,np.ndarray):
+                digest.update(("array"+str(value.dtype)+str(value.shape)).encode("utf-8"))
+                digest.update(np.ascontiguousarray(value).tobytes())
+            elif isinstance(value,(list,tuple)):
+                digest.update(b"[")
+                for each in value:
+                    feed(each)
+                digest.update(b"]")
+            elif isinstance(value,dict):
+                digest.update(b"{")
+                for key in sorted(value,key=repr):
+                    feed(key)
+                    feed(value[key])
+                digest.update(b"}")
+            else:
+                if isinstance(value,np.generic):
+                    value=value.item()
+                digest.update((type(value).__name__+repr(value)+";").encode("utf-8"))
+
+        for key,value in arguments.items():
+            digest.update(key.encode("utf-8"))
+            feed(value)
+        return digest.hexdigest()
+
+    def file_journal_Start(self,FileName,Append=False):
+        """
+        ---This function starts recording the calls of the functions that modify the model (every function calling
+        a SAP2000 setter, adder, deleter or modifier, except the output selection and the run flags) into a binary
+        journal file, together with the model starts (initializeNewModel, newBlank, the file_New* templates and
+        file_OpenFile). Every record holds the function name and its full argument set; numpy arrays
+        and long numeric lists are stored as .npy payloads, the other arguments as JSON. The journal can be
+        replayed into a fresh session with file_journal_Replay, and cut, filtered and compared with
+        file_journal_Cut, file_journal_Filter and file_journal_Diff---
+        inputs:
+        FileName(str)-The full path of the journal file.
+        Append(bool)-If this item is True, the records are appended to an existing journal.
+        """
+        if self._journal is not None:
+            self.file_journal_Stop()
+        append=Append and os.path.exists(FileName) and os.path.getsize(FileName)>0
+        journalFile=open(FileName,"ab" if append else "wb")
+        if not append:
+            journalFile.write(self._journalMagic)
+        self._journal={"file":journalFile,"fileName":FileName,"records":0}
+        self._modelCallInstall()
+
+    def file_journal_Stop(self):
+        """
+        ---This function stops the journal and closes its file---
+        return:
+        records(int)-The number of records written since file_journal_Start.
+        """
+        if self._journal is None:
+            return 0
+        journal=self._journal
+        self._journal=None
+        journal["file"].close()
+        self._modelCallInstall()
+        return journal["records"]
+
+    def file_journal_Read(self,FileName):
+        """
+        ---This function reads the records of a journal file---
+        inputs:
+        FileName(str)-The full path of the journal file.
+        return:
+        records(list)-[{"function":str,"arguments":dict,"time":float},...], time in seconds since the epoch.
+        """
+        records=[]
+        with open(FileName,"rb") as f:
+            if f.read(len(self._journalMagic))!=self._journalMagic:
+                raise ValueError(FileName+" is not a SAP2000Py journal")
+            while True:
+                head=f.read(4)
+                if not head:
+                    break
+                if len(head)<4:
+                    raise ValueError("truncated journal record in "+FileName)
+                header=json.loads(f.read(int(np.frombuffer(head,dtype="<u4")[0])).decode("utf-8"))
+                payloads=[np.lib.format.read_array(f,allow_pickle=False) for each in range(header["n"])]
+                records.append({"function":header["f"],"arguments":self._journalDecode(header["a"],payloads),
+                                "time":header["t"]})
+        return records
+
+    def file_journal_Write(self,FileName,records):
+        """
+        ---This function writes records (e.g. from file_journal_Read) to a new journal file---
+        inputs:
+        FileName(str)-The full path of the journal file.
+        records(list)-[{"function":str,"arguments":dict,"time":float},...], time is optional.
+        """
+        with open(FileName,"wb") as f:
+            f.write(self._journalMagic)
+            for record in records:
+                self._journalWriteRecord(f,record["function"],record["arguments"],record.get("time",time.time()))
+
+    def file_journal_Cut(self,FileName,OutFileName,Start=0,Stop=None):
+        """
+        ---This function writes the records Start to Stop-1 of a journal to a new journal, e.g. the base of a
+        model without its last modifications. A cut that does not start with a model start must be replayed into
+        a model that already holds the records before Start---
+        inputs:
+        FileName(str)-The full path of the journal file.
+        OutFileName(str)-The full path of the new journal file.
+        Start,Stop(int)-The record range, as a python slice.
+        return:
+        records(int)-The number of written records.
+        """
+        records=self.file_journal_Read(FileName)[Start:Stop]
+        self.file_journal_Write(OutFileName,records)
+        return len(records)
+
+    def file_journal_Filter(self,FileName,OutFileName,Include=None,Exclude=None,Predicate=None):
+        """
+        ---This function writes the records of a journal whose function names match Include and do not match
+        Exclude (regular expressions, re.search) and for which Predicate(record) is True to a new journal, e.g.
+        Exclude="_SetLoad" keeps the model without its loads. The model starts are always kept---
+        inputs:
+        FileName(str)-The full path of the journal file.
+        OutFileName(str)-The full path of the new journal file.
+        Include,Exclude(str)-Regular expressions on the function names, None for no condition.
+        Predicate(function)-None, or a function of a record returning True for the kept records.
+        return:
+        records(int)-The number of written records.
+        """
+        kept=[]
+        for record in self.file_journal_Read(FileName):
+            if record["function"] not in self._journalStarts:
+                if Include is not None and not re.search(Include,record["function"]):
+                    continue
+                if Exclude is not None and re.search(Exclude,record["function"]):
+                    continue
+                if Predicate is not None and not Predicate(record):
+                    continue
+            kept.append(record)
+        self.file_journal_Write(OutFileName,kept)
+        return len(kept)
+
+    def file_journal_Diff(self,FileNameA,FileNameB):
+        """
+        ---This function compares two journals, e.g. of two versions of a model generator. Records are equal when
+        their function names and arguments are equal (numpy arrays by content), the times are ignored---
+        inputs:
+        FileNameA,FileNameB(str)-The full paths of the journal files.
+        return:
+        {"commonPrefix":int,"equal":int,"changes":[{"tag":str,"a":[int,int],"b":[int,int],"recordsA":list,
+         "recordsB":list},...]}
+        commonPrefix(int)-The number of equal leading records, the journal B can be replayed from a checkpoint of
+            this many records of A.
+        tag(str)-"replace", "delete" (only in A) or "insert" (only in B); a and b are the record ranges.
+        """
+        recordsA=self.file_journal_Read(FileNameA)
+        recordsB=self.file_journal_Read(FileNameB)
+        keysA=[self._modelCallHash("",each["function"],each["arguments"]) for each in recordsA]
+        keysB=[self._modelCallHash("",each["function"],each["arguments"]) for each in recordsB]
+        commonPrefix=0
+        while commonPrefix<min(len(keysA),len(keysB)) and keysA[commonPrefix]==keysB[commonPrefix]:
+            commonPrefix+=1
+        matcher=difflib.SequenceMatcher(None,keysA,keysB,autojunk=False)
+        changes=[]
+        equal=0
+        for tag,a0,a1,b0,b1 in matcher.get_opcodes():
+            if tag=="equal":
+                equal+=a1-a0
+                continue
+            changes.append({"tag":tag,"a":[a0,a1],"b":[b0,b1],"recordsA":recordsA[a0:a1],"recordsB":recordsB[b0:b1]})
+        return {"commonPrefix":commonPrefix,"equal":equal,"changes":changes}
+
+    def file_journal_Replay(self,FileName,Start=0,Stop=None,Bulk=True,Coalesce=True,progress=None):
+        """
+        ---This function rebuilds a model by applying the records of a journal to this instance, usually a fresh
+        session (initializeNewModel). initializeNewModel and newBlank records reinitialize the current model in
+        place, file_New* records create the template again, file_OpenFile records open the file. With Bulk, runs of consecutive assign_PointObj_SetRestraint
+        calls on single objects are applied with assign_PointObj_SetRestraintBulk, which uses one call per distinct
+        pattern for the point sets of restraint groups kept by earlier bulk calls; with Coalesce, the replay runs in a coalescing batch (coalesce_Begin), which is flushed before every record
+        that is not a coalescible setter, so the call order seen by SAP2000 is kept where it matters---
+        inputs:
+        FileName(str)-The full path of the journal file.
+        Start,Stop(int)-The record range, as a python slice.
+        Bulk(bool)-If this item is True, the bulk restraint path is used.
+        Coalesce(bool)-If this item is True, the setters are coalesced.
+        progress(function)-None, or progress(applied,total) called after every applied record.
+        return:
+        {"records":int,"applied":int}
+        applied(int)-The number of function calls made, smaller than records when bulk calls were used.
+        """
+        records=self.file_journal_Read(FileName)[Start:Stop]
+        coalescible=set(self._coalescibleSetters())
+        applied=0
+        count=0
+        if Coalesce:
+            self.coalesce_Begin()
+        try:
+            while count<len(records):
+                methodName,arguments=records[count]["function"],records[count]["arguments"]
+                end=count
+                while Bulk and end<len(records) and records[end]["function"]=="assign_PointObj_SetRestraint" and \
+                        records[end]["arguments"]["itemType"]==0:
+                    end+=1
+                if end-count>1:
+                    # the restraints replace the previous ones, the last call on a point wins
+                    restraints={}
+                    for each in records[count:end]:
+                        restraints[each["arguments"]["name"]]=each["arguments"]["value"]
+                    self.coalesce_Flush()
+                    self.assign_PointObj_SetRestraintBulk(list(restraints),np.array(list(restraints.values()),
+                                                          dtype=bool).reshape(-1,6),KeepGroups=False)
+                    count=end
+                else:
+                    if methodName not in coalescible:
+                        self.coalesce_Flush()
+                    if methodName in self._journalStarts:
+                        self._journalReplayStart(methodName,arguments)
+                    elif methodName in self._modelCallMethods():
+                        getattr(self,methodName)(**arguments)
+                    else:
+                        raise ValueError("not a journaled function: "+str(methodName))
+                    count+=1
+                applied+=1
+                if progress is not None:
+                    progress(count,len(records))
+        finally:
+            if Coalesce:
+                self.coalesce_End()
+        return {"records":len(records),"applied":applied}
+
+    _journalMagic=b"SAP2000PY-JOURNAL-1\n"
+    _journalStarts=("initializeNewModel","newBlank","file_OpenFile","file_New2DFrame","file_New3DFrame","file_NewWall",
+                    "file_NewSolidBlock")
+    # numeric lists from this length on are stored as .npy payloads
+    _journalListPayload=16
+
+    def _journalNote(self,methodName,arguments):
+        """
+        ---write one followed call (or model start) to the journal---
+        """
+        self._journalWriteRecord(self._journal["file"],methodName,arguments,time.time())
+        self._journal["records"]+=1
+
+    def _journalWriteRecord(self,f,methodName,arguments,recordTime):
+        """
+        ---one record: the length of the JSON header, the header {"f","a","n","t"} and n .npy payloads---
+        """
+        payloads=[]
+        header=json.dumps({"f":methodName,"a":self._journalEncode(arguments,payloads),"n":len(payloads),
+                           "t":recordTime},separators=(",",":")).encode("utf-8")
+        f.write(np.array([len(header)],dtype="<u4").tobytes())
+        f.write(header)
+        for each in payloads:
+            np.lib.format.write_array(f,each,allow_pickle=False)
+
+    def _journalEncode(self,value,payloads):
+        """
+        ---JSON form of an argument, arrays and long numeric lists are moved to payloads---
+        """
+        if isinstance(value,np.ndarray):
+            if value.dtype.hasobject:
+                return {"__tuple__":[self._journalEncode(each,payloads) for each in value.tolist()]}
+            payloads.append(np.ascontiguousarray(value))
+            return {"__array__":len(payloads)-1}
+        if isinstance(value,np.generic):
+            return value.item()
+        if isinstance(value,(list,tuple)):
+            kinds={type(each) for each in value}
+            if len(value)>=self._journalListPayload and len(kinds)==1 and kinds<={float,int,bool}:
+                payloads.append(np.array(value))
+                return {"__list__" if isinstance(value,list) else "__tupleArray__":len(payloads)-1}
+            items=[self._journalEncode(each,payloads) for each in value]
+            return items if isinstance(value,list) else {"__tuple__":items}
+        if isinstance(value,dict):
+            if all(isinstance(key,str) and not key.startswith("__") for key in value):
+                return {key:self._journalEncode(each,payloads) for key,each in value.items()}
+            return {"__dict__":[[self._journalEncode(key,payloads),self._journalEncode(each,payloads)]
+                                for key,each in value.items()]}
+        if value is None or isinstance(value,(bool,int,float,str)):
+            return value
+        raise TypeError("a "+type(value).__name__+" argument can not be journaled")
+
+    def _journalDecode(self,value,payloads):
+        """
+        ---argument from its JSON form and the payloads---
+        """
+        if isinstance(value,list):
+            return [self._journalDecode(each,payloads) for each in value]
+        if not isinstance(value,dict):
+            return value
+        if "__array__" in value:
+            return payloads[value["__array__"]]
+        if "__list__" in value:
+            return payloads[value["__list__"]].tolist()
+        if "__tupleArray__" in value:
+            return tuple(payloads[value["__tupleArray__"]].tolist())
+        if "__tuple__" in value:
+            return tuple(self._journalDecode(each,payloads) for each in value["__tuple__"])
+        if "__dict__" in value:
+            return {self._journalDecode(key,payloads):self._journalDecode(each,payloads)
+                    for key,each in value["__dict__"]}
+        return {key:self._journalDecode(each,payloads) for key,each in value.items()}
+
+    def _journalReplayStart(self,methodName,arguments):
+        """
+        ---apply a model start record to the current session---
+        """
+        if methodName=="file_OpenFile":
+            self.file_OpenFile(arguments["FileName"])
+        elif methodName=="newBlank":
+            self.newBlank()
+        elif methodName.startswith("file_New"):
+            getattr(self,methodName)(**arguments)
+        elif self.SapModel is None:
+            self.initializeNewModel(arguments["unitsTag"])
+        else:
+            self.SapModel.InitializeNewModel(arguments["unitsTag"])
+            self._resetModelCaches(self._checkpointSeed("initializeNewModel"+str(arguments["unitsTag"])),
+                                   (methodName,arguments))
+
+    def define_registry_Enable(self,AliasDuplicates=True):
+        """
+        ---This function enables the definition registry. While it is enabled, the definitions made with
+        define_material_AddMaterial, define_material_SetMatrial, define_material_SetMPIsotropic,
+        define_material_SetWeightAndMass, define_section_PropFrame_SetGeneral and define_section_Area_SetShell_1
+        are hashed over their full argument set, and
+        (1) a definition call whose arguments did not change since the last call for the same name is not sent to
+            SAP2000 again;
+        (2) with AliasDuplicates=True, a new material (AddMaterial), frame section (SetGeneral) or area section
+            (SetShell_1) whose definition is identical to an existing one is not created, its name becomes an alias
+            of the existing name and is resolved by the assign and define functions that take a property name.
+        A material alias used by a section (or a tendon or cable property) is first created as a real material, so
+        the section refers to the name given and does not follow a later modification of the identical material.
+        The registry only knows the definitions made through these functions in this session, it is cleared when a
+        model is initialized or opened.---
+        inputs:
+        AliasDuplicates(bool)-If this item is True, duplicate definitions are aliased instead of being created.
+        """
+        self._registry={"aliasDuplicates":AliasDuplicates,"definitions":{},"byHash":{},"aliases":{},
+                        "sent":0,"skipped":0}
+
+    def define_registry_Disable(self):
+        """
+        ---This function disables the definition registry. All aliases are first created as real definitions in
+        SAP2000, so that every name used so far remains valid without the registry---
+        """
+        if self._registry is None:
+            return
+        for kind,name in list(self._registry["aliases"]):
+            self._registryMaterialize(kind,name)
+        self._registry=None
+
+    def define_registry_Resolve(self,kind,name):
+        """
+        ---This function returns the name of the definition that is actually defined in SAP2000 for a name---
+        inputs:
+        kind(str)-"material","frameSection" or "areaSection"
+        name(str)-The name of a material or section.
+        return:
+        name(str)-The name of the existing identical definition if name is an alias, otherwise name itself.
+        """
+        if self._registry is None:
+            return name
+        return self._registry["aliases"].get((kind,name),name)
+
+    def define_registry_GetHash(self,kind,name):
+        """
+        ---This function returns the content hash of a registered material or section---
+        inputs:
+        kind(str)-"material","frameSection" or "areaSection"
+        name(str)-The name of a registered material or section, or of an alias.
+        return:
+        hash(str)-The SHA-1 hex digest of the full definition, None if the name is not registered.
+        """
+        if self._registry is None:
+            return None
+        entry=self._registry["definitions"].get((kind,self.define_registry_Resolve(kind,name)))
+        if entry is None:
+            return None
+        return entry["hash"]
 
+    def define_registry_GetHashMap(self,kind):
+        """
+        ---This function returns the reverse map from the content hash to the defined names---
+        inputs:
+        kind(str)-"material","frameSection" or "areaSection"
+        return:
+        hashMap(dict)-{hash:[name,...]}, the first name is the definition in SAP2000, the others are its aliases.
+        """
+        hashMap={}
+        if self._registry is None:
+            return hashMap
+        for (eachKind,name),entry in self._registry["definitions"].items():
+            if eachKind==kind and entry["hash"] is not None:
+                hashMap.setdefault(entry["hash"],[]).append(name)
+        for (eachKind,alias),canonical in self._registry["aliases"].items():
+            if eachKind==kind:
+                hashMap[self._registry["definitions"][(kind,canonical)]["hash"]].append(alias)
+        return hashMap
 
-    def define_material_SetSSCurve(self,matName,strainList,stressList):
+    def define_registry_GetStatistics(self):
+        """
+        ---This function returns the counters of the definition registry---
+        return:
+        {"sent":int,"skipped":int,"aliases":int}
+        sent(int)-The number of definitions sent to SAP2000.
+        skipped(int)-The number of definitions not sent because they were unchanged or aliased.
+        aliases(int)-The current number of aliases.
+        """
+        if self._registry is None:
+            return {"sent":0,"skipped":0,"aliases":0}
+        return {"sent":self._registry["sent"],"skipped":self._registry["skipped"],
+                "aliases":len(self._registry["aliases"])}
+
+    def _registryHash(self,kind,components):
+        """
+        ---content hash of a definition made of {component:repr(arguments)}---
+        """
+        return hashlib.sha1(repr((kind,sorted(components.items()))).encode("utf-8")).hexdigest()
+
+    def _registryDefine(self,kind,name,component,args,definer,fullDefinition=False,aliasable=False):
+        """
+        ---send one definition call through the registry. definer(name) makes the COM call(s) for a given name,
+        fullDefinition means the call resets the whole definition, aliasable means it also defines it completely---
+        """
+        registry=self._registry
+        if registry is None:
+            definer(name)
+            return
+        key=(kind,name)
+        argsKey=repr(args)
+        if key in registry["aliases"]:
+            canonicalEntry=registry["definitions"][(kind,registry["aliases"][key])]
+            if canonicalEntry["components"].get(component)==argsKey:
+                registry["skipped"]+=1
+                return
+            self._registryMaterialize(kind,name)
+        entry=registry["definitions"].get(key)
+        if entry is not None and entry["components"].get(component)==argsKey:
+            registry["skipped"]+=1
+            return
+        if fullDefinition or entry is None:
+            components={component:argsKey}
+            calls=[(component,definer)]
+        else:
+            components=dict(entry["components"])
+            components[component]=argsKey
+            calls=[each for each in entry["calls"] if each[0]!=component]+[(component,definer)]
+        newHash=self._registryHash(kind,components)
+        if aliasable and registry["aliasDuplicates"] and entry is None:
+            existing=[each for each in registry["byHash"].get((kind,newHash),[]) if each!=name]
+            if existing:
+                registry["aliases"][key]=existing[0]
+                registry["skipped"]+=1
+                return
+        if entry is not None:
+            self._registryRelease(kind,name)
+        definer(name)
+        registry["sent"]+=1
+        registry["definitions"][key]={"components":components,"calls":calls,"hash":newHash}
+        registry["byHash"].setdefault((kind,newHash),[]).append(name)
+
+    def _registryRelease(self,kind,name):
+        """
+        ---remove a definition from the hash map before it changes, its aliases keep the old definition---
+        """
+        registry=self._registry
+        entry=registry["definitions"][(kind,name)]
+        sameHash=registry["byHash"].get((kind,entry["hash"]),[])
+        if name in sameHash:
+            sameHash.remove(name)
+        aliases=[alias for (eachKind,alias),canonical in registry["aliases"].items()
+                 if eachKind==kind and canonical==name]
+        if aliases:
+            for alias in aliases:
+                del registry["aliases"][(kind,alias)]
+            for component,definer in entry["calls"]:
+                definer(aliases[0])
+                registry["sent"]+=1
+            registry["definitions"][(kind,aliases[0])]=dict(entry)
+            sameHash.append(aliases[0])
+            for alias in aliases[1:]:
+                registry["aliases"][(kind,alias)]=aliases[0]
+
+    def _registryMaterialize(self,kind,name):
+        """
+        ---turn an alias into a real definition in SAP2000, e.g. before it is modified or when leaving the registry---
+        """
+        registry=self._registry
+        if registry is None or (kind,name) not in registry["aliases"]:
+            return name
+        canonicalEntry=registry["definitions"][(kind,registry["aliases"].pop((kind,name)))]
+        for component,definer in canonicalEntry["calls"]:
+            definer(name)
+            registry["sent"]+=1
+        registry["definitions"][(kind,name)]=dict(canonicalEntry)
+        registry["byHash"][(kind,canonicalEntry["hash"])].append(name)
+        return name
+
+    def _registryTouch(self,kind,name):
+        """
+        ---a definition is modified by a function the registry does not hash: make it real and forget its hash---
+        """
+        registry=self._registry
+        if registry is None:
+            return
+        self._registryMaterialize(kind,name)
+        entry=registry["definitions"].get((kind,name))
+        if entry is not None:
+            self._registryRelease(kind,name)
+            del registry["definitions"][(kind,name)]
+
+    def define_curve_Simplify(self,curves,Tolerance,EnergyTolerance=None,KeepExtrema=True):
+        """
+        ---This function simplifies many piecewise linear curves (stress-strain curves, link force-deformation
+        curves) at once with a Douglas-Peucker split on the vertical (stress/force) error. The first, last and zero
+        strain points, and with KeepExtrema the local peaks and valleys, are always kept. The kept points are a
+        subset of the original points, so monotonic parts stay monotonic and the sign of the stress follows the
+        sign of the strain as in the original curve---
+        inputs:
+        curves(list)-[(xList,yList),...], x (strain or deformation) must increase monotonically.
+        Tolerance(float)-The maximum stress/force difference between a removed point and the simplified curve.
+        EnergyTolerance(float)-If not None, the maximum relative error of the area under the curve, each span of
+            the simplified curve gets the share of EnergyTolerance*(area under |y|) given by its x length.
+        KeepExtrema(bool)-If True, the points where the slope changes sign are always kept.
+        return:
+        [simplifiedCurves,reports]
+        simplifiedCurves(list)-[(xArray,yArray),...]
+        reports(list)-[{"points":int,"kept":int,"reduction":float,"maxError":float,"energyError":float},...]
+            reduction is the ratio of removed points, energyError the area error over the area under |y|.
+        """
+        lengths=np.array([len(x) for x,y in curves],dtype=int)
+        if (lengths<2).any():
+            raise ValueError("every curve needs at least two points")
+        x=np.concatenate([np.asarray(each[0],dtype=float) for each in curves])
+        y=np.concatenate([np.asarray(each[1],dtype=float) for each in curves])
+        if len(x)!=len(y) or any(len(np.atleast_1d(each[1]))!=length for each,length in zip(curves,lengths)):
+            raise ValueError("x and y of a curve must have the same length")
+        starts=np.concatenate([[0],np.cumsum(lengths)[:-1]])
+        ends=starts+lengths-1
+        curveOf=np.repeat(np.arange(len(curves)),lengths)
+        numPoints=len(x)
+        inside=np.ones(numPoints,dtype=bool)
+        inside[ends]=False
+        dx=np.diff(x)
+        if (dx[inside[:-1]]<=0).any():
+            raise ValueError("curve x values must increase monotonically")
+        keep=np.zeros(numPoints,dtype=bool)
+        keep[starts]=True
+        keep[ends]=True
+        keep[x==0]=True
+        dy=np.diff(y)
+        if KeepExtrema:
+            turn=np.zeros(numPoints,dtype=bool)
+            turn[1:-1]=(np.sign(dy[:-1])*np.sign(dy[1:])<0)&inside[:-2]&inside[1:-1]
+            keep|=turn
+        area=np.concatenate([[0.0],np.cumsum(np.where(inside[:-1],0.5*(y[:-1]+y[1:])*dx,0.0))])
+        absArea=np.concatenate([[0.0],np.cumsum(np.where(inside[:-1],0.5*(np.abs(y[:-1])+np.abs(y[1:]))*dx,0.0))])
+        totalEnergy=absArea[ends]-absArea[starts]
+        span=x[ends]-x[starts]
+        index=np.arange(numPoints)
+        while True:
+            previous=np.maximum.accumulate(np.where(keep,index,0))
+            following=np.minimum.accumulate(np.where(keep,index,numPoints-1)[::-1])[::-1]
+            ratio=(x-x[previous])/np.where(keep,1.0,x[following]-x[previous])
+            error=np.where(keep,0.0,np.abs(y-(y[previous]+ratio*(y[following]-y[previous]))))
+            segmentMax=np.zeros(numPoints)
+            np.maximum.at(segmentMax,previous,error)
+            split=segmentMax>Tolerance
+            if EnergyTolerance is not None:
+                # the span of a kept point ends at the next kept point
+                nextKept=np.where(keep&inside,np.append(following[1:],numPoints-1),index)
+                chord=0.5*(y+y[nextKept])*(x[nextKept]-x)
+                energyError=np.abs(area[nextKept]-area-chord)
+                split|=keep&inside&(segmentMax>0)&(energyError>EnergyTolerance*totalEnergy[curveOf]*
+                                                    (x[nextKept]-x)/span[curveOf])
+            candidates=np.flatnonzero((~keep)&split[previous]&(error==segmentMax[previous]))
+            if len(candidates)==0:
+                break
+            _,first=np.unique(previous[candidates],return_index=True)
+            keep[candidates[first]]=True
+        keptCount=np.bincount(curveOf[keep],minlength=len(curves))
+        maxError=np.zeros(len(curves))
+        np.maximum.at(maxError,curveOf,error)
+        following=np.minimum.accumulate(np.where(keep,index,numPoints-1)[::-1])[::-1]
+        nextKept=np.where(keep&inside,np.append(following[1:],numPoints-1),index)
+        chord=0.5*(y+y[nextKept])*(x[nextKept]-x)
+        spanError=np.where(keep&inside,np.abs(area[nextKept]-area-chord),0.0)
+        energyError=np.bincount(curveOf,weights=spanError,minlength=len(curves))/np.where(totalEnergy>0,totalEnergy,1.0)
+        split=np.cumsum(keptCount)[:-1]
+        simplifiedCurves=list(zip(np.split(x[keep],split),np.split(y[keep],split)))
+        reports=[{"points":int(numPoint),"kept":int(kept),"reduction":float(1.0-kept/numPoint),"maxError":float(eachError),
+                  "energyError":float(eachEnergy)} for numPoint,kept,eachError,eachEnergy in
+                 zip(lengths,keptCount,maxError,energyError)]
+        return [simplifiedCurves,reports]
+
+    def define_material_SetSSCurve(self,matName,strainList,stressList,Tolerance=None):
         """
         ---sets the material stress-strain curve for existing material ---
         inputs:
@@ -261,9 +1192,15 @@ class SAP2000Py():
         Points that have a negative strain must have a zero or negative stress. Similarly,
         points that have a positive strain must have a zero or positive stress.
         There must be one point defined that has zero strain and zero stress.
+        Tolerance(float)-If not None, the curve is first simplified by define_curve_Simplify with this stress
+            tolerance. [F/L2]
         """
+        if Tolerance is not None:
+            (strainList,stressList),=self.define_curve_Simplify([(strainList,stressList)],Tolerance)[0]
+            strainList,stressList=strainList.tolist(),stressList.tolist()
         numPoint=len(strainList)
         pointID=[i1 for i1 in range(numPoint)]
+        self._registryTouch("material",matName)
         self.SapModel.PropMaterial.SetSSCurve(matName,numPoint,pointID,strainList,stressList)
 
     def define_material_TendonUser(self,tendonName,weightPerV,E,temC):
@@ -292,10 +1229,12 @@ class SAP2000Py():
                     --370--,--420--,--460--,--500--,--550--,--620--,--690--]
                     For China Concrete JTG--["JTG D62-2004 C15",--20--,--25--,--30--,...,--80--]
         """
-        self.SapModel.PropMaterial.AddMaterial(name,matType,region,standard,grade)
-        str_list = grade.split(" ")
-        nameList=standard+"-"+str_list[-1]
-        self.SapModel.PropMaterial.ChangeName(nameList,name)
+        def addMaterial(name):
+            self.SapModel.PropMaterial.AddMaterial(name,matType,region,standard,grade)
+            str_list = grade.split(" ")
+            nameList=standard+"-"+str_list[-1]
+            self.SapModel.PropMaterial.ChangeName(nameList,name)
+        self._registryDefine("material",name,"AddMaterial",(matType,region,standard,grade),addMaterial,True,True)
 
     def define_material_GetMPIsotropic(self,matName):
         """
@@ -311,6 +1250,7 @@ class SAP2000Py():
                 G-The shear modulus. For isotropic materials this value is program calculated
                   from the modulus of elasticity and poisson’s ratio. [F/L2]
         """
+        matName=self.define_registry_Resolve("material",matName)
         weightAndMass=self.SapModel.PropMaterial.GetWeightAndMass(matName)[1:]
         isoProperty=self.SapModel.PropMaterial.GetMPIsotropic(matName)[1:]
         weightPerV,massPerV=weightAndMass
@@ -327,7 +1267,8 @@ class SAP2000Py():
                 eMatType_Steel = 1,eMatType_Concrete = 2,eMatType_NoDesign = 3
                 eMatType_Aluminum = 4,eMatType_ColdFormed = 5,eMatType_Rebar = 6,eMatType_Tendon = 7
         """
-        self.SapModel.PropMaterial.SetMaterial(matName,matType)
+        self._registryDefine("material",matName,"SetMaterial",(matType,),
+                             lambda name:self.SapModel.PropMaterial.SetMaterial(name,matType),True)
 
     def define_material_SetWeightAndMass(self,matName,weightPerV):
         """
@@ -337,7 +1278,8 @@ class SAP2000Py():
                 weightPerV(float)-This is the weight per unit volume,[F/L3]
         """
         # 1 = Weight per unit volume is specified,2 = Mass per unit volume is specified
-        self.SapModel.PropMaterial.SetWeightAndMass(matName, 1,weightPerV)
+        self._registryDefine("material",matName,"SetWeightAndMass",(weightPerV,),
+                             lambda name:self.SapModel.PropMaterial.SetWeightAndMass(name,1,weightPerV))
 
     def define_material_SetMPIsotropic(self,matName,E,v,temC):
         """
@@ -348,7 +1290,8 @@ class SAP2000Py():
                 v(float)-Poisson’s ratio.
                 tempC(float)-The thermal coefficient. [1/T]
         """
-        self.SapModel.PropMaterial.SetMPIsotropic(matName,E,v,temC)
+        self._registryDefine("material",matName,"SetMPIsotropic",(E,v,temC),
+                             lambda name:self.SapModel.PropMaterial.SetMPIsotropic(name,E,v,temC))
 
     def define_material_SetOSteel_1(self,matName,Fy,Fu,eFy,eFu,SSType,SSHysType=0,StrainAtHardening=0,
                                     StrainAtMaxStress=0,StrainAtRupture=0,FinalSlope=0):
@@ -375,6 +1318,7 @@ class SAP2000Py():
                             the material modulus of elasticity, E. This value multiplied times E gives the final
                             slope of the curve.
         """
+        self._registryTouch("material",matName)
         self.SapModel.PropMaterial.SetOSteel_1(matName, Fy,Fu,eFy,eFu,SSType,SSHysType,StrainAtHardening,
                                     StrainAtMaxStress,StrainAtRupture,FinalSlope)
 
@@ -401,6 +1345,7 @@ class SAP2000Py():
         FrictionAngle(float)-The Drucker-Prager friction angle, 0 <= FrictionAngle < 90. [deg]
         DilatationalAngle(float)-The Drucker-Prager dilatational angle, 0 <= DilatationalAngle < 90. [deg]
         """
+        self._registryTouch("material",matName)
         self.SapModel.PropMaterial.SetOConcrete_1(matName,fc,IsLightweight,fcsfactor,SSType,SSHysType,StrainAtfc,
                                        StrainUltimate,FinalSlope,FrictionAngle,DilatationalAngle)
 
@@ -428,6 +1373,7 @@ class SAP2000Py():
         UseCaltransSSDefaults(bool)-If this item is True, the program uses Caltrans default controlling strain
             values, which are bar size dependent.
         """
+        self._registryTouch("material",matName)
         self.SapModel.PropMaterial.SetORebar_1(matName,Fy,Fu,eFy,eFu,SSType,SSHysType,StrainAtHardening,
                                     StrainUltimate,FinalSlope,UseCaltransSSDefaults)
 
@@ -445,6 +1391,7 @@ class SAP2000Py():
         FinalSlope(float)-This item applies only to parametric stress-strain curves. It is a multiplier
             on the material modulus of elasticity, E. This value multiplied times E gives the final slope of the curve.
         """
+        self._registryTouch("material",matName)
         self.SapModel.PropMaterial.SetOTendon_1(matName,Fy,Fu,SSType,SSHysType,FinalSlope)
 
     def define_section_PropFrame_SetGeneral(self,sectName,matName,Area,As2,As3,I22,I33,J):
@@ -460,7 +1407,209 @@ class SAP2000Py():
         I33(float)-The moment of inertia for bending about the local 3 axis. [L4]
         J(float)-The torsional constant. [L4]
         """
-        self.SapModel.PropFrame.SetGeneral(sectName,matName,1,1,Area,As2,As3,J,I22,I33,1,1,1,1,1,1)
+        matName=self._registryMaterialize("material",matName)
+        self._registryDefine("frameSection",sectName,"SetGeneral",(matName,Area,As2,As3,I22,I33,J),
+                             lambda name:self.SapModel.PropFrame.SetGeneral(name,matName,1,1,Area,As2,As3,J,I22,I33,
+                                                                            1,1,1,1,1,1),True,True)
+
+    def define_section_PolygonProperties(self,sections,Resolution=100):
+        """
+        ---This function computes the properties of many polygonal cross sections with holes in vectorized form.
+        The polygon x axis is the section local 3 axis (width) and the y axis is the section local 2 axis (depth).
+        Area, centroid and second moments are exact for the polygons. The numerical torsion constant solves the
+        Prandtl stress function on a grid of Resolution cells along the longer side (constant stress function in
+        every hole), the shear areas follow from the Jourawski shear flow on the same grid. The results are cached
+        by the hash of the geometry and Resolution, repeated sections are only computed once---
+        inputs:
+        sections(list)-[[outerRing,holeRing1,...],...], each ring is a list or array of (x,y) vertices, in any
+            orientation and without repeating the first vertex. [L]
+        Resolution(int)-The number of grid cells along the longer side of a section, thin walls should be at least
+            four or five cells thick for J and the shear areas.
+        return:
+        props(dict)-{"A","xc","yc","I22","I33","I23","J","JThinWalled","As2","As3","hash"}, every item is an array
+            with one value per section ("hash" is a list).
+            A(float)-The area. [L2]
+            xc,yc(float)-The centroid. [L]
+            I22,I33(float)-The moments of inertia about the local 2 (vertical) and local 3 (horizontal) axes through
+                the centroid. [L4]
+            I23(float)-The product of inertia, SAP2000 general sections assume it is zero. [L4]
+            J(float)-The numerical torsion constant. [L4]
+            JThinWalled(float)-The closed-form estimate, Bredt's formula of a single cell with uniform thickness
+                for a section with holes, A^4/(4*pi^2*Ip) for a solid section. [L4]
+            As2,As3(float)-The shear areas for forces in the local 2 and 3 directions. [L2]
+        """
+        hashes=[self._sectionHash(each,Resolution) for each in sections]
+        missing={}
+        for each,eachHash in zip(sections,hashes):
+            if eachHash not in self._sectionCache and eachHash not in missing:
+                missing[eachHash]=each
+        if missing:
+            computed=self._sectionCompute(list(missing.values()),Resolution)
+            for index,eachHash in enumerate(missing):
+                self._sectionCache[eachHash]={key:float(value[index]) for key,value in computed.items()}
+        props={key:np.array([self._sectionCache[each][key] for each in hashes]) for key in
+               ("A","xc","yc","I22","I33","I23","J","JThinWalled","As2","As3")}
+        props["hash"]=hashes
+        return props
+
+    def define_section_PropFrame_SetGeneralBulk(self,names,matName,sections,Resolution=100,Torsion="numerical"):
+        """
+        ---This function computes polygonal sections with define_section_PolygonProperties and defines them as
+        general frame sections, e.g. the variable depth sections of a segmental box girder---
+        inputs:
+        names(list)-The names of the frame sections.
+        matName(str or list)-The material of all sections, or one material per section.
+        sections(list)-See define_section_PolygonProperties.
+        Resolution(int)-See define_section_PolygonProperties.
+        Torsion(str)-"numerical" or "thinWalled", the torsion constant sent to SAP2000.
+        return:
+        props(dict)-See define_section_PolygonProperties.
+        """
+        if len(names)!=len(sections):
+            raise ValueError("names and sections must have the same length")
+        if Torsion not in ("numerical","thinWalled"):
+            raise ValueError("Torsion must be numerical or thinWalled")
+        props=self.define_section_PolygonProperties(sections,Resolution)
+        matNames=[matName]*len(names) if isinstance(matName,str) else list(matName)
+        J=props["J"] if Torsion=="numerical" else props["JThinWalled"]
+        for index,name in enumerate(names):
+            self.define_section_PropFrame_SetGeneral(name,matNames[index],float(props["A"][index]),
+                                                     float(props["As2"][index]),float(props["As3"][index]),
+                                                     float(props["I22"][index]),float(props["I33"][index]),
+                                                     float(J[index]))
+        return props
+
+    def _sectionHash(self,rings,Resolution):
+        """
+        ---hash of the section geometry, rounded so that float noise does not defeat the cache---
+        """
+        digest=hashlib.sha1(str(Resolution).encode("utf-8"))
+        for each in rings:
+            digest.update(np.round(np.asarray(each,dtype=float),10).tobytes()+b"|")
+        return digest.hexdigest()
+
+    def _sectionCompute(self,sections,Resolution):
+        """
+        ---exact polygon integrals for all sections at once, then the grid based torsion and shear areas---
+        """
+        numSections=len(sections)
+        rings=[np.asarray(ring,dtype=float) for each in sections for ring in each]
+        sectionOf=np.repeat(np.arange(numSections),[len(each) for each in sections])
+        isOuter=np.concatenate([[True]+[False]*(len(each)-1) for each in sections])
+        x=np.concatenate([each[:,0] for each in rings])
+        y=np.concatenate([each[:,1] for each in rings])
+        ringOf=np.repeat(np.arange(len(rings)),[len(each) for each in rings])
+        following=np.arange(len(x))+1
+        ringEnds=np.cumsum([len(each) for each in rings])
+        following[ringEnds-1]=ringEnds-np.array([len(each) for each in rings])
+        xj,yj=x[following],y[following]
+        cross=x*yj-xj*y
+        signedArea=np.bincount(ringOf,weights=cross/2.0,minlength=len(rings))
+        ringSign=np.where(isOuter,1.0,-1.0)*np.sign(signedArea)
+        cross=cross*ringSign[ringOf]
+        edgeSection=sectionOf[ringOf]
+        total=lambda values:np.bincount(edgeSection,weights=values*cross,minlength=numSections)
+        A=total(np.full(len(x),0.5))
+        xc=total((x+xj)/6.0)/A
+        yc=total((y+yj)/6.0)/A
+        I33=total((y*y+y*yj+yj*yj)/12.0)-A*yc**2
+        I22=total((x*x+x*xj+xj*xj)/12.0)-A*xc**2
+        I23=total((x*yj+2*x*y+2*xj*yj+xj*y)/24.0)-A*xc*yc
+        perimeter=np.bincount(ringOf,weights=np.hypot(xj-x,yj-y),minlength=len(rings))
+        ringArea=np.abs(signedArea)
+        hasHoles=np.bincount(sectionOf,weights=~isOuter,minlength=numSections)>0
+        enclosed=0.5*np.bincount(sectionOf,weights=ringArea,minlength=numSections)
+        midline=0.5*np.bincount(sectionOf,weights=perimeter,minlength=numSections)
+        with np.errstate(divide="ignore",invalid="ignore"):
+            JThinWalled=np.where(hasHoles,4.0*enclosed**2*A/midline**2,A**4/(4.0*math.pi**2*(I22+I33)))
+        J,As2,As3=self._sectionGridSolve(sections,Resolution)
+        return {"A":A,"xc":xc,"yc":yc,"I22":I22,"I33":I33,"I23":I23,"J":J,"JThinWalled":JThinWalled,
+                "As2":As2,"As3":As3}
+
+    def _sectionGridSolve(self,sections,Resolution):
+        """
+        ---rasterize all sections on one padded grid stack and solve the Prandtl stress function of all of them
+        with one batched conjugate gradient, holes are single unknowns and the zero boundary value is mirrored
+        to the cell faces---
+        """
+        numSections=len(sections)
+        outers=[np.asarray(each[0],dtype=float) for each in sections]
+        lower=np.array([each.min(axis=0) for each in outers])
+        size=np.array([each.max(axis=0) for each in outers])-lower
+        h=size.max(axis=1)/Resolution
+        counts=np.maximum(np.ceil(size/h[:,None]-1e-9).astype(int),1)
+        NX,NY=counts[:,0].max()+2,counts[:,1].max()+2
+        label=np.full((numSections,NY,NX),-2,dtype=int)
+        for index,each in enumerate(sections):
+            nx,ny=counts[index]
+            gridX,gridY=np.meshgrid(lower[index,0]+(np.arange(nx)+0.5)*h[index],
+                                    lower[index,1]+(np.arange(ny)+0.5)*h[index])
+            centers=np.column_stack((gridX.ravel(),gridY.ravel()))
+            cellLabel=np.where(self._areaPointsInPolygon(centers,outers[index],0.0,False),-1,-2)
+            for holeIndex,hole in enumerate(each[1:]):
+                inHole=self._areaPointsInPolygon(centers,np.asarray(hole,dtype=float),0.0,False)
+                cellLabel[inHole&(cellLabel==-1)]=holeIndex
+            label[index,1:ny+1,1:nx+1]=cellLabel.reshape(ny,nx)
+        material=label==-1
+        domain=label>-2
+        cellSection=np.broadcast_to(np.arange(numSections)[:,None,None],label.shape)[domain]
+        holeKey=np.where(label>=0,label,0)+np.arange(numSections)[:,None,None]*(label.max()+1)
+        holeUnique,holeDof=np.unique(holeKey[label>=0],return_inverse=True)
+        dof=np.full(label.shape,-1,dtype=int)
+        dof[material]=np.arange(material.sum())
+        dof[label>=0]=material.sum()+holeDof.ravel()
+        dofFlat=dof[domain]
+        numDof=material.sum()+len(holeUnique)
+        dofSection=np.zeros(numDof,dtype=int)
+        dofSection[dofFlat]=cellSection
+        weight=np.bincount(dofFlat,minlength=numDof).astype(float)
+        b=2.0*h[dofSection]**2*weight
+        outside=(~domain).astype(float)
+        diagonal=4.0+np.roll(outside,1,1)+np.roll(outside,-1,1)+np.roll(outside,1,2)+np.roll(outside,-1,2)
+
+        def apply(u):
+            field=np.zeros(label.shape)
+            field[domain]=u[dofFlat]
+            laplace=diagonal*field-np.roll(field,1,1)-np.roll(field,-1,1)-np.roll(field,1,2)-np.roll(field,-1,2)
+            return np.bincount(dofFlat,weights=laplace[domain],minlength=numDof)
+
+        sectionSum=lambda values:np.bincount(dofSection,weights=values,minlength=numSections)
+        u=np.zeros(numDof)
+        r=b.copy()
+        p=r.copy()
+        rr=sectionSum(r*r)
+        limit=1e-20*sectionSum(b*b)
+        for iteration in range(20*Resolution):
+            active=rr>limit
+            if not active.any():
+                break
+            Kp=apply(p)
+            pKp=sectionSum(p*Kp)
+            alpha=np.where(active&(pKp>0),rr/np.where(pKp>0,pKp,1.0),0.0)
+            u+=alpha[dofSection]*p
+            r-=alpha[dofSection]*Kp
+            rrNew=sectionSum(r*r)
+            beta=np.where(active,rrNew/np.where(rr>0,rr,1.0),0.0)
+            p=r+beta[dofSection]*p
+            rr=rrNew
+        J=2.0*h**2*np.bincount(cellSection,weights=u[dofFlat],minlength=numSections)
+        As2=self._sectionShearArea(material.sum(axis=2)*h[:,None],h,lower[:,1])
+        As3=self._sectionShearArea(material.sum(axis=1)*h[:,None],h,lower[:,0])
+        return J,As2,As3
+
+    def _sectionShearArea(self,width,h,lower):
+        """
+        ---shear area I^2/integral(Q^2/b) from the material width of every grid strip---
+        """
+        coordinate=lower[:,None]+(np.arange(width.shape[1])-0.5)*h[:,None]
+        stripArea=width*h[:,None]
+        center=(stripArea*coordinate).sum(axis=1)/stripArea.sum(axis=1)
+        offset=coordinate-center[:,None]
+        moment=((offset**2+h[:,None]**2/12.0)*stripArea).sum(axis=1)
+        firstMoment=np.cumsum(offset*stripArea,axis=1)-0.5*offset*stripArea
+        with np.errstate(divide="ignore",invalid="ignore"):
+            energy=np.where(width>0,firstMoment**2/width,0.0).sum(axis=1)*h
+        return moment**2/energy
 
     def define_section_Tendon_SetProp(self,tendonName,matName,modelOpt,Area):
         """
@@ -471,6 +1620,7 @@ class SAP2000Py():
         modelOpt-1 = Model tendon as loads,2 = Model tendon as elements
         area-The cross-sectional area of the tendon. [L2]
         """
+        matName=self._registryMaterialize("material",matName)
         self.SapModel.PropTendon.SetProp(tendonName,matName,modelOpt,Area)
 
     def define_section_Cable_SetPro(self,cableName,matName,Area):
@@ -481,6 +1631,7 @@ class SAP2000Py():
         matName(str)-The name of the material property assigned to the cable property
         Area(float)-The cross-sectional area of the tendon. [L2]
         """
+        matName=self._registryMaterialize("material",matName)
         self.SapModel.PropCable.SetProp(cableName,matName,Area)
 
     def define_section_Area_SetPlane(self,areaName,MyType,MatProp,Thickness,MatAng=0,Incompatible=True):
@@ -497,6 +1648,7 @@ class SAP2000Py():
         Incompatible(bool)-If this item is True, incompatible bending modes are included in the stiffness
             formulation. In general, incompatible modes significantly improve the bending behavior of the object.
         """
+        MatProp=self._registryMaterialize("material",MatProp)
         self.SapModel.PropArea.SetPlane(areaName,MyType,MatProp,MatAng,Thickness,Incompatible)
 
     def define_section_Area_SetShell_1(self,name,ShellType,MatProp,Thickness,matAng=0):
@@ -513,7 +1665,10 @@ class SAP2000Py():
         Thickness(float)-The membrane thickness. [L],This item does not apply when ShellType = 6.
         matAng(float)-The material angle. [deg] This item does not apply when ShellType = 6.
         """
-        self.SapModel.PropArea.SetShell_1(name,ShellType,False,MatProp,matAng,Thickness,Thickness)
+        MatProp=self._registryMaterialize("material",MatProp)
+        self._registryDefine("areaSection",name,"SetShell_1",(ShellType,MatProp,Thickness,matAng),
+                             lambda name:self.SapModel.PropArea.SetShell_1(name,ShellType,False,MatProp,matAng,
+                                                                           Thickness,Thickness),True,True)
 
     def define_section_PropSolid_SetProp(self,name,matProp,a=0,b=0,c=0,incompatible=True):
         """
@@ -526,6 +1681,7 @@ class SAP2000Py():
         incompatible(bool)-If this item is True, incompatible bending modes are included in the stiffness
             formulation. In general, incompatible modes significantly improve the bending behavior of the object.
         """
+        matProp=self._registryMaterialize("material",matProp)
         self.SapModel.PropSolid.SetProp(name,matProp,a,b,c,incompatible)
 
     def define_section_PropLink_SetLinear(self,name,DOF,Fixed,Ke={},Ce={},dj2=0,dj3=0,KeCoupled=False,CeCoupled=False):
@@ -636,7 +1792,7 @@ class SAP2000Py():
         self.SapModel.PropLink.SetMultiLinearElastic(name,DOFFinal,FixedFinal,nonlinearFinal,keInput,ceInput,dj2,dj3)
 
     def define_section_PropLink_SetMultiLinearPoints(self,name,DOF,forceList,dispList,myType=0,
-                                                     a1=0,a2=0,b1=0,b2=0,eta=0):
+                                                     a1=0,a2=0,b1=0,b2=0,eta=0,Tolerance=None):
         """
         ---This function sets the force-deformation data for a specified degree of freedom in multilinear
         elastic and multilinear plastic link properties.---
@@ -652,7 +1808,12 @@ class SAP2000Py():
             the hysteresis type.0=Isotropic,1 = Kinematic,2 = Takeda,3 = Pivot
         a1,a2,b1,b2,eta(float)-This item applies only to multilinear plastic link properties that have a pivot
         hysteresis type (MyType = 3).
+        Tolerance(float)-If not None, the curve is first simplified by define_curve_Simplify with this force
+            tolerance. [F] if DOF <= 3, and [FL} if DOF > 3
         """
+        if Tolerance is not None:
+            (dispList,forceList),=self.define_curve_Simplify([(dispList,forceList)],Tolerance)[0]
+            dispList,forceList=dispList.tolist(),forceList.tolist()
         numberPoints=len(forceList)
         self.SapModel.PropLink.SetMultiLinearPoints(name,DOF,numberPoints,forceList,dispList,myType,
                                                     a1,a2,b1,b2,eta)
@@ -1181,6 +2342,358 @@ class SAP2000Py():
         """
         self.SapModel.PropLink.SetWeightAndMass(name,w,mass,R1,R2,R3)
 
+    _linkPropertyFields={"Linear":("Ke","Ce"),
+                         "MultiLinearElastic":("Ke","Ce"),
+                         "MultiLinearPlastic":("Ke","Ce"),
+                         "Damper":("Ke","Ce","k","c","cexp"),
+                         "DamperBilinear":("Ke","Ce","k","c","cy","ForceLimit"),
+                         "Gap":("Ke","Ce","k","disp"),
+                         "Hook":("Ke","Ce","k","disp"),
+                         "PlasticWen":("Ke","Ce","k","yieldF","Ratio","exp"),
+                         "RubberIsolator":("Ke","Ce","k","yieldF","Ratio"),
+                         "FrictionIsolator":("Ke","Ce","k","slow","fast","Rate","Radius")}
+    _linkDOFNames=("U1","U2","U3","R1","R2","R3")
+    _linkCoupledNames=("U1U1","U1U2","U2U2","U1U3","U2U3","U3U3","U1R1","U2R1","U3R1","R1R1","U1R2","U2R2",
+                       "U3R2","R1R2","R2R2","U1R3","U2R3","U3R3","R1R3","R2R3","R3R3")
+
+    def define_section_PropLink_GetDtype(self,linkType,nameLength=32,KeCoupled=False,CeCoupled=False):
+        """
+        ---This function returns the numpy structured dtype accepted by define_section_PropLink_SetBulk for
+        a link type, e.g. props=np.zeros(1000,dtype=sapPyInstance.define_section_PropLink_GetDtype("RubberIsolator"))---
+        inputs:
+        linkType(str)-"Linear","MultiLinearElastic","MultiLinearPlastic","Damper","DamperBilinear","Gap","Hook",
+            "PlasticWen","RubberIsolator" or "FrictionIsolator"
+        nameLength(int)-The maximum length of the link property names.
+        KeCoupled,CeCoupled(bool)-Only for the Linear type, True for 21 coupled stiffness/damping terms.
+        return:
+        dtype(numpy.dtype)-Fields "name","DOF","Fixed",("Nonlinear"),"Ke","Ce",the six-term fields of the link
+            type (with the same names as the arguments of the single property function),("damping"),"dj2","dj3".
+        """
+        fields=self._linkPropertyFields[linkType]
+        dtype=[("name","U%d"%nameLength),("DOF",bool,(6,)),("Fixed",bool,(6,))]
+        if linkType!="Linear":
+            dtype.append(("Nonlinear",bool,(6,)))
+        for each in fields:
+            coupled=(each=="Ke" and KeCoupled) or (each=="Ce" and CeCoupled)
+            dtype.append((each,float,(21 if coupled else 6,)))
+        if linkType=="FrictionIsolator":
+            dtype.append(("damping",float))
+        dtype+=[("dj2",float),("dj3",float)]
+        return np.dtype(dtype)
+
+    def define_section_PropLink_Compile(self,linkType,props):
+        """
+        ---This function packs and validates many link properties of one type in vectorized form, and returns the
+        argument tuples of the PropLink.Set<linkType> calls---
+        inputs:
+        linkType(str)-See define_section_PropLink_GetDtype.
+        props(numpy structured array or dict)-One record per link property. A dict maps each field to an array
+            with one row per property, a single row broadcast to all properties, or for "DOF","Fixed","Nonlinear"
+            a list of DOF name lists (e.g. [["U1","U2"],["U2"]]). The six-term fields may also be dicts of DOF
+            name to a column (e.g. {"U2":kArray}) and Ke/Ce of the Linear type dicts of coupled terms
+            (e.g. {"U1U1":k11,"U1U2":k12}). Missing fields are zero/False.
+        return:
+        arguments(list)-[(name,DOF,Fixed,...),...] in the argument order of PropLink.Set<linkType>.
+        """
+        if linkType not in self._linkPropertyFields:
+            raise ValueError("unknown link type "+str(linkType))
+        fieldNames=props.dtype.names if isinstance(props,np.ndarray) else tuple(props.keys())
+        if "name" not in fieldNames:
+            raise ValueError("link properties need a name field")
+        names=[str(each) for each in np.atleast_1d(props["name"]).tolist()]
+        numProps=len(names)
+        if "" in names or len(set(names))!=numProps:
+            raise ValueError("link property names must be unique and not empty")
+        field=lambda key:props[key] if key in fieldNames else None
+        DOF=self._linkDOFMask(field("DOF"),numProps,"DOF")
+        Fixed=self._linkDOFMask(field("Fixed"),numProps,"Fixed")
+        masks=[DOF,Fixed]
+        bad=Fixed&~DOF
+        if linkType!="Linear":
+            Nonlinear=self._linkDOFMask(field("Nonlinear"),numProps,"Nonlinear")
+            masks.append(Nonlinear)
+            bad|=Nonlinear&(Fixed|~DOF)
+        self._linkCheckRows(bad.any(axis=1),names,"Fixed/Nonlinear degrees of freedom must be active and not both")
+        columns=[]
+        coupled=[]
+        for each in self._linkPropertyFields[linkType]:
+            values=self._linkTerms(field(each),numProps,each,linkType=="Linear" and each in ("Ke","Ce"))
+            if each in ("Ke","Ce"):
+                coupled.append(values.shape[1]==21)
+                diagonal=values[:,[0,2,5,9,14,20]] if coupled[-1] else values
+                self._linkCheckRows((diagonal<0).any(axis=1),names,each+" diagonal terms must not be negative")
+            self._linkCheckRows(~np.isfinite(values).all(axis=1),names,each+" terms must be finite")
+            columns.append(values)
+        scalars=["damping","dj2","dj3"] if linkType=="FrictionIsolator" else ["dj2","dj3"]
+        for each in scalars:
+            values=np.broadcast_to(np.asarray(field(each) if field(each) is not None else 0.0,dtype=float),
+                                   (numProps,))
+            self._linkCheckRows(~np.isfinite(values),names,each+" must be finite")
+            columns.append(values)
+        rows=[each.tolist() for each in masks+columns]
+        if linkType=="Linear":
+            rows+=[[coupled[0]]*numProps,[coupled[1]]*numProps]
+        return list(zip(names,*rows))
+
+    def define_section_PropLink_SetBulk(self,linkType,props):
+        """
+        ---This function defines many link properties of one type from a numpy structured array (or dict of
+        arrays). All properties are packed and validated before the first one is sent to SAP2000, so an invalid
+        record does not leave a partially defined set---
+        inputs:
+        linkType(str)-See define_section_PropLink_GetDtype.
+        props(numpy structured array or dict)-See define_section_PropLink_Compile.
+        return:
+        names(list)-The names of the defined link properties.
+        """
+        arguments=self.define_section_PropLink_Compile(linkType,props)
+        setter=getattr(self.SapModel.PropLink,"Set"+linkType)
+        for each in arguments:
+            setter(*each)
+        return [each[0] for each in arguments]
+
+    def define_section_PropLink_SampleParameters(self,ranges,numSamples,method="LHS",seed=None):
+        """
+        ---This function samples link parameters by Latin hypercube or plain random sampling---
+        inputs:
+        ranges(dict)-{parameter:(low,high)} or {parameter:(low,high,"log")} for a log-uniform parameter.
+        numSamples(int)-The number of samples.
+        method(str)-"LHS" or "random"
+        seed(int)-The seed of the random generator, the same seed gives the same samples.
+        return:
+        samples(dict)-{parameter:numpy array (numSamples,)}
+        """
+        rng=np.random.default_rng(seed)
+        keys=list(ranges.keys())
+        if method=="LHS":
+            unit=(np.argsort(rng.random((numSamples,len(keys))),axis=0)+rng.random((numSamples,len(keys))))/numSamples
+        elif method=="random":
+            unit=rng.random((numSamples,len(keys)))
+        else:
+            raise ValueError("method must be LHS or random")
+        samples={}
+        for index,key in enumerate(keys):
+            low,high=float(ranges[key][0]),float(ranges[key][1])
+            if len(ranges[key])>2 and ranges[key][2]=="log":
+                samples[key]=np.exp(np.log(low)+unit[:,index]*(np.log(high)-np.log(low)))
+            else:
+                samples[key]=low+unit[:,index]*(high-low)
+        return samples
+
+    def define_section_PropLink_SweepGenerate(self,linkType,base,ranges,numSamples,method="LHS",seed=None,
+                                              NamePrefix="sweep",Digits=6):
+        """
+        ---This function generates a parameter sweep of link properties, e.g. rubber or friction isolators and
+        dampers for a probabilistic seismic study. The sampled values are rounded to Digits significant digits,
+        identical property sets are kept once and named after their content hash---
+        inputs:
+        linkType(str)-See define_section_PropLink_GetDtype, e.g. "RubberIsolator","FrictionIsolator","Damper" or
+            "DamperBilinear".
+        base(dict)-The fixed part of the property, in the format of define_section_PropLink_Compile without name,
+            e.g. {"DOF":[["U1","U2","U3"]],"Nonlinear":[["U2","U3"]],"Ke":{"U1":2e6,"U2":1500,"U3":1500}}
+        ranges(dict)-{"field:DOF":(low,high)} or {"field:DOF":(low,high,"log")}, the DOF may be a comma separated
+            list receiving the same value, e.g. {"yieldF:U2,U3":(50,150),"Ratio:U2,U3":(0.05,0.15)},
+            "damping" and "dj2","dj3" have no DOF part.
+        numSamples(int)-The number of samples.
+        method(str)-"LHS" or "random"
+        seed(int)-The seed of the random generator.
+        NamePrefix(str)-The prefix of the property names, a name is NamePrefix+"_"+the first 10 hash digits.
+        Digits(int)-The number of significant digits kept for the sampled values.
+        return:
+        sweep(dict)-{"linkType","method","seed","ranges","samples","props","hashes","sampleToProp","assignments"}
+            props is the structured array of the distinct properties, sampleToProp the index of the property of
+            each sample.
+        """
+        samples=self.define_section_PropLink_SampleParameters(ranges,numSamples,method,seed)
+        dtype=self.define_section_PropLink_GetDtype(linkType,len(NamePrefix)+11)
+        props=np.zeros(numSamples,dtype=dtype)
+        for each in dtype.names[1:]:
+            if each in base:
+                if props[each].dtype==bool:
+                    props[each]=self._linkDOFMask(base[each],numSamples,each)
+                elif props[each].ndim==2:
+                    props[each]=self._linkTerms(base[each],numSamples,each,False)
+                else:
+                    props[each]=base[each]
+        for key,values in samples.items():
+            fieldName,_,DOFPart=key.partition(":")
+            if fieldName not in dtype.names[1:] or props[fieldName].dtype==bool:
+                raise ValueError("unknown sweep parameter "+key)
+            values=self._sweepRound(values,Digits)
+            if DOFPart:
+                for eachDOF in DOFPart.split(","):
+                    props[fieldName][:,self._linkDOFNames.index(eachDOF.strip())]=values
+            else:
+                props[fieldName]=values
+        numeric=np.hstack([props[each].reshape(numSamples,-1).astype(float) for each in dtype.names[1:]])
+        _,first,inverse=np.unique(numeric,axis=0,return_index=True,return_inverse=True)
+        order=np.argsort(first)
+        rank=np.empty_like(order)
+        rank[order]=np.arange(len(order))
+        props=props[np.sort(first)]
+        hashes=[hashlib.sha1((linkType+":").encode("utf-8")+each.tobytes()).hexdigest()
+                for each in numeric[np.sort(first)]]
+        props["name"]=[NamePrefix+"_"+each[:10] for each in hashes]
+        self.define_section_PropLink_Compile(linkType,props)
+        return {"linkType":linkType,"method":method,"seed":seed,"ranges":{key:list(value) for key,value in ranges.items()},
+                "samples":samples,"props":props,"hashes":hashes,"sampleToProp":rank[inverse.ravel()],
+                "assignments":[]}
+
+    def define_section_PropLink_SweepAssign(self,sweep,linkNames,pool=None,ManifestPath=None,
+                                            GroupPrefix="_sweepGroup"):
+        """
+        ---This function is a generator that assigns the samples of a sweep to the link objects of a pool of model
+        copies. Every copy first defines all the distinct properties it will need in one pass; then in each round
+        copy j receives one sample, its property is assigned to all linkNames, and the round is yielded so that the
+        copies can be analyzed before the next round. The manifest is rewritten after every round---
+        inputs:
+        sweep(dict)-The result of define_section_PropLink_SweepGenerate or define_section_PropLink_SweepLoad.
+        linkNames(list)-The names of the link objects receiving the sampled property in every copy.
+        pool(list)-SAP2000Py instances with the same model open, default [self].
+        ManifestPath(str)-The JSON file recording the sample design and the link assignments, None for no file.
+        GroupPrefix(str)-The prefix of the group kept in each copy for the link objects, the group takes a name
+            not used by the groups of the copy.
+        yield:
+        assignments(list)-[{"sample":int,"round":int,"slot":int,"property":str},...] for the round, slot is
+            the index of the copy in pool.
+        """
+        pool=[self] if pool is None else list(pool)
+        linkNames=[str(each) for each in linkNames]
+        sampleToProp=np.asarray(sweep["sampleToProp"])
+        sweep["linkNames"]=linkNames
+        sweep["assignments"]=[]
+        for slot,instance in enumerate(pool):
+            needed=np.unique(sampleToProp[slot::len(pool)])
+            if len(needed):
+                instance.define_section_PropLink_SetBulk(sweep["linkType"],sweep["props"][needed])
+        for roundNum,start in enumerate(range(0,len(sampleToProp),len(pool))):
+            assignments=[]
+            for slot,sampleIndex in enumerate(range(start,min(start+len(pool),len(sampleToProp)))):
+                instance=pool[slot]
+                propName=str(sweep["props"]["name"][sampleToProp[sampleIndex]])
+                key=("LinkObj",tuple(sorted(linkNames)))
+                groupName=instance._bulkGroups.get(key)
+                if groupName is None and len(linkNames)>1:
+                    groupName=next(instance._groupNamesFree(GroupPrefix))
+                    instance.define_Groups_SetGroupFromObjects(groupName,"LinkObj",key[1])
+                    instance._bulkGroups[key]=groupName
+                if groupName is not None:
+                    result=instance.assign_LinkObj_SetProperty(groupName,propName,1)
+                    if instance._retCode(result)!=0:
+                        # the group is not in the model any more, e.g. it was deleted by hand
+                        del instance._bulkGroups[key]
+                        groupName=None
+                if groupName is None:
+                    for eachName in linkNames:
+                        instance.assign_LinkObj_SetProperty(eachName,propName,0)
+                assignments.append({"sample":sampleIndex,"round":roundNum,"slot":slot,"property":propName})
+            sweep["assignments"]+=assignments
+            if ManifestPath is not None:
+                self.define_section_PropLink_SweepSave(sweep,ManifestPath)
+            yield assignments
+
+    def define_section_PropLink_SweepSave(self,sweep,ManifestPath):
+        """
+        ---This function writes the sample design, the distinct properties and the link assignments of a sweep to a
+        JSON manifest---
+        inputs:
+        sweep(dict)-The sweep dictionary.
+        ManifestPath(str)-The path of the JSON file.
+        """
+        manifest={"linkType":sweep["linkType"],"method":sweep["method"],"seed":sweep["seed"],
+                  "ranges":sweep["ranges"],"samples":{key:np.asarray(value).tolist() for key,value in
+                                                      sweep["samples"].items()},
+                  "props":{each:sweep["props"][each].tolist() for each in sweep["props"].dtype.names},
+                  "hashes":list(sweep["hashes"]),"sampleToProp":np.asarray(sweep["sampleToProp"]).tolist(),
+                  "linkNames":sweep.get("linkNames",[]),"assignments":sweep["assignments"]}
+        with open(ManifestPath,"w") as f:
+            json.dump(manifest,f)
+
+    def define_section_PropLink_SweepLoad(self,ManifestPath):
+        """
+        ---This function reads a sweep manifest written by define_section_PropLink_SweepSave, the result can be
+        passed to define_section_PropLink_SweepAssign to rerun the same design---
+        inputs:
+        ManifestPath(str)-The path of the JSON file.
+        return:
+        sweep(dict)-See define_section_PropLink_SweepGenerate.
+        """
+        with open(ManifestPath,"r") as f:
+            manifest=json.load(f)
+        names=manifest["props"]["name"]
+        dtype=self.define_section_PropLink_GetDtype(manifest["linkType"],max([len(each) for each in names]+[1]))
+        props=np.zeros(len(names),dtype=dtype)
+        for each in dtype.names:
+            props[each]=manifest["props"][each]
+        return {"linkType":manifest["linkType"],"method":manifest["method"],"seed":manifest["seed"],
+                "ranges":manifest["ranges"],"samples":{key:np.array(value) for key,value in
+                                                       manifest["samples"].items()},
+                "props":props,"hashes":manifest["hashes"],"sampleToProp":np.array(manifest["sampleToProp"]),
+                "linkNames":manifest["linkNames"],"assignments":manifest["assignments"]}
+
+    def _sweepRound(self,values,digits):
+        """
+        ---round to a number of significant digits, so that nearly equal samples hash to the same property---
+        """
+        values=np.asarray(values,dtype=float)
+        magnitude=np.floor(np.log10(np.where(values==0,1.0,np.abs(values))))
+        scale=10.0**(digits-1-magnitude)
+        return np.round(values*scale)/scale
+
+    def _linkDOFMask(self,values,numProps,fieldName):
+        """
+        ---(numProps,6) bool mask from a bool array or from lists of DOF names---
+        """
+        if values is None:
+            return np.zeros((numProps,6),dtype=bool)
+        if len(values) and isinstance(values[0],(list,tuple)) and \
+                all(isinstance(each,str) for row in values for each in row):
+            lengths=[len(row) for row in values]
+            allNames=np.array([each for row in values for each in row]+list(self._linkDOFNames))
+            unique,inverse=np.unique(allNames,return_inverse=True)
+            unknown=set(unique.tolist())-set(self._linkDOFNames)
+            if unknown:
+                raise ValueError(fieldName+" has unknown degrees of freedom "+str(sorted(unknown)))
+            columnOf=np.array([self._linkDOFNames.index(each) for each in unique.tolist()])
+            mask=np.zeros((len(values),6),dtype=bool)
+            mask[np.repeat(np.arange(len(values)),lengths),columnOf[inverse[:sum(lengths)]]]=True
+            values=mask
+        values=np.asarray(values,dtype=bool)
+        if values.shape[-1]!=6 or values.ndim>2 or (values.ndim==2 and values.shape[0] not in (1,numProps)):
+            raise ValueError(fieldName+" must have six terms per link property")
+        return np.broadcast_to(values,(numProps,6))
+
+    def _linkTerms(self,values,numProps,fieldName,canCouple):
+        """
+        ---(numProps,6) or (numProps,21) float terms from an array or from a dict of DOF name to column---
+        """
+        if values is None:
+            return np.zeros((numProps,6))
+        if isinstance(values,dict):
+            keys=list(values.keys())
+            names=self._linkCoupledNames if canCouple and any(len(each)==4 for each in keys) else self._linkDOFNames
+            unknown=[each for each in keys if each not in names]
+            if unknown:
+                raise ValueError(fieldName+" has unknown terms "+str(unknown))
+            terms=np.zeros((numProps,len(names)))
+            for each in keys:
+                terms[:,names.index(each)]=values[each]
+            return terms
+        values=np.asarray(values,dtype=float)
+        sizes=(6,21) if canCouple else (6,)
+        if values.shape[-1] not in sizes or values.ndim>2 or (values.ndim==2 and values.shape[0] not in (1,numProps)):
+            raise ValueError(fieldName+" must have "+" or ".join(str(each) for each in sizes)+
+                             " terms per link property")
+        return np.broadcast_to(values,(numProps,values.shape[-1]))
+
+    def _linkCheckRows(self,badRows,names,message):
+        """
+        ---raise ValueError naming the first link properties that fail a check---
+        """
+        if badRows.any():
+            badNames=[names[each] for each in np.flatnonzero(badRows)[:5]]
+            raise ValueError(message+": "+", ".join(badNames)+(" ..." if badRows.sum()>5 else ""))
+
     def define_SourceMass_SetMassSource(self,Name,MassFromElements,MassFromMasses,MassFromLoads,IsDefault,
                                         NumberLoads,LoadPat,SF):
         """
@@ -1371,6 +2884,54 @@ class SAP2000Py():
                                         SpecifiedForBridgeResponseOutput,SpecifiedForAutoSeismicOutput,
                                         SpecifiedForAutoWindOutput,SpecifiedForMassAndWeight)
 
+    def define_Groups_Delete(self,name):
+        """
+        ---The function deletes the specified group. The objects in the group are not deleted---
+        inputs:
+        name(str)-The name of an existing group.
+        """
+        self.SapModel.GroupDef.Delete(name)
+
+    def define_Groups_GetNameList(self):
+        """
+        ---This function retrieves the names of all defined groups---
+        return:
+        [index,NumberNames,MyName]
+        NumberNames(int)-The number of group names retrieved by the program.
+        MyName(str list)-This is a one-dimensional list of group names.
+        """
+        result=self.SapModel.GroupDef.GetNameList()
+        return result
+
+    def define_Groups_SetGroupFromObjects(self,name,objType,objNames):
+        """
+        ---This function initializes a group and adds the specified objects to it, one SetGroupAssign call per object---
+        inputs:
+        name(str)-The name of the group.
+        objType(str)-The object family of the objects, e.g. "PointObj","FrameObj","CableObj","TendonObj","AreaObj",
+            "SolidObj" or "LinkObj".
+        objNames(str list)-The names of the objects added to the group.
+        """
+        self.define_Groups_SetGroup(name)
+        setGroupAssign=getattr(self,"assign_"+objType+"_SetGroupAssign")
+        for eachName in objNames:
+            setGroupAssign(eachName,name)
+
+    def _groupNamesFree(self,GroupPrefix):
+        """
+        ---the names GroupPrefix1, GroupPrefix2, ... that are not used by a group of the model, so a scratch group
+        never overwrites (and later deletes) a group of the user. The group names are read at the first name---
+        """
+        result=self.define_Groups_GetNameList()
+        used=set(str(each) for each in result[2]) if isinstance(result,(tuple,list)) and result[0]==0 else set()
+        count=0
+        while True:
+            count+=1
+            name=GroupPrefix+str(count)
+            if name not in used:
+                used.add(name)
+                yield name
+
     def define_generalizedDisplacements_Add(self,name,myType):
         """
         ---This function adds a new generalized displacement with the specified name and type.---
@@ -1448,6 +3009,171 @@ class SAP2000Py():
         """
         self.SapModel.Func.FuncRS.SetCJJ1662011(name,direction,peakAccel,Tg,dampRatio)
 
+    _chinese2010AlphaMax={"frequent":(0.04,0.08,0.12,0.16,0.24,0.32),"design":(0.12,0.23,0.34,0.45,0.68,0.90),
+                          "rare":(0.28,0.50,0.72,0.90,1.20,1.40)}
+    _chinese2010Tg={1:{"I0":0.20,"I1":0.25,"II":0.35,"III":0.45,"IV":0.65},
+                    2:{"I0":0.25,"I1":0.30,"II":0.40,"III":0.55,"IV":0.75},
+                    3:{"I0":0.30,"I1":0.35,"II":0.45,"III":0.65,"IV":0.90}}
+
+    def define_functions_Chinese2010Parameters(self,JGJ32010SI,siteClass,group=1,level="frequent"):
+        """
+        ---This function returns the maximum influence factor and the characteristic ground period of
+        GB 50011-2010 tables 5.1.4-1 and 5.1.4-2---
+        inputs:
+        JGJ32010SI(int)-1 = 6 (0.05g),2 = 7 (0.10g),3 = 7 (0.15g),4 = 8 (0.20g),5 = 8 (0.30g),6 = 9 (0.40g)
+        siteClass(str)-"I0","I1","II","III" or "IV"
+        group(int)-The design earthquake group, 1, 2 or 3.
+        level(str)-"frequent","design" or "rare"
+        return:
+        [alphaMax,Tg]
+        """
+        Tg=self._chinese2010Tg[group][siteClass]
+        if level=="rare":
+            Tg+=0.05
+        return [self._chinese2010AlphaMax[level][JGJ32010SI-1],Tg]
+
+    def define_functions_FuncRS_Chinese2010Curve(self,periods,JGJ32010AlphaMax,JGJ32010SI,JGJ32010Tg,
+                                                 JGJ32010PTDF,DampRatio):
+        """
+        ---This function returns the values of the Chinese 2010 (GB 50011-2010) response spectrum function
+        defined by define_functions_FuncRS_SetChinese2010 with the same arguments. The periods are multiplied by
+        the period time discount factor before the spectrum is evaluated, the descending line after 5Tg is
+        continued beyond 6 s---
+        inputs:
+        periods(list)-The periods. [s]
+        JGJ32010AlphaMax,JGJ32010SI,JGJ32010Tg,JGJ32010PTDF,DampRatio-See define_functions_FuncRS_SetChinese2010.
+        return:
+        values(numpy array)-The influence factor alpha at every period.
+        """
+        key=("Chinese2010",JGJ32010AlphaMax,JGJ32010SI,JGJ32010Tg,JGJ32010PTDF,DampRatio)
+        return self._codeSpectrumCached(key,periods,lambda T:self._codeSpectrumChinese(
+            T*JGJ32010PTDF,JGJ32010AlphaMax,JGJ32010Tg,DampRatio,"GB"))
+
+    def define_functions_FuncRS_JTGB022013Curve(self,periods,direction,peakAccel,Tg,Ci,Cs,dampRatio):
+        """
+        ---This function returns the values of the JTG B02-2013 response spectrum function defined by
+        define_functions_FuncRS_SetJTGB022013 with the same arguments, Smax=2.25*Ci*Cs*Cd*A. The vertical
+        spectra are the horizontal one times 0.65 (rock) or the ratio of the code for soil sites---
+        inputs:
+        periods(list)-The periods. [s]
+        direction,peakAccel,Tg,Ci,Cs,dampRatio-See define_functions_FuncRS_SetJTGB022013.
+        return:
+        values(numpy array)-The spectrum value at every period, in the unit of peakAccel.
+        """
+        key=("JTGB022013",direction,peakAccel,Tg,Ci,Cs,dampRatio)
+
+        def curve(T):
+            Cd=max(1.0+(0.05-dampRatio)/(0.08+1.6*dampRatio),0.55)
+            Smax=2.25*Ci*Cs*Cd*peakAccel
+            values=np.where(T<0.1,Smax*(5.5*T+0.45),np.where(T<=Tg,Smax,Smax*Tg/np.maximum(T,1e-12)))
+            return values*self._codeSpectrumVerticalRatio(T,direction)
+        return self._codeSpectrumCached(key,periods,curve)
+
+    def define_functions_FuncRS_CJJ1662011Curve(self,periods,direction,peakAccel,Tg,dampRatio):
+        """
+        ---This function returns the values of the CJJ 166-2011 response spectrum function defined by
+        define_functions_FuncRS_SetCJJ1662011 with the same arguments, Smax=2.25*A with the damping factors of
+        GB 50011. The vertical spectrum is the horizontal one times 0.65---
+        inputs:
+        periods(list)-The periods. [s]
+        direction,peakAccel,Tg,dampRatio-See define_functions_FuncRS_SetCJJ1662011.
+        return:
+        values(numpy array)-The spectrum value at every period, in the unit of peakAccel.
+        """
+        key=("CJJ1662011",direction,peakAccel,Tg,dampRatio)
+        return self._codeSpectrumCached(key,periods,lambda T:self._codeSpectrumChinese(
+            T,2.25*peakAccel,Tg,dampRatio,"CJJ")*self._codeSpectrumVerticalRatio(T,2 if direction==2 else 1))
+
+    def define_functions_GetValues(self,name):
+        """
+        ---This function retrieves the time and function values for any defined function---
+        inputs:
+        name(str)-The name of an existing function.
+        return:
+        [myTime,value]
+        myTime(list)-The time (or period) of every data point.
+        value(list)-The function value of every data point.
+        """
+        result=self.SapModel.Func.GetValues(name)
+        return [list(result[2]),list(result[3])]
+
+    def define_functions_FuncRS_VerifyCurve(self,name,periods,values):
+        """
+        ---This function compares the points of a response spectrum function defined in SAP2000 with a
+        client-side curve---
+        inputs:
+        name(str)-The name of the defined response spectrum function.
+        periods,values(list)-The client-side curve, e.g. from define_functions_FuncRS_Chinese2010Curve.
+        return:
+        maxRelativeError(float)-The largest difference at the function points over the largest function value.
+        """
+        myTime,value=self.define_functions_GetValues(name)
+        client=np.interp(myTime,np.asarray(periods,dtype=float),np.asarray(values,dtype=float))
+        value=np.asarray(value,dtype=float)
+        return float(np.abs(client-value).max()/max(np.abs(value).max(),1e-12))
+
+    def define_functions_SpectrumScaleFactors(self,periods,spectra,target,periodRange=None):
+        """
+        ---This function returns the scale factors that fit many record spectra to a target spectrum in the
+        least squares sense of the logarithms, and the remaining misfit---
+        inputs:
+        periods(list)-The periods of the spectra and of the target. [s]
+        spectra(numpy array)-(number of records,number of periods), e.g. define_functions_ResponseSpectrum(...)
+            ["PSA"][:,0,:] in the unit of the target.
+        target(list)-The target spectrum, e.g. define_functions_FuncRS_Chinese2010Curve(...)*9.81.
+        periodRange(tuple)-(Tmin,Tmax) of the fit, None for all periods. [s]
+        return:
+        [scaleFactors,misfit]
+        scaleFactors(numpy array)-One factor per record.
+        misfit(numpy array)-The root mean square of the log ratio of the scaled spectrum to the target.
+        """
+        periods=np.asarray(periods,dtype=float)
+        spectra=np.atleast_2d(np.asarray(spectra,dtype=float))
+        target=np.asarray(target,dtype=float)
+        use=(periods>0)&(target>0)&(spectra>0).all(axis=0)
+        if periodRange is not None:
+            use&=(periods>=periodRange[0])&(periods<=periodRange[1])
+        logRatio=np.log(target[use])[None,:]-np.log(spectra[:,use])
+        shift=logRatio.mean(axis=1)
+        return [np.exp(shift),np.sqrt(((logRatio-shift[:,None])**2).mean(axis=1))]
+
+    def _codeSpectrumCached(self,key,periods,curve):
+        """
+        ---memoize a code spectrum by its parameters and periods, the returned array is read only---
+        """
+        periods=np.asarray(periods,dtype=float)
+        key=key+(hashlib.sha1(periods.tobytes()).hexdigest(),)
+        if key not in self._codeSpectrumCache:
+            values=np.asarray(curve(periods),dtype=float)
+            values.setflags(write=False)
+            self._codeSpectrumCache[key]=values
+        return self._codeSpectrumCache[key]
+
+    def _codeSpectrumChinese(self,T,alphaMax,Tg,dampRatio,code):
+        """
+        ---GB 50011-2010 shape (code "GB") or CJJ 166-2011 shape (code "CJJ", other rising branch)---
+        """
+        gamma=0.9+(0.05-dampRatio)/(0.3+6.0*dampRatio)
+        eta1=max(0.02+(0.05-dampRatio)/(4.0+32.0*dampRatio),0.0)
+        eta2=max(1.0+(0.05-dampRatio)/(0.08+1.6*dampRatio),0.55)
+        if code=="GB":
+            rising=(0.45+10.0*(eta2-0.45)*T)*alphaMax
+        else:
+            rising=eta2*alphaMax*(0.6*T/0.1+0.4)
+        safeT=np.maximum(T,1e-12)
+        return np.where(T<0.1,rising,np.where(T<=Tg,eta2*alphaMax,np.where(
+            T<=5.0*Tg,(Tg/safeT)**gamma*eta2*alphaMax,(eta2*0.2**gamma-eta1*(T-5.0*Tg))*alphaMax)))
+
+    def _codeSpectrumVerticalRatio(self,T,direction):
+        """
+        ---vertical to horizontal ratio, 1 = Horizontal,2 = Vertical-Rock,3 = Vertical-Soil---
+        """
+        if direction==1:
+            return np.ones_like(T)
+        if direction==2:
+            return np.full_like(T,0.65)
+        return np.where(T<0.1,1.0,np.where(T<0.3,1.0-2.5*(T-0.1),0.5))
+
     def define_functions_FuncRS_SetUser(self,name,period,value,dampRatio):
         """
         ---This function defines a user response spectrum function.---
@@ -1460,6 +3186,95 @@ class SAP2000Py():
         numberItems=len(period)
         self.SapModel.Func.FuncRS.SetUser(name,numberItems,period,value,dampRatio)
 
+    def define_functions_ResponseSpectrum(self,records,periods,DampRatio=0.05):
+        """
+        ---This function computes the elastic response spectra of many acceleration records for many periods and
+        damping ratios at once. The single degree of freedom responses follow the exact recurrence of Nigam and
+        Jennings for a piecewise linear excitation, the time steps are looped and every step updates all records,
+        damping ratios and periods together---
+        inputs:
+        records(list)-[(time,acceleration),...] with a constant time step in every record. [s],[L/s2]
+        periods(list)-The periods of the spectrum, a period <= 0 gives the peak ground acceleration. [s]
+        DampRatio(float or list)-One or several damping ratios, 0 <= DampRatio < 1.
+        return:
+        spectra(dict)-{"periods","dampRatios","SA","SV","SD","PSV","PSA"}, the spectra are arrays of shape
+            (number of records,number of damping ratios,number of periods).
+            SA(float)-The absolute acceleration spectrum. [L/s2]
+            SV(float)-The relative velocity spectrum. [L/s]
+            SD(float)-The relative displacement spectrum. [L]
+            PSV,PSA(float)-The pseudo velocity and pseudo acceleration, omega*SD and omega^2*SD.
+        """
+        periods=np.atleast_1d(np.asarray(periods,dtype=float))
+        dampRatios=np.atleast_1d(np.asarray(DampRatio,dtype=float))
+        if ((dampRatios<0)|(dampRatios>=1)).any():
+            raise ValueError("damping ratios must satisfy 0 <= DampRatio < 1")
+        lengths=np.array([len(each[1]) for each in records])
+        steps=np.array([float(each[0][1])-float(each[0][0]) for each in records])
+        acceleration=np.zeros((len(records),lengths.max()))
+        for index,(myTime,value) in enumerate(records):
+            acceleration[index,:lengths[index]]=value
+        dynamic=periods>0
+        omega=2.0*math.pi/np.where(dynamic,periods,1.0)
+        w=omega[None,None,:]
+        z=dampRatios[None,:,None]
+        dt=steps[:,None,None]
+        root=np.sqrt(1.0-z**2)
+        wd=w*root
+        e=np.exp(-z*w*dt)
+        s=np.sin(wd*dt)
+        c=np.cos(wd*dt)
+        A=e*(z/root*s+c)
+        B=e*s/wd
+        C=(2*z/(w*dt)+e*(((1-2*z**2)/(wd*dt)-z/root)*s-(1+2*z/(w*dt))*c))/w**2
+        D=(1-2*z/(w*dt)+e*((2*z**2-1)/(wd*dt)*s+2*z/(w*dt)*c))/w**2
+        Ap=-e*w/root*s
+        Bp=e*(c-z/root*s)
+        Cp=(-1/dt+e*((w/root+z/(dt*root))*s+c/dt))/w**2
+        Dp=(1-e*(z/root*s+c))/(w**2*dt)
+        shape=np.broadcast(A,z).shape
+        u=np.zeros(shape)
+        v=np.zeros(shape)
+        SD=np.zeros(shape)
+        SV=np.zeros(shape)
+        SA=np.zeros(shape)
+        for step in range(lengths.max()-1):
+            active=(step+1<lengths)[:,None,None]
+            p0=-acceleration[:,step,None,None]
+            p1=-acceleration[:,step+1,None,None]
+            u,v=A*u+B*v+C*p0+D*p1,Ap*u+Bp*v+Cp*p0+Dp*p1
+            SD=np.where(active,np.maximum(SD,np.abs(u)),SD)
+            SV=np.where(active,np.maximum(SV,np.abs(v)),SV)
+            SA=np.where(active,np.maximum(SA,np.abs(2*z*w*v+w**2*u)),SA)
+        PGA=np.abs(acceleration).max(axis=1)[:,None,None]
+        SA=np.where(dynamic,SA,PGA)
+        SD=np.where(dynamic,SD,0.0)
+        SV=np.where(dynamic,SV,0.0)
+        return {"periods":periods,"dampRatios":dampRatios,"SA":SA,"SV":SV,"SD":SD,"PSV":np.where(dynamic,w*SD,0.0),
+                "PSA":np.where(dynamic,w**2*SD,PGA)}
+
+    def define_functions_FuncRS_SetUserFromRecords(self,names,records,periods,DampRatio=0.05,Kind="PSA",
+                                                   ScaleFactor=1.0):
+        """
+        ---This function computes the response spectra of records with define_functions_ResponseSpectrum and
+        defines them as user response spectrum functions---
+        inputs:
+        names(list)-The function names, one per record.
+        records(list)-See define_functions_ResponseSpectrum.
+        periods(list)-The periods of the functions. [s]
+        DampRatio(float)-The damping ratio of the spectra and of the functions.
+        Kind(str)-"PSA" or "SA", the spectrum used as function values.
+        ScaleFactor(float)-The factor applied to the spectrum values, e.g. 1/9.81 for values in g.
+        return:
+        spectra(dict)-See define_functions_ResponseSpectrum.
+        """
+        if len(names)!=len(records):
+            raise ValueError("names and records must have the same length")
+        spectra=self.define_functions_ResponseSpectrum(records,periods,DampRatio)
+        for index,name in enumerate(names):
+            self.define_functions_FuncRS_SetUser(name,spectra["periods"].tolist(),
+                                                 (spectra[Kind][index,0]*ScaleFactor).tolist(),float(DampRatio))
+        return spectra
+
     def define_functions_FuncTH_SetUser(self,name,myTime,value):
         """
         ---This function defines a user time history function.---
@@ -1471,6 +3286,292 @@ class SAP2000Py():
         numberItems=len(myTime)
         self.SapModel.Func.FuncTH.SetUser(name,numberItems,myTime,value)
 
+    def define_functions_FuncTH_SetUserBulk(self,names,records):
+        """
+        ---This function defines many user time history functions---
+        inputs:
+        names(list)-The names of the functions.
+        records(list)-[(time,value),...], arrays or lists with the time [s] and the value of every data point.
+        """
+        if len(names)!=len(records):
+            raise ValueError("names and records must have the same length")
+        for name,(myTime,value) in zip(names,records):
+            self.define_functions_FuncTH_SetUser(name,np.asarray(myTime,dtype=float).tolist(),
+                                                 np.asarray(value,dtype=float).tolist())
+
+    def define_functions_FuncTH_Decimate(self,records,names=None,Tolerance=0.05,AriasTolerance=0.05,periods=None,
+                                         DampRatio=0.05,Factors=(2,3,4,5,6,8,10),Define=False):
+        """
+        ---This function decimates a suite of acceleration records for time history functions. For every record
+        and decimation factor, the record is low passed at the new Nyquist frequency and resampled on a grid
+        aligned with its peak sample. The low pass lowers the peak, so the original peak value is put back at its
+        sample, and the first point of the record is kept so the function still starts at the first time. The
+        response spectra of all candidates and originals are computed in one batch on the original time step, as
+        SAP2000 interpolates the function linearly between its points, and every record keeps the largest factor
+        whose pseudo acceleration spectrum, peak and Arias intensity stay within the tolerances---
+        inputs:
+        records(list)-[(time,acceleration),...] with a constant time step in every record.
+        names(list)-The function names, needed only when Define is True.
+        Tolerance(float)-The largest relative error of the pseudo acceleration spectrum and of the peak.
+        AriasTolerance(float)-The largest relative error of the Arias intensity.
+        periods(list)-The periods of the spectrum check, default 60 periods from 0.05 s to 10 s. [s]
+        DampRatio(float)-The damping ratio of the spectrum check.
+        Factors(tuple)-The candidate decimation factors.
+        Define(bool)-If True, the decimated records are defined with define_functions_FuncTH_SetUserBulk.
+        return:
+        [decimated,report]
+        decimated(list)-[(time,acceleration),...], a record that no factor satisfies is returned unchanged.
+        report(dict)-{"factor","points","originalPoints","spectrumError","peakError","ariasError","speedUp"}, the
+            first six are arrays with one value per record, speedUp is the ratio of the total number of points, which is
+            the reduction of the direct integration steps when the analysis step follows the function step.
+        """
+        if periods is None:
+            periods=np.logspace(math.log10(0.05),1.0,60)
+        Factors=sorted(set(int(each) for each in Factors if each>1))
+        candidates=[]
+        owner=[]
+        for index,(myTime,value) in enumerate(records):
+            myTime=np.asarray(myTime,dtype=float)
+            value=np.asarray(value,dtype=float)
+            dt=myTime[1]-myTime[0]
+            for factor in Factors:
+                if len(value)<3*factor:
+                    continue
+                smooth=self._recordFilter(value[None,:],np.array([dt]),None,0.5/(factor*dt),4)[0]
+                peak=int(np.argmax(np.abs(value)))
+                offset=peak%factor
+                smooth[peak]=value[peak]
+                smooth[0]=value[0]
+                samples=np.arange(offset,len(value),factor)
+                if offset>0:
+                    samples=np.concatenate(([0],samples))
+                candidates.append((myTime[samples],smooth[samples]))
+                owner.append((index,factor))
+        originals=[(np.asarray(t,dtype=float),np.asarray(v,dtype=float)) for t,v in records]
+        interpolated=[(originals[index][0],np.interp(originals[index][0],t,v)) for (index,eachFactor),(t,v) in
+                      zip(owner,candidates)]
+        spectra=self.define_functions_ResponseSpectrum(originals+interpolated,periods,DampRatio)["PSA"][:,0,:]
+        arias=np.array([np.sum(v**2)*(t[1]-t[0]) for t,v in originals+interpolated])
+        numRecords=len(records)
+        factor=np.ones(numRecords,dtype=int)
+        spectrumError=np.zeros(numRecords)
+        peakError=np.zeros(numRecords)
+        ariasError=np.zeros(numRecords)
+        decimated=list(originals)
+        for position,(index,eachFactor) in enumerate(owner):
+            candidate=numRecords+position
+            error=np.max(np.abs(spectra[candidate]-spectra[index])/np.maximum(spectra[index],1e-12))
+            peak=np.max(np.abs(originals[index][1]))
+            eachPeak=abs(np.max(np.abs(candidates[position][1]))-peak)/max(peak,1e-12)
+            eachArias=abs(arias[candidate]-arias[index])/max(arias[index],1e-12)
+            if error<=Tolerance and eachPeak<=Tolerance and eachArias<=AriasTolerance and eachFactor>factor[index]:
+                factor[index]=eachFactor
+                spectrumError[index]=error
+                peakError[index]=eachPeak
+                ariasError[index]=eachArias
+                decimated[index]=candidates[position]
+        points=np.array([len(each[1]) for each in decimated])
+        originalPoints=np.array([len(each[1]) for each in records])
+        if Define:
+            self.define_functions_FuncTH_SetUserBulk(names,decimated)
+        return [decimated,{"factor":factor,"points":points,"originalPoints":originalPoints,
+                           "spectrumError":spectrumError,"peakError":peakError,"ariasError":ariasError,
+                           "speedUp":float(originalPoints.sum())/float(points.sum())}]
+
+    def define_functions_ReadRecord(self,filePath,dt=None,ChunkSize=1<<20):
+        """
+        ---This function reads a ground motion record incrementally, in text chunks of ChunkSize characters---
+        inputs:
+        filePath(str)-A PEER NGA ".AT2" file, or a text/CSV file with time and value columns, or with one value
+            column (then dt is needed). Header lines that are not numbers are skipped.
+        dt(float)-The time step of a one column file. [s]
+        ChunkSize(int)-The number of characters parsed at once.
+        return:
+        [time,value]
+        time(numpy array)-The time of every data point. [s]
+        value(numpy array)-The record values, in g for a PEER file.
+        """
+        with open(filePath,"r") as f:
+            if os.path.splitext(filePath)[1].lower()==".at2":
+                header=[f.readline() for each in range(4)]
+                match=re.search(r"NPTS\s*=\s*(\d+)\s*,?\s*DT\s*=\s*([0-9.EeDd+-]+)",header[3].upper())
+                if match is None:
+                    raise ValueError("NPTS and DT are not found in the header of "+filePath)
+                dt=float(match.group(2).replace("D","E"))
+                value=self._recordParseChunks(f,"",ChunkSize)[:int(match.group(1))]
+                return [np.arange(len(value))*dt,value]
+            line=f.readline()
+            while line and not self._recordIsNumeric(line):
+                line=f.readline()
+            numColumns=len(line.replace(","," ").split())
+            data=self._recordParseChunks(f,line,ChunkSize)
+        if numColumns>=2:
+            data=data[:len(data)//numColumns*numColumns].reshape(-1,numColumns)
+            return [data[:,0],data[:,1]]
+        if dt is None:
+            raise ValueError("dt is needed for the one column record "+filePath)
+        return [np.arange(len(data))*dt,data]
+
+    def define_functions_ProcessRecords(self,records,TargetDt=None,FilterBand=None,FilterOrder=4,
+                                        BaselineOrder=3,ScaleFactor=1.0):
+        """
+        ---This function resamples, baseline-corrects and filters many acceleration records at once. The records
+        are resampled one by one with linear interpolation (after a low pass at the new Nyquist frequency when the
+        step increases), then padded into one array: the baseline polynomials are fitted with one batched least
+        squares and the zero phase Butterworth filter is applied to all of them with one FFT---
+        inputs:
+        records(list)-[(time,value),...]
+        TargetDt(float)-The time step of the processed records, None keeps the step of every record. [s]
+        FilterBand(tuple)-(lowHz,highHz), either may be None, None for no filtering. [Hz]
+        FilterOrder(int)-The order of the Butterworth filter, it is applied forward and backward.
+        BaselineOrder(int)-The order of the polynomial fitted to the displacement and removed from the
+            acceleration (2 removes a constant acceleration offset, 3 also a linear drift), None for no baseline
+            correction.
+        ScaleFactor(float)-The factor applied to the values, e.g. 9.81 for records in g.
+        return:
+        records(list)-[(time,value),...] of the processed records.
+        """
+        resampled=[]
+        steps=[]
+        for myTime,value in records:
+            myTime=np.asarray(myTime,dtype=float)
+            value=np.asarray(value,dtype=float)*ScaleFactor
+            dt=float(np.median(np.diff(myTime)))
+            newDt=dt if TargetDt is None else float(TargetDt)
+            uniform=np.allclose(np.diff(myTime),dt,rtol=1e-6,atol=0.0)
+            if newDt>dt*(1+1e-9):
+                value=self._recordFilter(value[None,:],np.array([dt]),None,0.5/newDt,FilterOrder)[0]
+            if not uniform or abs(newDt-dt)>1e-9*dt:
+                newTime=myTime[0]+np.arange(int(math.floor((myTime[-1]-myTime[0])/newDt+1e-9))+1)*newDt
+                value=np.interp(newTime,myTime,value)
+                myTime=newTime
+            resampled.append((myTime,value))
+            steps.append(newDt)
+        lengths=np.array([len(each[1]) for each in resampled])
+        batch=np.zeros((len(resampled),lengths.max()))
+        for index,(myTime,value) in enumerate(resampled):
+            batch[index,:len(value)]=value
+        steps=np.array(steps)
+        if BaselineOrder is not None:
+            batch=self._recordBaseline(batch,steps,lengths,BaselineOrder)
+        if FilterBand is not None:
+            batch=self._recordFilter(batch,steps,FilterBand[0],FilterBand[1],FilterOrder)
+        return [(myTime,batch[index,:length]) for index,((myTime,value),length) in
+                enumerate(zip(resampled,lengths))]
+
+    def define_functions_FuncTH_IngestRecords(self,filePaths,names=None,TargetDt=None,FilterBand=None,
+                                              FilterOrder=4,BaselineOrder=3,ScaleFactor=1.0,dt=None,
+                                              CacheDir=None,Define=True):
+        """
+        ---This function reads, processes and defines a suite of ground motion records as user time history
+        functions. The processed arrays are cached in CacheDir as .npz files keyed by the hash of the record file
+        and of the processing settings, so a suite is only parsed and processed once---
+        inputs:
+        filePaths(list)-The record files, see define_functions_ReadRecord.
+        names(list)-The function names, None uses the file names without extension.
+        TargetDt,FilterBand,FilterOrder,BaselineOrder,ScaleFactor-See define_functions_ProcessRecords.
+        dt(float)-The time step of one column files. [s]
+        CacheDir(str)-The directory of the cache, None for no cache.
+        Define(bool)-If True, the functions are defined in SAP2000 with define_functions_FuncTH_SetUserBulk.
+        return:
+        records(dict)-{name:(time,value)}
+        """
+        if names is None:
+            names=[os.path.splitext(os.path.basename(each))[0] for each in filePaths]
+        settings=repr((TargetDt,FilterBand,FilterOrder,BaselineOrder,ScaleFactor,dt))
+        keys=[]
+        for each in filePaths:
+            digest=hashlib.sha1(settings.encode("utf-8"))
+            with open(each,"rb") as f:
+                for block in iter(lambda:f.read(1<<20),b""):
+                    digest.update(block)
+            keys.append(digest.hexdigest())
+        processed={}
+        missing=[]
+        for index,key in enumerate(keys):
+            cacheFile=None if CacheDir is None else os.path.join(CacheDir,key+".npz")
+            if cacheFile is not None and os.path.exists(cacheFile):
+                with np.load(cacheFile) as data:
+                    processed[index]=(data["time"],data["value"])
+            else:
+                missing.append(index)
+        if missing:
+            raw=[self.define_functions_ReadRecord(filePaths[index],dt) for index in missing]
+            results=self.define_functions_ProcessRecords(raw,TargetDt,FilterBand,FilterOrder,BaselineOrder,
+                                                         ScaleFactor)
+            if CacheDir is not None and not os.path.exists(CacheDir):
+                os.makedirs(CacheDir)
+            for index,(myTime,value) in zip(missing,results):
+                processed[index]=(myTime,value)
+                if CacheDir is not None:
+                    np.savez(os.path.join(CacheDir,keys[index]+".npz"),time=myTime,value=value)
+        records={names[index]:processed[index] for index in range(len(filePaths))}
+        if Define:
+            self.define_functions_FuncTH_SetUserBulk(list(records.keys()),list(records.values()))
+        return records
+
+    def _recordIsNumeric(self,line):
+        """
+        ---True if every item of a text line is a number---
+        """
+        items=line.replace(","," ").split()
+        try:
+            [float(each) for each in items]
+        except ValueError:
+            return False
+        return len(items)>0
+
+    def _recordParseChunks(self,f,text,ChunkSize):
+        """
+        ---parse the numbers of a text file chunk by chunk, a number cut by a chunk end is carried over---
+        """
+        parts=[]
+        while True:
+            chunk=f.read(ChunkSize)
+            text=(text+chunk).replace(",", " ").replace("D","E").replace("d","e")
+            if not chunk:
+                break
+            cut=max(text.rfind(" "),text.rfind("\n"),text.rfind("\t"))
+            if cut<0:
+                continue
+            parts.append(np.array(text[:cut].split(),dtype=float))
+            text=text[cut:]
+        parts.append(np.array(text.split(),dtype=float))
+        return np.concatenate(parts)
+
+    def _recordFilter(self,batch,steps,lowHz,highHz,order):
+        """
+        ---zero phase Butterworth band pass of padded records with one real FFT---
+        """
+        numPad=1<<int(math.ceil(math.log2(2*batch.shape[1])))
+        frequency=np.fft.rfftfreq(numPad)[None,:]/steps[:,None]
+        gain=np.ones_like(frequency)
+        if highHz is not None:
+            gain/=1.0+(frequency/highHz)**(2*order)
+        if lowHz is not None:
+            with np.errstate(divide="ignore"):
+                gain/=1.0+(lowHz/frequency)**(2*order)
+        return np.fft.irfft(np.fft.rfft(batch,numPad,axis=1)*gain,numPad,axis=1)[:,:batch.shape[1]]
+
+    def _recordBaseline(self,batch,steps,lengths,order):
+        """
+        ---fit a polynomial to the displacement of every record and remove its second derivative from the
+        acceleration, all records are solved with one batched least squares---
+        """
+        valid=np.arange(batch.shape[1])[None,:]<lengths[:,None]
+        velocity=np.concatenate([np.zeros((len(batch),1)),np.cumsum(0.5*(batch[:,1:]+batch[:,:-1]),axis=1)],
+                                axis=1)*steps[:,None]
+        displacement=np.concatenate([np.zeros((len(batch),1)),np.cumsum(0.5*(velocity[:,1:]+velocity[:,:-1]),
+                                                                         axis=1)],axis=1)*steps[:,None]
+        duration=(lengths-1)*steps
+        unit=np.arange(batch.shape[1])[None,:]*steps[:,None]/duration[:,None]
+        powers=unit[:,:,None]**np.arange(order+1)[None,None,:]*valid[:,:,None]
+        coefficient=np.linalg.solve(np.einsum("rni,rnj->rij",powers,powers)+1e-12*np.eye(order+1),
+                                    np.einsum("rni,rn->ri",powers,displacement*valid)[:,:,None])[:,:,0]
+        degree=np.arange(2,order+1)
+        secondDerivative=(coefficient[:,2:]*degree*(degree-1))[:,None,:]*unit[:,:,None]**(degree-2)
+        return (batch-secondDerivative.sum(axis=2)/duration[:,None]**2)*valid
+
     def define_LoadPatterns_Add(self,name,myType,SelfWTMultiplier=0,AddLoadCase=True):
         """
         ---This function adds a new load pattern---
@@ -1618,7 +3719,7 @@ class SAP2000Py():
             load case, the state at the end of that case is used. If the initial case is anything else, zero initial
             conditions are assumed.
         """
-        self.SapModel.LoadCases.StaticNonlinearMultistep.SetInitialCase(name,initialCase)
+        self.SapModel.LoadCases.StaticNonlinear.SetInitialCase(name,initialCase)
 
     def define_loadCases_StaticNonlinear_SetLoadApplication(self,name,LoadControl,DispType,Displ,Monitor,DOF,
                                                             PointName,GDispl):
@@ -2641,8 +4742,37 @@ class SAP2000Py():
             points will not merge and two point objects will exist at the same location.
         MergeNumber(int)-Two points objects in the same location will merge only if their merge number assignments
             are the same. By default all pointobjects have a merge number of zero.
+        return:
+        [index,Name]
+        Name(str)-The name that the program ultimately assigns for the point object.
+        """
+        result=self.SapModel.PointObj.AddCartesian(x,y,z,Name,UserName,CSys,MergeOff,MergeNumber)
+        return result
+
+    def assign_PointObj_AddCartesianBulk(self,xyz,UserName=None,CSys="Global",MergeOff=False,MergeNumber=0):
+        """
+        ---This function adds many point objects to a model from a coordinate array and returns the names the program
+        ultimately assigns to them, in the same order as the coordinate rows---
+        inputs:
+        xyz(float array)-An (N,3) array of the X,Y,Z coordinates of the added point objects in the specified
+            coordinate system. [L]
+        UserName(str list)-This is None or a list of N optional user specified names for the point objects.
+        CSys(str)-The name of the coordinate system in which the joint coordinates are defined.
+        MergeOff(bool)-If this item is False, a new point object that is added at the same location as an existing
+            point object will be merged with the existing point object, see assign_PointObj_AddCartesian.
+        MergeNumber(int)-Two points objects in the same location will merge only if their merge number assignments
+            are the same.
+        return:
+        pointNames(str list)-The names of the point objects, one for each row of xyz.
         """
-        self.SapModel.PointObj.AddCartesian(x,y,z,Name,UserName,CSys,MergeOff,MergeNumber)
+        xyz=np.asarray(xyz,dtype=float).reshape(-1,3)
+        if UserName is None:
+            UserName=["" for each in range(len(xyz))]
+        pointNames=[]
+        for (x,y,z),userName in zip(xyz.tolist(),UserName):
+            result=self.assign_PointObj_AddCartesian(x,y,z,"",userName,CSys,MergeOff,MergeNumber)
+            pointNames.append(result[-1])
+        return pointNames
 
     def assign_PointObj_AddCylindrical(self,r,theta,z,Name="",UserName="",CSys="Global",MergeOff=False,MergeNumber=0):
         """
@@ -3015,7 +5145,7 @@ class SAP2000Py():
         Replace(bool)-If this item is True, all previous joint constraints, if any, assigned to the specified
             point object(s) are deleted before making the new assignment.
         """
-        self.SapModel.PointObj.SetConstraint(name,ConstraintName)
+        self.SapModel.PointObj.SetConstraint(name,ConstraintName,ItemType,Replace)
 
     def assign_PointObj_SetGroupAssign(self,name,GroupName,Remove=False,ItemType=0):
         """
@@ -3163,7 +5293,7 @@ class SAP2000Py():
             If this item is SelectedObjects, the load assignment is made to all selected point objects and the Name
             item is ignored.
         """
-        self.SapModel.PointObj.SetRestraint(name,value,itemType)
+        return self.SapModel.PointObj.SetRestraint(name,value,itemType)
 
 
 
@@ -3194,7 +5324,7 @@ class SAP2000Py():
             are deleted prior to making the assignment. If it is False, the spring assignments are added to any
             existing assignments.
         """
-        self.SapModel.PointObj.SetSpring(name,k,ItemType,IsLocalCSys,Replace)
+        return self.SapModel.PointObj.SetSpring(name,k,ItemType,IsLocalCSys,Replace)
 
     def assign_PointObj_SetSpringCoupled(self,name,k,ItemType=0,IsLocalCSys=False,Replace=False):
         """
@@ -3237,7 +5367,102 @@ class SAP2000Py():
             are deleted prior to making the assignment. If it is False, the spring assignments are added to any
             existing assignments.
         """
-        self.SapModel.PointObj.SetSpringCoupled(name,k,ItemType,IsLocalCSys,Replace)
+        return self.SapModel.PointObj.SetSpringCoupled(name,k,ItemType,IsLocalCSys,Replace)
+
+    def assign_PointObj_SetRestraintBulk(self,names,mask,KeepGroups=False,GroupPrefix="_restraintGroup"):
+        """
+        ---This function assigns restraints to many point objects from a boolean array. By default it still makes one
+        SetRestraint call per point: the call count only drops with KeepGroups=True or with groups kept by earlier
+        bulk calls. Identical rows are found with np.unique. With KeepGroups=True, each distinct restraint pattern shared by several points is assigned once to
+        a group of these points; the groups stay in the model and are reused by later bulk calls on the same set of
+        points, so that e.g. a reassignment costs one call per distinct pattern. The groups take names not used by
+        the groups of the model. A group that is no longer in the model is replaced by assignments to the points---
+        inputs:
+        names(str list)-The names of N existing point objects.
+        mask(bool array)-An (N,6) array of restraint values U1,U2,U3,R1,R2,R3 of each point object.
+        KeepGroups(bool)-If this item is True, a group is created for every pattern shared by several points and kept
+            in the model for reuse. If it is False, only groups kept by earlier bulk calls are used and no group is
+            created, since a group that is used once costs more calls than it saves.
+        GroupPrefix(str)-The name prefix of the groups.
+        return:
+        {"patterns":int,"issued":int}
+        patterns(int)-The number of distinct restraint patterns.
+        issued(int)-The number of SAP2000 calls issued, including the group definition calls.
+        """
+        mask=np.asarray(mask,dtype=bool).reshape(-1,6)
+        return self._pointObjBulkAssign(names,mask,lambda name,row,itemType:
+                                        self.assign_PointObj_SetRestraint(name,row,itemType),KeepGroups,GroupPrefix)
+
+    def assign_PointObj_SetSpringBulk(self,names,k,IsLocalCSys=False,Replace=True,KeepGroups=False,
+                                      GroupPrefix="_springGroup"):
+        """
+        ---This function assigns uncoupled or coupled springs to many point objects from a stiffness array. By default
+        it still makes one call per point, the call count only drops with groups, see
+        assign_PointObj_SetRestraintBulk: identical rows are found with np.unique and with KeepGroups=True each
+        distinct spring shared by several points is assigned once to a group of these points---
+        inputs:
+        names(str list)-The names of N existing point objects.
+        k(float array)-An (N,6) array of uncoupled spring stiffness values (see assign_PointObj_SetSpring) or an (N,21)
+            array of coupled spring stiffness values (see assign_PointObj_SetSpringCoupled).
+        IsLocalCSys(bool)-If this item is True, the springs are in the point object local coordinate system,
+            otherwise in the Global coordinate system.
+        Replace(bool)-If this item is True, all existing point spring assignments to the point objects are deleted
+            prior to making the assignment.
+        KeepGroups(bool)-see assign_PointObj_SetRestraintBulk.
+        GroupPrefix(str)-The name prefix of the groups.
+        return:
+        {"patterns":int,"issued":int}
+        """
+        k=np.asarray(k,dtype=float)
+        if k.ndim!=2 or k.shape[1] not in (6,21):
+            raise ValueError("k must be an (N,6) or (N,21) array")
+        if k.shape[1]==6:
+            setter=lambda name,row,itemType:self.assign_PointObj_SetSpring(name,row,itemType,IsLocalCSys,Replace)
+        else:
+            setter=lambda name,row,itemType:self.assign_PointObj_SetSpringCoupled(name,row,itemType,IsLocalCSys,
+                                                                                   Replace)
+        return self._pointObjBulkAssign(names,k,setter,KeepGroups,GroupPrefix)
+
+    def _pointObjBulkAssign(self,names,rows,setter,KeepGroups,GroupPrefix):
+        """
+        ---assign each distinct row of rows once, to a group of the points sharing it when that pays off---
+        """
+        names=[str(each) for each in names]
+        if len(names)!=len(rows):
+            raise ValueError("names and the value array must have the same length")
+        uniqueRows,inverse=np.unique(rows,axis=0,return_inverse=True)
+        inverse=inverse.ravel()
+        order=np.argsort(inverse,kind="stable")
+        members=np.split(np.array(names,dtype=object)[order],np.cumsum(np.bincount(inverse))[:-1])
+        groupNames=self._groupNamesFree(GroupPrefix)
+        issued=0
+        for row,eachMembers in zip(uniqueRows.tolist(),members):
+            key=("PointObj",tuple(sorted(eachMembers)))
+            groupName=self._bulkGroups.get(key)
+            if groupName is None and len(eachMembers)>1 and KeepGroups:
+                groupName=next(groupNames)
+                self.define_Groups_SetGroupFromObjects(groupName,"PointObj",key[1])
+                self._bulkGroups[key]=groupName
+                issued+=len(eachMembers)+1
+            if groupName is not None:
+                issued+=1
+                if self._retCode(setter(groupName,row,1))==0:
+                    continue
+                # the group is not in the model any more, e.g. it was deleted by hand
+                del self._bulkGroups[key]
+            for eachName in eachMembers:
+                setter(eachName,row,0)
+            issued+=len(eachMembers)
+        return {"patterns":len(uniqueRows),"issued":issued}
+
+    @staticmethod
+    def _retCode(result):
+        """
+        ---the return code of a SAP2000 call, the first item when the call also returns ByRef items---
+        """
+        if isinstance(result,(tuple,list)):
+            return result[0]
+        return 0 if result is None else result
 
     def assign_FrameObj_AddByCoord(self,xi,yi,zi,xj,yj,zj,propName="Default",userName="",Csys="Global"):
         """
@@ -3260,6 +5485,7 @@ class SAP2000Py():
         #that name is not used for another frame, cable or tendon object, the UserName is assigned to the
         #frame object, otherwise a default name is assigned to the frame object.
         name=""
+        propName=self.define_registry_Resolve("frameSection",propName)
         self.SapModel.FrameObj.AddByCoord(xi,yi,zi,xj,yj,zj,name,propName,userName,Csys)
 
     def assign_FrameObj_AddByPoint(self,Point1,Point2,propName="Default",userName=""):
@@ -3280,6 +5506,7 @@ class SAP2000Py():
         # that name is not used for another frame, cable or tendon object, the UserName is assigned to the
         # frame object, otherwise a default name is assigned to the frame object.
         name = ""
+        propName=self.define_registry_Resolve("frameSection",propName)
         self.SapModel.FrameObj.AddByPoint(Point1,Point2,name,propName,userName)
 
     def assign_FrameObj_ChangeName(self,name,newName):
@@ -3660,6 +5887,99 @@ class SAP2000Py():
         """
         self.SapModel.FrameObj.SetLoadTemperature(name,loadPat,myType,Val,PatternName,Replace,itemType)
 
+    def assign_FrameObj_SetLoadTable(self,table,RelDist=True,GroupPrefix="_frameLoadGroup"):
+        """
+        ---This function assigns a table of frame loads. Rows with identical load parameters are collapsed into one
+        assignment per set of frames; when the same set of frames receives several distinct loads, the frames are
+        collected in a temporary group once and every load is assigned to the group with ItemType=1. The temporary
+        groups take names not used by the groups of the model and are deleted afterwards. All loads are added to the
+        existing loads (Replace=False): a row repeated for the same frame is assigned as many times as it is given.
+        ---
+        inputs:
+        table(list)-Rows of [frame,pattern,type,dir,dist1,dist2,val1,val2,csys]
+            frame(str)-The name of an existing frame object.
+            pattern(str)-The name of a defined load pattern.
+            type(str)-One of the following load types:
+                "DistForce","DistMoment"-distributed load, assign_FrameObj_SetLoadDistributed with MyType=1 or 2
+                "PointForce","PointMoment"-point load at dist1 with value val1, assign_FrameObj_SetLoadPoint
+                "Temperature"-temperature load of value val1, dir is the temperature load type 1, 2 or 3 of
+                    assign_FrameObj_SetLoadTemperature
+                "Gravity"-gravity multiplier val1 in the X (dir=4), Y (dir=5) or Z (dir=6) direction of csys, rows of
+                    the same frame, pattern and csys are summed, assign_FrameObj_SetLoadGravity
+            dir(int)-The load direction, see assign_FrameObj_SetLoadDistributed.
+            dist1,dist2(float)-The start and end distances of the load, unused items can be 0.
+            val1,val2(float)-The start and end values of the load, unused items can be 0.
+            csys(str)-Local or the name of a defined coordinate system.
+        RelDist(bool)-If this item is True, the distances are relative distances, otherwise actual distances.
+        GroupPrefix(str)-The name prefix of the temporary groups.
+        return:
+        {"rows":int,"loads":int,"loadCalls":int,"groupAssignCalls":int}
+        """
+        gravity={}
+        loads={}
+        for frame,pattern,loadType,Dir,dist1,dist2,val1,val2,csys in table:
+            if loadType=="Gravity":
+                if Dir not in (4,5,6):
+                    raise ValueError("the direction of a Gravity row must be 4, 5 or 6, not "+str(Dir))
+                multiplier=gravity.setdefault((str(frame),pattern,csys),[0.0,0.0,0.0])
+                multiplier[int(Dir)-4]+=float(val1)
+                continue
+            if loadType in ("DistForce","DistMoment"):
+                parameters=(int(Dir),float(dist1),float(dist2),float(val1),float(val2),csys)
+            elif loadType in ("PointForce","PointMoment"):
+                parameters=(int(Dir),float(dist1),float(val1),csys)
+            elif loadType=="Temperature":
+                parameters=(int(Dir),float(val1))
+            else:
+                raise ValueError("unknown frame load type: "+str(loadType))
+            # {frame:number of rows}, every row of a frame adds one load
+            frames=loads.setdefault((pattern,loadType,parameters),{})
+            frames[str(frame)]=frames.get(str(frame),0)+1
+        for (frame,pattern,csys),(x,y,z) in gravity.items():
+            loads.setdefault((pattern,"Gravity",(x,y,z,csys)),{})[frame]=1
+        numRows=len(table)
+        frameSets={}
+        for key,frames in loads.items():
+            # the n-th assignment of a load goes to the frames with at least n rows of it
+            for count in range(max(frames.values())):
+                frameSets.setdefault(tuple(sorted(frame for frame,number in frames.items() if number>count)),
+                                     []).append(key)
+        loadCalls=0
+        groupAssignCalls=0
+        groupNames=self._groupNamesFree(GroupPrefix)
+        for frames,keys in frameSets.items():
+            # a group costs SetGroup, one SetGroupAssign per frame and Delete, and then one call per load
+            useGroup=len(frames)>1 and len(frames)*len(keys)>len(frames)+2+len(keys)
+            if useGroup:
+                groupName=next(groupNames)
+                self.define_Groups_SetGroupFromObjects(groupName,"FrameObj",frames)
+                groupAssignCalls+=len(frames)
+                targets,itemType=[groupName],1
+            else:
+                targets,itemType=frames,0
+            for pattern,loadType,parameters in keys:
+                for eachTarget in targets:
+                    if loadType in ("DistForce","DistMoment"):
+                        Dir,dist1,dist2,val1,val2,csys=parameters
+                        myType=1 if loadType=="DistForce" else 2
+                        self.assign_FrameObj_SetLoadDistributed(eachTarget,pattern,myType,Dir,dist1,dist2,val1,val2,
+                                                                csys,RelDist,False,itemType)
+                    elif loadType in ("PointForce","PointMoment"):
+                        Dir,dist1,val1,csys=parameters
+                        myType=1 if loadType=="PointForce" else 2
+                        self.assign_FrameObj_SetLoadPoint(eachTarget,pattern,myType,Dir,dist1,val1,csys,RelDist,
+                                                          False,itemType)
+                    elif loadType=="Temperature":
+                        Dir,val1=parameters
+                        self.assign_FrameObj_SetLoadTemperature(eachTarget,pattern,Dir,val1,"",False,itemType)
+                    else:
+                        x,y,z,csys=parameters
+                        self.assign_FrameObj_SetLoadGravity(eachTarget,pattern,x,y,z,False,csys,itemType)
+                    loadCalls+=1
+            if useGroup:
+                self.define_Groups_Delete(groupName)
+        return {"rows":numRows,"loads":len(loads),"loadCalls":loadCalls,"groupAssignCalls":groupAssignCalls}
+
     def assign_FrameObj_SetLoadTransfer(self,name,Val,itemType=0):
         """
         ---This function returns the load transfer option for frame objects.  It indicates whether the frame
@@ -3891,6 +6211,7 @@ class SAP2000Py():
             frame object. This item is ignored when the sVarTotalLengthitem is 0.This item is applicable only when the
             assigned frame section property is a nonprismatic section, and the sVarTotalLengthitem is greater than zero.
         """
+        propName=self.define_registry_Resolve("frameSection",propName)
         self.SapModel.FrameObj.SetSection(name,propName,itemType,sVarTotalLength,sVarRelStartLoc)
 
     def assign_FrameObj_SetSpring(self,name,myType,s=0,simpleSpringType=1,LinkProp="",springLocalOneType=1,Dir=1,
@@ -5580,6 +7901,7 @@ class SAP2000Py():
         # used for another area object, the UserName is assigned to the area object; otherwise a default name is
         # assigned to the area object.
         name = ""
+        PropName=self.define_registry_Resolve("areaSection",PropName)
         self.SapModel.AreaObj.AddByCoord(NumberPoints,x,y,z,name,PropName,UserName,CSys)
 
     def assign_AreaObj_AddByPoint(self,NumberPoints,Point,PropName="Default",UserName=""):
@@ -5594,13 +7916,18 @@ class SAP2000Py():
             area object. If it is the name of a defined area property, that property is assigned to the area object.
         UserName(str)-This is an optional user specified name for the area object. If a UserName is specified and
             that name is already used for another area object, the program ignores the UserName.
+        return:
+        [index,Point,Name]
+        Name(str)-The name that the program ultimately assigns to the area object.
         """
         # This is the name that the program ultimately assigns to the area object. If no UserName is specified,
         # the program assigns a default name to the area object. If a UserName is specified and that name is not
         # used for another area object, the UserName is assigned to the area object; otherwise a default name is
         # assigned to the area object.
         name = ""
-        self.SapModel.AreaObj.AddByPoint(NumberPoints,Point,name,PropName,UserName)
+        PropName=self.define_registry_Resolve("areaSection",PropName)
+        result=self.SapModel.AreaObj.AddByPoint(NumberPoints,Point,name,PropName,UserName)
+        return result
 
     def assign_AreaObj_ChangeName(self,name,NewName):
         """
@@ -6069,6 +8396,7 @@ class SAP2000Py():
             If this item is Group, all of the frame objects in the group specified by the Name item are deleted.
             If this item is SelectedObjects, all selected frame objects are deleted, and the Name item is ignore
         """
+        PropName=self.define_registry_Resolve("areaSection",PropName)
         self.SapModel.AreaObj.SetProperty(name,PropName,itemType)
 
     def assign_AreaObj_SetSpring(self,name,myType,s,simpleSpringType,LinkProp,Face,SpringLocalOneType,Dir,
@@ -6675,6 +9003,225 @@ class SAP2000Py():
         result=self.SapModel.AreaObj.GetTransformationMatrix(name)
         return result
 
+    def assign_AreaObj_MeshQuadrilateral(self,corners,n1,n2,elemType="Quad"):
+        """
+        ---This function generates a structured mesh of a rectangular or skewed four-sided region (e.g. a bridge
+        deck) on the python side. The mesh is produced by bilinear mapping of the four corner points, so that the
+        mesh density is fully controlled by the caller and no SAP2000 call is made---
+        inputs:
+        corners(float array)-A (4,3) array of the corner coordinates, ordered clockwise or counter clockwise. [L]
+        n1(int)-The number of divisions along the edge from corner 1 to corner 2.
+        n2(int)-The number of divisions along the edge from corner 2 to corner 3.
+        elemType(str)-"Quad" for four-node elements or "Tri" for three-node elements (each quad split in two).
+        return:
+        [nodes,elemPtr,elemNodes]
+        nodes(float array)-An (N,3) array of the node coordinates. [L]
+        elemPtr(int array)-An (M+1,) array of offsets into elemNodes, the nodes of element i are
+            elemNodes[elemPtr[i]:elemPtr[i+1]].
+        elemNodes(int array)-The flat array of node indices of all elements.
+        """
+        corners=np.asarray(corners,dtype=float).reshape(4,3)
+        s=np.linspace(0.0,1.0,n1+1)
+        t=np.linspace(0.0,1.0,n2+1)
+        S,T=np.meshgrid(s,t)
+        S=S.reshape(-1,1)
+        T=T.reshape(-1,1)
+        nodes=((1-S)*(1-T)*corners[0]+S*(1-T)*corners[1]+S*T*corners[2]+(1-S)*T*corners[3])
+        i,j=np.meshgrid(np.arange(n1),np.arange(n2))
+        k=(j*(n1+1)+i).ravel()
+        quads=np.column_stack((k,k+1,k+n1+2,k+n1+1))
+        return self._areaMeshConnectivity(nodes,quads,elemType)
+
+    def assign_AreaObj_MeshPolygon(self,outline,meshSize,openings=None,z=0.0,elemType="Quad"):
+        """
+        ---This function generates a structured mesh of a planar polygonal slab with optional openings on the
+        python side. The slab lies in a plane of constant global Z. The grid lines pass through every vertex
+        of the outline and the openings, and are subdivided so that no element side exceeds meshSize. Grid cells
+        that no slanted edge crosses become quads when they are inside the slab. A cell crossed by slanted edges is
+        split along them into convex pieces, with the nodes at the crossings shared by the neighbouring cells, and
+        the pieces inside the slab become quads or triangles (a piece with more than four corners is split into
+        triangles). The mesh covers the slab exactly, curved edges are followed as the given polylines---
+        inputs:
+        outline(float array)-A (P,2) array of the X,Y coordinates of the slab outline. [L]
+        meshSize(float)-The maximum element side length. [L]
+        openings(list)-None or a list of (Q,2) arrays of the X,Y coordinates of each opening. [L]
+        z(float)-The global Z coordinate of the slab. [L]
+        elemType(str)-"Quad" for four-node elements (with triangles in the cells crossed by slanted edges) or "Tri"
+            for three-node elements only.
+        return:
+        [nodes,elemPtr,elemNodes]
+        nodes(float array)-An (N,3) array of the node coordinates. [L]
+        elemPtr(int array)-An (M+1,) array of offsets into elemNodes, the nodes of element i are
+            elemNodes[elemPtr[i]:elemPtr[i+1]].
+        elemNodes(int array)-The flat array of node indices of all elements.
+        """
+        outline=np.asarray(outline,dtype=float).reshape(-1,2)
+        if openings is None:
+            openings=[]
+        openings=[np.asarray(each,dtype=float).reshape(-1,2) for each in openings]
+        allVertex=np.vstack([outline]+openings)
+        tol=1e-9*max(np.ptp(outline[:,0]),np.ptp(outline[:,1]))
+
+        def gridLines(vertexCoord):
+            breaks=np.unique(vertexCoord)
+            breaks=breaks[np.concatenate(([True],np.diff(breaks)>tol))]
+            lines=[breaks[:1]]
+            for start,end in zip(breaks[:-1],breaks[1:]):
+                numDiv=max(int(math.ceil((end-start)/meshSize-1e-9)),1)
+                lines.append(np.linspace(start,end,numDiv+1)[1:])
+            return np.concatenate(lines)
+
+        def insideSlab(pts):
+            inside=self._areaPointsInPolygon(pts,outline,tol,onEdge=True)
+            for eachOpening in openings:
+                inside&=~self._areaPointsInPolygon(pts,eachOpening,tol,onEdge=False)
+            return inside
+
+        xLine=gridLines(allVertex[:,0])
+        yLine=gridLines(allVertex[:,1])
+        nx=len(xLine)
+        X,Y=np.meshgrid(xLine,yLine)
+        gridXY=np.column_stack((X.ravel(),Y.ravel()))
+        i,j=np.meshgrid(np.arange(nx-1),np.arange(len(yLine)-1))
+        k=(j*nx+i).ravel()
+        cells=np.column_stack((k,k+1,k+nx+1,k+nx))
+        # the slanted edges run corner to corner of their box of cells, as every vertex is on two grid lines
+        cutLines={}
+        for polygon in [outline]+openings:
+            for start,end in zip(polygon,np.roll(polygon,-1,axis=0)):
+                if abs(end[0]-start[0])<=tol or abs(end[1]-start[1])<=tol:
+                    continue
+                a,b=end[1]-start[1],start[0]-end[0]
+                norm=math.hypot(a,b)
+                line=(a/norm,b/norm,-(a*start[0]+b*start[1])/norm)
+                i0,i1=np.searchsorted(xLine,np.sort((start[0],end[0]))-tol)
+                j0,j1=np.searchsorted(yLine,np.sort((start[1],end[1]))-tol)
+                for cell in (jj*(nx-1)+ii for jj in range(j0,j1) for ii in range(i0,i1)):
+                    distance=gridXY[cells[cell]].dot(line[:2])+line[2]
+                    if distance.min()<-tol and distance.max()>tol:
+                        cutLines.setdefault(cell,[]).append(line)
+        whole=np.setdiff1d(np.arange(len(cells)),np.fromiter(cutLines,dtype=int,count=len(cutLines)))
+        quads=cells[whole][insideSlab(gridXY[cells[whole]].mean(axis=1))]
+        pieces=[]
+        for cell,lines in cutLines.items():
+            cellPieces=[gridXY[cells[cell]]]
+            for line in lines:
+                cellPieces=[part for piece in cellPieces for part in self._areaSplitConvex(piece,line,tol)]
+            pieces.extend(cellPieces)
+        pieces=[piece for piece,inside in zip(pieces,insideSlab(np.array([each.mean(axis=0) for each in pieces])
+                                                                .reshape(-1,2))) if inside]
+        # the crossing nodes are shared by the pieces of both cells of a grid line
+        snap=1e3*tol
+        nodeIndex={key:index for index,key in enumerate(map(tuple,np.round(gridXY/snap).astype(np.int64).tolist()))}
+        nodeXY=list(gridXY)
+        pieceQuads,pieceTris=[],[]
+        for piece in pieces:
+            corners=[]
+            for point,key in zip(piece,map(tuple,np.round(piece/snap).astype(np.int64).tolist())):
+                if key not in nodeIndex:
+                    nodeIndex[key]=len(nodeXY)
+                    nodeXY.append(point)
+                corners.append(nodeIndex[key])
+            if len(corners)==4:
+                pieceQuads.append(corners)
+            else:
+                pieceTris.extend([corners[0],corners[each],corners[each+1]] for each in range(1,len(corners)-1))
+        quads=np.vstack((quads,np.array(pieceQuads,dtype=int).reshape(-1,4)))
+        tris=np.array(pieceTris,dtype=int).reshape(-1,3)
+        nodeXY=np.array(nodeXY)
+        nodes=np.column_stack((nodeXY,np.full(len(nodeXY),float(z))))
+        return self._areaMeshConnectivity(nodes,quads,elemType,tris)
+
+    def _areaSplitConvex(self,piece,line,tol):
+        """
+        ---split a convex counterclockwise polygon by the line a*x+b*y+c=0 (a,b of unit length), the parts keep the
+        orientation, corners closer than tol to the line belong to both parts---
+        """
+        distance=piece.dot(line[:2])+line[2]
+        distance[np.abs(distance)<=tol]=0.0
+        if distance.min()>=0.0 or distance.max()<=0.0:
+            return [piece]
+        positive,negative=[],[]
+        for index in range(len(piece)):
+            nextIndex=(index+1)%len(piece)
+            if distance[index]>=0.0:
+                positive.append(piece[index])
+            if distance[index]<=0.0:
+                negative.append(piece[index])
+            if distance[index]*distance[nextIndex]<0.0:
+                ratio=distance[index]/(distance[index]-distance[nextIndex])
+                crossing=piece[index]+ratio*(piece[nextIndex]-piece[index])
+                positive.append(crossing)
+                negative.append(crossing)
+        return [np.array(part) for part in (positive,negative) if len(part)>=3]
+
+    def assign_AreaObj_AddByMesh(self,nodes,elemPtr,elemNodes,PropName="Default",UserNamePrefix="",CSys="Global",
+                                 MergeOff=False):
+        """
+        ---This function creates the point objects and area objects of a python side mesh in bulk, e.g. a mesh
+        generated by assign_AreaObj_MeshQuadrilateral or assign_AreaObj_MeshPolygon. The object names are
+        returned in mesh order, so the mesh to object map is known without assign_AreaObj_GetElm calls---
+        inputs:
+        nodes(float array)-An (N,3) array of the node coordinates. [L]
+        elemPtr(int array)-An (M+1,) array of offsets into elemNodes.
+        elemNodes(int array)-The flat array of node indices of all elements.
+        PropName(str)-This is Default, None or the name of a defined area property assigned to all area objects.
+        UserNamePrefix(str)-If this item is not blank, the area objects are given the user names
+            UserNamePrefix+"1", UserNamePrefix+"2", ... in mesh order.
+        CSys(str)-The name of the coordinate system in which the node coordinates are defined.
+        MergeOff(bool)-If this item is False, mesh nodes are merged with existing point objects at the same location.
+        return:
+        [pointNames,areaNames]
+        pointNames(str list)-The point object name of each mesh node.
+        areaNames(str list)-The area object name of each mesh element.
+        """
+        elemPtr=np.asarray(elemPtr,dtype=int)
+        elemNodes=np.asarray(elemNodes,dtype=int)
+        pointNames=np.array(self.assign_PointObj_AddCartesianBulk(nodes,None,CSys,MergeOff),dtype=object)
+        areaNames=[]
+        for index,eachElem in enumerate(np.split(pointNames[elemNodes],elemPtr[1:-1])):
+            userName=UserNamePrefix+str(index+1) if UserNamePrefix else ""
+            result=self.assign_AreaObj_AddByPoint(len(eachElem),list(eachElem),PropName,userName)
+            areaNames.append(result[-1])
+        return [pointNames.tolist(),areaNames]
+
+    def _areaPointsInPolygon(self,pts,polygon,tol,onEdge):
+        """
+        ---vectorized even-odd test of many points against one polygon, points closer than tol to an edge are
+        reported as onEdge---
+        """
+        x=pts[:,0:1]
+        y=pts[:,1:2]
+        xi,yi=polygon[:,0],polygon[:,1]
+        xj,yj=np.roll(xi,-1),np.roll(yi,-1)
+        with np.errstate(divide="ignore",invalid="ignore"):
+            crossX=(xj-xi)*(y-yi)/(yj-yi)+xi
+            inside=(((yi>y)!=(yj>y))&(x<crossX)).sum(axis=1)%2==1
+            edgeX,edgeY=xj-xi,yj-yi
+            ratio=np.clip(((x-xi)*edgeX+(y-yi)*edgeY)/(edgeX**2+edgeY**2),0.0,1.0)
+        ratio=np.nan_to_num(ratio)
+        dist=np.hypot(xi+ratio*edgeX-x,yi+ratio*edgeY-y).min(axis=1)
+        onBoundary=dist<=tol
+        if onEdge:
+            return inside|onBoundary
+        return inside&~onBoundary
+
+    def _areaMeshConnectivity(self,nodes,quads,elemType,tris=None):
+        """
+        ---split quads into triangles if requested, drop unused nodes and pack the ragged connectivity---
+        """
+        if tris is None:
+            tris=np.zeros((0,3),dtype=int)
+        if elemType=="Tri":
+            tris=np.vstack((quads[:,[0,1,2]],quads[:,[0,2,3]],tris))
+            quads=np.zeros((0,4),dtype=int)
+        elif elemType!="Quad":
+            raise ValueError("elemType must be Quad or Tri")
+        usedNodes,inverse=np.unique(np.concatenate((quads.ravel(),tris.ravel())),return_inverse=True)
+        elemNodes=inverse.astype(int)
+        elemPtr=np.concatenate(([0],np.full(len(quads),4),np.full(len(tris),3))).cumsum()
+        return [nodes[usedNodes],elemPtr,elemNodes]
+
     def assign_SolidObj_AddByCoord(self,x,y,z,PropName="Default",UserName="",CSys="Global"):
         """
         ---This function adds a new solid object whose corner points are at the specified coordinates. Note that
@@ -6706,13 +9253,17 @@ class SAP2000Py():
         PropName(str)-This is either Default or the name of a defined solid property
         UserName(str)-This is an optional user specified name for the solid object. If a UserName is specified
             and that name is already used for another solid object, the program ignores the UserName
+        return:
+        [index,Point,Name]
+        Name(str)-The name that the program ultimately assigns for the solid object.
         """
         # This is the name that the program ultimately assigns for the solid object. If no UserName is specified,
         # the program assigns a default name to the solid object. If a UserName is specified and that name is not
         # used for another solid object, the UserName is assigned to the solid object; otherwise a default name is
         # assigned to the solid object.
         name = ""
-        self.SapModel.SolidObj.AddByPoint(Point,name,PropName,UserName)
+        result=self.SapModel.SolidObj.AddByPoint(Point,name,PropName,UserName)
+        return result
 
     def assign_SolidObj_Count(self):
         """
@@ -7317,6 +9868,102 @@ class SAP2000Py():
         result=self.SapModel.SolidObj.GetTransformationMatrix(Name)
         return result
 
+    def assign_SolidObj_MeshBlock(self,corners,n1,n2,n3,grading=(1.0,1.0,1.0)):
+        """
+        ---This function generates a structured hexahedral mesh of a six-sided block (e.g. a pier cap, an abutment
+        or a soil block) on the python side, by trilinear mapping of the eight corner points with optional
+        geometric grading along each local direction---
+        inputs:
+        corners(float array)-A (8,3) array of the block corner coordinates in the SAP2000 solid point order:
+            corner 2 follows corner 1 along the local 1 direction, corner 3 follows corner 1 along the local 2
+            direction, corner 4 is opposite to corner 1 on that face, and corners 5 to 8 are the corresponding
+            corners of the opposite face along the local 3 direction. [L]
+        n1,n2,n3(int)-The number of divisions along the local 1, 2 and 3 directions.
+        grading(float list)-The ratio of the last to the first element size along the local 1, 2 and 3 directions.
+            1.0 means uniform divisions.
+        return:
+        [nodes,connectivity]
+        nodes(float array)-An (N,3) array of the node coordinates. [L]
+        connectivity(int array)-An (M,8) array of the node indices of each solid, in the SAP2000 solid point order.
+        """
+        corners=np.asarray(corners,dtype=float).reshape(8,3)
+        r,s,t=np.meshgrid(self._solidGradedSpacing(n1,grading[0]),self._solidGradedSpacing(n2,grading[1]),
+                          self._solidGradedSpacing(n3,grading[2]),indexing="ij")
+        r,s,t=r.reshape(-1,1),s.reshape(-1,1),t.reshape(-1,1)
+        nodes=((1-r)*(1-s)*(1-t)*corners[0]+r*(1-s)*(1-t)*corners[1]+(1-r)*s*(1-t)*corners[2]+
+               r*s*(1-t)*corners[3]+(1-r)*(1-s)*t*corners[4]+r*(1-s)*t*corners[5]+
+               (1-r)*s*t*corners[6]+r*s*t*corners[7])
+        i,j,k=np.meshgrid(np.arange(n1),np.arange(n2),np.arange(n3),indexing="ij")
+        base=((i*(n2+1)+j)*(n3+1)+k).ravel()
+        step1,step2,step3=(n2+1)*(n3+1),n3+1,1
+        connectivity=np.column_stack((base,base+step1,base+step2,base+step1+step2,base+step3,base+step1+step3,
+                                      base+step2+step3,base+step1+step2+step3))
+        return [nodes,connectivity]
+
+    def assign_SolidObj_AddByPointBulk(self,nodes,connectivity,PropName="Default",GroupPrefix="",UserNamePrefix="",
+                                       CSys="Global",tol=1e-6):
+        """
+        ---This function creates many eight-node solid objects in one pass. Coincident nodes (e.g. the shared nodes
+        of several blocks generated by assign_SolidObj_MeshBlock and stacked together) are merged on the python side
+        by hashing their coordinates rounded to tol, so that each distinct node is sent to SAP2000 only once---
+        inputs:
+        nodes(float array)-An (N,3) array of the node coordinates. [L]
+        connectivity(int array)-An (M,8) array of the node indices of each solid, in the SAP2000 solid point order.
+        PropName(str or str list)-The solid property of all solids, or a list of M solid properties, one for each solid.
+        GroupPrefix(str)-If this item is not blank, the solids of each property are also collected in the group
+            GroupPrefix+PropName, which stays in the model (e.g. for selection). It costs one SetGroup per property
+            and one SetGroupAssign per solid on top of the AddByPoint calls, blank for no grouping.
+        UserNamePrefix(str)-If this item is not blank, the solids are given the user names UserNamePrefix+"1",
+            UserNamePrefix+"2", ... in connectivity order.
+        CSys(str)-The name of the coordinate system in which the node coordinates are defined.
+        tol(float)-Nodes closer than this distance in each coordinate are merged. [L]
+        return:
+        [pointNames,solidNames]
+        pointNames(str list)-The point object name of each row of nodes (merged nodes share a name).
+        solidNames(str list)-The solid object name of each row of connectivity.
+        """
+        nodes=np.asarray(nodes,dtype=float).reshape(-1,3)
+        connectivity=np.asarray(connectivity,dtype=int).reshape(-1,8)
+        if isinstance(PropName,str):
+            PropName=[PropName for each in range(len(connectivity))]
+        keys=np.round(nodes/tol).astype(np.int64)
+        nodeIndex={}
+        uniqueRow=[]
+        inverse=np.empty(len(nodes),dtype=int)
+        for row,eachKey in enumerate(map(tuple,keys.tolist())):
+            if eachKey not in nodeIndex:
+                nodeIndex[eachKey]=len(uniqueRow)
+                uniqueRow.append(row)
+            inverse[row]=nodeIndex[eachKey]
+        usedUnique,usedInverse=np.unique(inverse[connectivity],return_inverse=True)
+        uniqueNames=np.array(self.assign_PointObj_AddCartesianBulk(nodes[np.array(uniqueRow)[usedUnique]],None,CSys),
+                             dtype=object)
+        solidPoints=uniqueNames[usedInverse.reshape(-1,8)]
+        solidNames=[]
+        for index,(eachPoints,eachProp) in enumerate(zip(solidPoints.tolist(),PropName)):
+            userName=UserNamePrefix+str(index+1) if UserNamePrefix else ""
+            result=self.assign_SolidObj_AddByPoint(eachPoints,eachProp,userName)
+            solidNames.append(result[-1])
+        if GroupPrefix:
+            for eachProp in sorted(set(PropName)):
+                groupName=GroupPrefix+eachProp
+                self.define_Groups_SetGroup(groupName)
+                for eachSolid,solidProp in zip(solidNames,PropName):
+                    if solidProp==eachProp:
+                        self.assign_SolidObj_SetGroupAssign(eachSolid,groupName)
+        namesByUnique=np.full(len(uniqueRow),"",dtype=object)
+        namesByUnique[usedUnique]=uniqueNames
+        return [namesByUnique[inverse].tolist(),solidNames]
+
+    def _solidGradedSpacing(self,n,ratio):
+        """
+        ---n+1 normalized stations in [0,1] whose last to first interval ratio is ratio---
+        """
+        if n==1 or ratio==1.0:
+            return np.linspace(0.0,1.0,n+1)
+        sizes=ratio**(np.arange(n)/(n-1.0))
+        return np.concatenate(([0.0],np.cumsum(sizes)/sizes.sum()))
+
     def assign_LinkObj_AddByCoord(self,xi,yi,zi,xj,yj,zj,IsSingleJoint=False,PropName="Default",
                                   UserName="",CSys="Global"):
         """
@@ -7489,7 +10136,7 @@ class SAP2000Py():
             If this item is Group, all of the frame objects in the group specified by the Name item are deleted.
             If this item is SelectedObjects, all selected frame objects are deleted, and the Name item is ignore
         """
-        self.SapModel.LinkObj.SetProperty(Name,PropName,itemType)
+        return self.SapModel.LinkObj.SetProperty(Name,PropName,itemType)
 
     def assign_LinkObj_SetPropertyFD(self,Name,PropName,itemType=0):
         """
@@ -7788,6 +10435,506 @@ class SAP2000Py():
         """
         self.SapModel.Analyze.MergeAnalysisResults(FileName)
 
+    def analyze_PartitionCases(self,NumPartitions,Cases=None,Dependencies=None,Weights=None):
+        """
+        ---This function partitions load cases for a parallel analysis. A case is put in the same partition as its
+        initial and modal cases; an upstream case needed by cases of several partitions (e.g. a modal case used
+        by many response spectrum cases) is put in each of these partitions. The partitions are balanced on the
+        case weights with a greedy largest first rule---
+        inputs:
+        NumPartitions(int)-The number of partitions.
+        Cases(str list)-The cases to be run, None for all cases of analyze_GetCaseStatus, or for the dirty cases
+            with analyze_DirtyCases_Enable.
+        Dependencies(dict)-{case:[upstreamCase,...]}, upstream cases added to the initial and modal cases of each
+            case, which are read from SAP2000 (or known by analyze_DirtyCases_Enable while it is enabled).
+        Weights(dict)-{case:float}, the expected run time of the cases, 1.0 for the cases not given.
+        return:
+        partitions(list)-[[case,...],...], the cases of each partition, empty partitions are removed
+        """
+        if Cases is None:
+            if self._dirty is not None:
+                Cases=self.analyze_DirtyCases_GetRunCases()[1]
+            else:
+                Cases=list(self.analyze_GetCaseStatus()[2])
+        upstream={}
+        for case,upstreamCases in (Dependencies or {}).items():
+            upstream.setdefault(case,set()).update(upstreamCases)
+        graph=self._dirty if self._dirty is not None else self._loadCaseLinks()
+        if graph is not None:
+            for relation in ("modalCase","initialCase"):
+                for case,upstreamCase in graph[relation].items():
+                    upstream.setdefault(case,set()).add(upstreamCase)
+        weights=Weights or {}
+
+        def closure(case):
+            cases=set()
+            stack=[case]
+            while stack:
+                each=stack.pop()
+                if each not in cases:
+                    cases.add(each)
+                    stack.extend(upstream.get(each,()))
+            return cases
+
+        selected=set(Cases)
+        needed=set()
+        for case in selected:
+            needed|=closure(case)-{case}
+        units=[closure(case) for case in Cases if case not in needed]
+        units.sort(key=lambda unit:-sum(weights.get(case,1.0) for case in unit))
+        partitions=[set() for each in range(NumPartitions)]
+        loads=[0.0]*NumPartitions
+        for unit in units:
+            added=[sum(weights.get(case,1.0) for case in unit-partition) for partition in partitions]
+            index=min(range(NumPartitions),key=lambda i:(loads[i]+added[i],added[i]))
+            partitions[index]|=unit
+            loads[index]+=added[index]
+        order={case:index for index,case in enumerate(Cases)}
+        return [sorted(partition,key=lambda case:(order.get(case,-1),case)) for partition in partitions if partition]
+
+    def analyze_SplitRunMerge(self,NumCopies,Cases=None,Dependencies=None,Weights=None,WorkDir=None,
+                              KeepCopies=False):
+        """
+        ---This function runs the load cases of the current model on several SAP2000 instances at once. The model is
+        saved, the cases are partitioned with analyze_PartitionCases, one copy of the model file is made per
+        partition, and each copy is opened and run by its own SAP2000 instance on its own thread with only the cases
+        of its partition enabled. The results of the copies are then merged into the current model with
+        analyze_MergeAnalysisResults. An upstream case shared by several partitions (e.g. the modal case of many
+        response spectrum cases) is run in each of them and merged once per partition, as a copy of the model file
+        does not carry the analysis results: its run time is spent once per partition, see "shared" in the return,
+        and Weights should keep the expensive upstream cases in few partitions. The copies are deleted also when a
+        run fails. The model must have a file path (file_Save) before this function is called---
+        inputs:
+        NumCopies(int)-The number of model copies run at the same time.
+        Cases,Dependencies,Weights-See analyze_PartitionCases.
+        WorkDir(str)-The folder of the copies, None for a folder named after the model next to the model file.
+            Copy i is WorkDir/part<i>/<model file name>.
+        KeepCopies(bool)-If this item is False, the copies are deleted after the merge.
+        return:
+        {"partitions":[[case,...],...],"files":[str,...],"wallTime":float,"status":{case:status},"shared":{case:int}}
+        status is the case status after the merge, 4 is finished, shared gives the number of partitions of the
+        cases run in more than one partition.
+        """
+        start=time.time()
+        partitions=self.analyze_PartitionCases(NumCopies,Cases,Dependencies,Weights)
+        masterFile=self.SapModel.GetModelFilename()
+        if not masterFile:
+            raise ValueError("the model must be saved with file_Save before analyze_SplitRunMerge")
+        if self._solverProfile is not None:
+            self._solverProfileApply()
+        self.file_Save(masterFile)
+        if WorkDir is None:
+            WorkDir=os.path.splitext(masterFile)[0]+"_split"
+        files=[]
+        try:
+            for index in range(len(partitions)):
+                partDir=os.path.join(WorkDir,"part"+str(index+1))
+                os.makedirs(partDir,exist_ok=True)
+                files.append(os.path.join(partDir,os.path.basename(masterFile)))
+                shutil.copyfile(masterFile,files[-1])
+            errors=[]
+            workers=[threading.Thread(target=self._splitWorker,args=(modelFile,cases,errors),daemon=True)
+                     for modelFile,cases in zip(files,partitions)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if errors:
+                raise errors[0]
+            for modelFile in files:
+                self.analyze_MergeAnalysisResults(modelFile)
+            if self._dirty is not None:
+                self._dirtyFinishRun()
+        finally:
+            if not KeepCopies:
+                for modelFile in files:
+                    shutil.rmtree(os.path.dirname(modelFile),ignore_errors=True)
+                if os.path.isdir(WorkDir) and not os.listdir(WorkDir):
+                    os.rmdir(WorkDir)
+        status=self.analyze_GetCaseStatus()
+        counts={}
+        for partition in partitions:
+            for case in partition:
+                counts[case]=counts.get(case,0)+1
+        return {"partitions":partitions,"files":files,"wallTime":time.time()-start,
+                "status":dict(zip(status[2],status[3])),
+                "shared":{case:count for case,count in counts.items() if count>1}}
+
+    def _splitWorker(self,modelFile,cases,errors):
+        """
+        ---one analyze_SplitRunMerge thread: its own COM apartment and SAP2000 instance run one model copy---
+        """
+        pythoncom.CoInitialize()
+        instance=None
+        try:
+            instance=type(self)()
+            instance.initializeNewModel()
+            instance.file_OpenFile(modelFile)
+            instance.analyze_SetRunCaseFlag("",False,True)
+            for case in cases:
+                instance.analyze_SetRunCaseFlag(case,True)
+            instance.analyze_RunAnalysis()
+            instance.file_Save(modelFile)
+        except Exception as error:
+            errors.append(error)
+        finally:
+            if instance is not None and instance.SapObject:
+                instance.SapObject.ApplicationExit(False)
+            pythoncom.CoUninitialize()
+
+    def analyze_SolverTune(self,Cases=None,SolverTypes=(0,1,2),ProcessTypes=(1,2),ParallelRuns=(1,0),Repeats=1,
+                           ProfilePath=None,Apply=True):
+        """
+        ---This function benchmarks the solver options of analyze_SetSolverOption_2 on a representative subset of
+        load cases. Every combination of solver type, process type and number of parallel runs is run Repeats times
+        with only the given cases enabled; the wall time (the fastest repeat) and, if psutil is installed, the peak
+        memory of the SAP2000 processes are recorded. The fastest combination is stored in the tuning profile under
+        the size bucket of the model (half decades of the number of point, frame, cable, tendon, area, solid and link
+        objects), and is used by analyze_RunAnalysis after analyze_SolverProfile_Enable. The run flags are restored
+        afterwards---
+        inputs:
+        Cases(str list)-The cases used for the benchmark, None for the cases whose run flag is set.
+        SolverTypes(int list)-The solver types to test, 0 = Standard, 1 = Advanced, 2 = Multi-threaded.
+        ProcessTypes(int list)-The process types to test, 0 = Auto, 1 = GUI process, 2 = Separate process.
+        ParallelRuns(int list)-The numbers of parallel runs to test, 0 = Auto, 1 = Serial, 2 to 8 = fixed.
+        Repeats(int)-The number of runs of every combination.
+        ProfilePath(str)-The tuning profile file, None for the default profile of analyze_SolverProfile_Enable.
+        Apply(bool)-If this item is True, the fastest combination is set, otherwise the options are restored.
+        return:
+        {"bucket":str,"objects":int,"best":{...},"results":[{...},...]}
+        every result is {"SolverType":int,"SolverProcessType":int,"NumberParallelRuns":int,"wallTime":float,
+        "peakMemory":int or None,"ret":int}, peakMemory in bytes, ret is the return value of RunAnalysis.
+        """
+        ProfilePath=ProfilePath or self._solverProfileDefaultPath()
+        runFlags=self.analyze_GetRunCaseFlag()
+        options=self.analyze_GetSolverOption_2()
+        if Cases is None:
+            Cases=[case for case,run in zip(runFlags[2],runFlags[3]) if run]
+        results=[]
+        for SolverType in SolverTypes:
+            for SolverProcessType in ProcessTypes:
+                for NumberParallelRuns in ParallelRuns:
+                    self.analyze_SetSolverOption_2(SolverType,SolverProcessType,NumberParallelRuns,options[4])
+                    self.analyze_SetRunCaseFlag("",False,True)
+                    for case in Cases:
+                        self.analyze_SetRunCaseFlag(case,True)
+                    wallTime,peakMemory,ret=None,None,0
+                    for each in range(Repeats):
+                        sampler=self._solverMemorySampler()
+                        start=time.perf_counter()
+                        ret=self.SapModel.Analyze.RunAnalysis()
+                        elapsed=time.perf_counter()-start
+                        memory=sampler()
+                        wallTime=elapsed if wallTime is None else min(wallTime,elapsed)
+                        if memory is not None:
+                            peakMemory=memory if peakMemory is None else max(peakMemory,memory)
+                    results.append({"SolverType":SolverType,"SolverProcessType":SolverProcessType,
+                                    "NumberParallelRuns":NumberParallelRuns,"wallTime":wallTime,
+                                    "peakMemory":peakMemory,"ret":ret})
+        succeeded=[result for result in results if not result["ret"]]
+        if not succeeded:
+            raise ValueError("the analysis failed with every solver option")
+        best=min(succeeded,key=lambda result:result["wallTime"])
+        objects,bucket=self._solverProfileBucket()
+        profile=self._solverProfileLoad(ProfilePath)
+        profile[bucket]={"SolverType":best["SolverType"],"SolverProcessType":best["SolverProcessType"],
+                         "NumberParallelRuns":best["NumberParallelRuns"],"wallTime":best["wallTime"],
+                         "objects":objects,"cases":list(Cases),"results":results,"time":time.time()}
+        directory=os.path.dirname(os.path.abspath(ProfilePath))
+        os.makedirs(directory,exist_ok=True)
+        with open(ProfilePath,"w") as f:
+            json.dump(profile,f,indent=1)
+        if Apply:
+            self.analyze_SetSolverOption_2(best["SolverType"],best["SolverProcessType"],best["NumberParallelRuns"],
+                                           options[4])
+        else:
+            self.analyze_SetSolverOption_2(options[1],options[2],options[3],options[4])
+        for case,run in zip(runFlags[2],runFlags[3]):
+            self.analyze_SetRunCaseFlag(case,run)
+        return {"bucket":bucket,"objects":objects,"best":best,"results":results}
+
+    def analyze_SolverProfile_Enable(self,ProfilePath=None):
+        """
+        ---This function enables the tuning profile. While it is enabled, analyze_RunAnalysis (and
+        analyze_RunAnalysisAsync, analyze_SplitRunMerge) first sets the solver options stored by analyze_SolverTune
+        for the size bucket of the model, if any---
+        inputs:
+        ProfilePath(str)-The tuning profile file, None for .sap2000py/solverProfile.json in the user folder.
+        """
+        self._solverProfile=ProfilePath or self._solverProfileDefaultPath()
+
+    def analyze_SolverProfile_Disable(self):
+        """
+        ---This function disables the tuning profile, the solver options of the model are used as set---
+        """
+        self._solverProfile=None
+
+    def analyze_SolverProfile_Get(self,ProfilePath=None):
+        """
+        ---This function retrieves the solver options of the tuning profile for the size bucket of the model---
+        inputs:
+        ProfilePath(str)-The tuning profile file, None for the enabled or the default profile.
+        return:
+        [bucket,entry]
+        bucket(str)-The size bucket of the model.
+        entry(dict)-The profile entry of the bucket written by analyze_SolverTune, None if the bucket is not tuned.
+        """
+        ProfilePath=ProfilePath or self._solverProfile or self._solverProfileDefaultPath()
+        objects,bucket=self._solverProfileBucket()
+        return [bucket,self._solverProfileLoad(ProfilePath).get(bucket)]
+
+    @staticmethod
+    def _solverProfileDefaultPath():
+        """
+        ---the tuning profile shared by all models of the user---
+        """
+        return os.path.join(os.path.expanduser("~"),".sap2000py","solverProfile.json")
+
+    @staticmethod
+    def _solverProfileLoad(ProfilePath):
+        """
+        ---the tuning profile {bucket:entry}, empty if the file does not exist---
+        """
+        if not os.path.exists(ProfilePath):
+            return {}
+        with open(ProfilePath) as f:
+            return json.load(f)
+
+    def _solverProfileBucket(self):
+        """
+        ---number of objects of the model and its half decade size bucket, e.g. "1e3.5" for 3162 to 9999 objects---
+        """
+        objects=sum(int(count) for count in (self.assign_PointObj_Count(),self.assign_FrameObj_Count(),
+                                             self.assign_CableObj_Count(),self.assign_TendonObj_Count(),
+                                             self.assign_AreaObj_Count(),self.assign_SolidObj_Count(),
+                                             self.assign_LinkObj_Count()))
+        halfDecades=int(math.floor(2*math.log10(max(objects,1))))
+        return objects,"1e"+str(halfDecades//2)+(".5" if halfDecades%2 else "")
+
+    def _solverProfileApply(self):
+        """
+        ---set the solver options of the enabled tuning profile for the size bucket of the model---
+        """
+        bucket,entry=self.analyze_SolverProfile_Get(self._solverProfile)
+        if entry is None:
+            return
+        StiffCase=self.analyze_GetSolverOption_2()[4]
+        self.analyze_SetSolverOption_2(entry["SolverType"],entry["SolverProcessType"],entry["NumberParallelRuns"],
+                                       StiffCase)
+
+    @staticmethod
+    def _solverMemorySampler(ProcessPattern=r"(?i)sap2000|sapfire|analyze"):
+        """
+        ---start sampling the memory of the SAP2000 processes on a thread, the returned function stops the sampling
+        and returns the peak resident memory in bytes, None without psutil---
+        """
+        if psutil is None:
+            return lambda:None
+        stop=threading.Event()
+        peak=[0]
+
+        def sample():
+            while True:
+                total=0
+                for process in psutil.process_iter(["name","memory_info"]):
+                    if process.info["name"] and process.info["memory_info"] and \
+                            re.search(ProcessPattern,process.info["name"]):
+                        total+=process.info["memory_info"].rss
+                peak[0]=max(peak[0],total)
+                if stop.wait(0.2):
+                    break
+
+        sampler=threading.Thread(target=sample,daemon=True)
+        sampler.start()
+
+        def finish():
+            stop.set()
+            sampler.join()
+            return peak[0]
+        return finish
+
+    def analyze_History_Enable(self,DatabasePath=None,PollInterval=1.0,Label=""):
+        """
+        ---This function enables the run history. While it is enabled, every analyze_RunAnalysis (and
+        analyze_RunAnalysisAsync) call is recorded in a SQLite database with the model file and its hash (sha1 of
+        the model file as saved by the run), the host, the solver options (analyze_GetSolverOption_2), the return
+        value, the wall time, the run flag and the final status of every case and the case status transitions
+        polled with analyze_GetCaseStatus on a separate COM thread every PollInterval seconds. The case status has no
+        running state, so the run time of a case is a coarse estimate: from the last poll where another case is seen
+        finished (or the start of the run) to the poll where the case is seen finished. It is rounded up to the poll
+        interval, cases finishing in the same poll or running in parallel share the interval, and it is missing if
+        the case is not seen finishing.
+        The database has the tables
+        runs(runId,start,wallTime,host,modelFile,modelHash,solverType,solverProcessType,numberParallelRuns,ret,label)
+        cases(runId,caseName,run,status,duration)
+        transitions(runId,caseName,status,time), time in seconds from the start of the run.---
+        inputs:
+        DatabasePath(str)-The database file, None for .sap2000py/runHistory.sqlite in the user folder.
+        PollInterval(float)-The seconds between two case status polls.
+        Label(str)-A label stored with the runs, e.g. the name of the design iteration, see analyze_History_SetLabel.
+        """
+        DatabasePath=DatabasePath or os.path.join(os.path.expanduser("~"),".sap2000py","runHistory.sqlite")
+        os.makedirs(os.path.dirname(os.path.abspath(DatabasePath)),exist_ok=True)
+        with sqlite3.connect(DatabasePath) as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS runs(runId INTEGER PRIMARY KEY,start REAL,wallTime REAL,host TEXT,
+                    modelFile TEXT,modelHash TEXT,solverType INTEGER,solverProcessType INTEGER,
+                    numberParallelRuns INTEGER,ret INTEGER,label TEXT);
+                CREATE TABLE IF NOT EXISTS cases(runId INTEGER,caseName TEXT,run INTEGER,status INTEGER,duration REAL);
+                CREATE TABLE IF NOT EXISTS transitions(runId INTEGER,caseName TEXT,status INTEGER,time REAL);
+                CREATE INDEX IF NOT EXISTS casesName ON cases(caseName);
+                CREATE INDEX IF NOT EXISTS runsStart ON runs(start);
+                """)
+        self._history={"path":DatabasePath,"pollInterval":PollInterval,"label":Label}
+
+    def analyze_History_Disable(self):
+        """
+        ---This function disables the run history---
+        """
+        self._history=None
+
+    def analyze_History_SetLabel(self,Label):
+        """
+        ---This function sets the label stored with the next runs---
+        inputs:
+        Label(str)-The label, e.g. "beam sections v3".
+        """
+        if self._history is None:
+            raise ValueError("the run history is not enabled")
+        self._history["label"]=Label
+
+    def analyze_History_Query(self,Sql,Parameters=()):
+        """
+        ---This function runs a SQL query on the run history database---
+        inputs:
+        Sql(str)-The query, see analyze_History_Enable for the tables.
+        Parameters(tuple)-The query parameters.
+        return:
+        rows(list)-[(value,...),...]
+        """
+        if self._history is None:
+            raise ValueError("the run history is not enabled")
+        with sqlite3.connect(self._history["path"]) as connection:
+            return connection.execute(Sql,Parameters).fetchall()
+
+    def analyze_History_SlowestCases(self,Days=30,Limit=20,ModelFile=None):
+        """
+        ---This function retrieves the cases with the largest run times of the last days---
+        inputs:
+        Days(float)-The period, in days before now.
+        Limit(int)-The number of cases.
+        ModelFile(str)-The model file, None for all models.
+        return:
+        rows(list)-[(caseName,modelFile,maxDuration,meanDuration,numberRuns),...] sorted by decreasing maxDuration
+        """
+        return self.analyze_History_Query(
+            "SELECT cases.caseName,runs.modelFile,MAX(cases.duration),AVG(cases.duration),COUNT(*) "
+            "FROM cases JOIN runs ON cases.runId=runs.runId "
+            "WHERE cases.duration IS NOT NULL AND runs.start>=? AND (? IS NULL OR runs.modelFile=?) "
+            "GROUP BY cases.caseName,runs.modelFile ORDER BY MAX(cases.duration) DESC LIMIT ?",
+            (time.time()-Days*86400.0,ModelFile,ModelFile,Limit))
+
+    def analyze_History_CaseTrend(self,CaseName,ModelFile=None):
+        """
+        ---This function retrieves the run times of one case over all its runs, a change of modelHash between two
+        runs shows a modification of the model, e.g. to find the regression of the case after a property change---
+        inputs:
+        CaseName(str)-The name of the case.
+        ModelFile(str)-The model file, None for all models.
+        return:
+        rows(list)-[(start,modelFile,modelHash,label,status,duration,solverType,solverProcessType,
+            numberParallelRuns),...] sorted by start
+        """
+        return self.analyze_History_Query(
+            "SELECT runs.start,runs.modelFile,runs.modelHash,runs.label,cases.status,cases.duration,runs.solverType,"
+            "runs.solverProcessType,runs.numberParallelRuns FROM cases JOIN runs ON cases.runId=runs.runId "
+            "WHERE cases.caseName=? AND cases.run=1 AND (? IS NULL OR runs.modelFile=?) ORDER BY runs.start",
+            (CaseName,ModelFile,ModelFile))
+
+    def _historyRun(self):
+        """
+        ---RunAnalysis with a status polling thread, the run is recorded in the run history---
+        """
+        before=self._historyBefore()
+        events=[]
+        stop=threading.Event()
+        poller=threading.Thread(target=self._historyPoller,
+                                args=(self._comMarshal(),stop,events,before["start"],self._history["pollInterval"]),
+                                daemon=True)
+        poller.start()
+        try:
+            ret=self.SapModel.Analyze.RunAnalysis()
+        finally:
+            stop.set()
+            poller.join()
+        self._historyRecord(before,events,ret)
+        return ret
+
+    def _historyBefore(self):
+        """
+        ---run flags, solver options and case status before a recorded run---
+        """
+        return {"start":time.time(),"runFlags":self.analyze_GetRunCaseFlag(),"options":self.analyze_GetSolverOption_2(),
+                "status":self.analyze_GetCaseStatus()}
+
+    @staticmethod
+    def _historyPoller(stream,stop,events,start,PollInterval):
+        """
+        ---GetCaseStatus polls on its own COM apartment, (time,case,status) are appended to events---
+        """
+        pythoncom.CoInitialize()
+        try:
+            model=SAP2000Py._comUnmarshal(stream)
+            while not stop.wait(PollInterval):
+                status=model.Analyze.GetCaseStatus()
+                elapsed=time.time()-start
+                events.extend((elapsed,case,value) for case,value in zip(status[2],status[3]))
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _historyRecord(self,before,events,ret):
+        """
+        ---write one run, its cases and the status transitions to the run history database---
+        """
+        wallTime=time.time()-before["start"]
+        status=self.analyze_GetCaseStatus()
+        events=list(events)+[(wallTime,case,value) for case,value in zip(status[2],status[3])]
+        known=dict(zip(before["status"][2],before["status"][3]))
+        transitions=[]
+        for elapsed,case,value in sorted(events,key=lambda event:event[0]):
+            if known.get(case)!=value:
+                known[case]=value
+                transitions.append((case,value,elapsed))
+        finishTimes=sorted(elapsed for case,value,elapsed in transitions if value==4)
+        caseRows=[]
+        for case,run in zip(before["runFlags"][2],before["runFlags"][3]):
+            # status 3 is "not finished", not "running": a case starts at the latest earlier finish of another case
+            finished=[elapsed for each,value,elapsed in transitions if each==case and value==4]
+            duration=None
+            if finished:
+                caseStart=max([0.0]+[each for each in finishTimes if each<finished[-1]])
+                duration=finished[-1]-caseStart
+            caseRows.append((case,int(bool(run)),known.get(case),duration))
+        modelFile=self.SapModel.GetModelFilename()
+        modelHash=None
+        if modelFile and os.path.exists(modelFile):
+            digest=hashlib.sha1()
+            with open(modelFile,"rb") as f:
+                for block in iter(lambda:f.read(1<<20),b""):
+                    digest.update(block)
+            modelHash=digest.hexdigest()
+        options=before["options"]
+        with sqlite3.connect(self._history["path"]) as connection:
+            runId=connection.execute(
+                "INSERT INTO runs(start,wallTime,host,modelFile,modelHash,solverType,solverProcessType,"
+                "numberParallelRuns,ret,label) VALUES (?,?,?,?,?,?,?,?,?,?)",
+                (before["start"],wallTime,socket.gethostname(),modelFile,modelHash,options[1],options[2],options[3],
+                 ret,self._history["label"])).lastrowid
+            connection.executemany("INSERT INTO cases VALUES (?,?,?,?,?)",[(runId,)+row for row in caseRows])
+            connection.executemany("INSERT INTO transitions VALUES (?,?,?,?)",
+                                   [(runId,)+transition for transition in transitions])
+        return runId
+
     def analyze_ModifyUnDeformedGeometry(self,CaseName,SF,Stage=-1,Original=False):
         """
         ---This function modifies the undeformed geometry based on displacements obtained from a specified load case---
@@ -7801,6 +10948,176 @@ class SAP2000Py():
         """
         self.SapModel.Analyze.ModifyUnDeformedGeometry(CaseName,SF,Stage,Original)
 
+    def analyze_FormFinding(self,CaseName,Joints,Target=None,Tolerance=1e-3,MaxIterations=10,Stage=-1,
+                            Acceleration="aitken",Relaxation=1.0,RelaxationBounds=(0.1,2.0),StallRatio=0.01,
+                            Rollback="diverged",GroupName="_formFindingGroup"):
+        """
+        ---This function drives the form finding loop of analyze_ModifyUnDeformedGeometry: the case is run, the
+        deformed position of the monitored joints (undeformed geometry plus displacements) is compared with the
+        target geometry, and the undeformed geometry is modified by SF times the displacements of the case, until the
+        largest deviation is below Tolerance. As the geometry can only be moved along the displacements of the last
+        run, SF is the least squares factor -(e.u)/(u.u) of the deviation e and the displacements u, times a relaxation
+        factor; with Acceleration="aitken" the relaxation is updated from the last two deviations with the Aitken
+        delta-squared rule and kept within RelaxationBounds. The displacements of all monitored joints are read with
+        one results_JointDispl call on a group with only the case selected for output, the nonlinear static and
+        multistep static output is set to the last step. Only the case and its initial and modal cases (read from
+        SAP2000) are run, the run flags are restored at the end. The joint displacements are taken in the joint
+        local axes, which must be parallel to the global axes. The modifications are cumulative, so the part of the
+        deviation that is not parallel to the displacements (a change of the deflected shape between the iterations)
+        cannot be removed; the loop stops when the largest deviation decreases by less than StallRatio in two
+        successive iterations, or when it grows to more than twice the first one (diverged). The original geometry
+        can then be reinstated (Original=True)---
+        inputs:
+        CaseName(str)-The static, nonlinear static or staged construction case of the form finding.
+        Joints(str list or str)-The monitored point objects, or the name of a group of point objects.
+        Target(dict or array)-{joint:(x,y,z)} or an array (numJoints,3) in the order of Joints, None for the current
+            coordinates of the joints.
+        Tolerance(float)-The largest allowed deviation of a joint coordinate. [L]
+        MaxIterations(int)-The maximum number of analyses.
+        Stage(int)-The stage of a staged construction case, -1 for the last run stage.
+        Acceleration(str)-"aitken" or "none" for a fixed relaxation.
+        Relaxation(float)-The first (or the fixed) relaxation factor.
+        RelaxationBounds(tuple)-(min,max) of the Aitken relaxation factor.
+        StallRatio(float)-The relative decrease of the largest deviation below which an iteration is stalled.
+        Rollback(str)-"diverged" reinstates the original geometry when the loop diverged, "failed" whenever it did not
+            converge, None never.
+        GroupName(str)-The group created for the monitored joints when Joints is a list.
+        return:
+        {"converged":bool,"diverged":bool,"iterations":int,"rolledBack":bool,"joints":[str,...],
+         "deviation":array(numJoints,3),
+         "history":[{"iteration":int,"maxDeviation":float,"rmsDeviation":float,"SF":float,"relaxation":float},...]}
+        """
+        if MaxIterations<1:
+            raise ValueError("MaxIterations must be at least 1")
+        runCases=self._caseUpstream(CaseName)
+        if isinstance(Joints,str):
+            group=Joints
+            joints=None
+        else:
+            joints=[str(each) for each in Joints]
+            key=("PointObj",tuple(sorted(joints)))
+            group=self._bulkGroups.get(key)
+            if group is None:
+                group=GroupName
+                self.define_Groups_SetGroupFromObjects(group,"PointObj",key[1])
+                self._bulkGroups[key]=group
+        self.results_Setup_SetOptionNLStatic(3)
+        self.results_Setup_SetOptionMultiStepStatic(3)
+        history=[]
+        undeformed=None
+        previousDeviation=None
+        relaxation=Relaxation
+        converged=False
+        firstDeviation=None
+        diverged=False
+        stalled=0
+        runFlags=self.analyze_GetRunCaseFlag()
+        self.analyze_SetRunCaseFlag("",False,True)
+        for case in runCases:
+            self.analyze_SetRunCaseFlag(case,True)
+        try:
+            for iteration in range(MaxIterations):
+                # the analysis runs only the case and its prerequisites, also with the dirty case tracking
+                dirty=self._dirty
+                self._dirty=None
+                try:
+                    self.analyze_RunAnalysis()
+                finally:
+                    self._dirty=dirty
+                names,displacement=self._formFindingDispl(CaseName,group)
+                if joints is None:
+                    joints=names
+                order=[names.index(joint) for joint in joints] if names!=joints else slice(None)
+                displacement=displacement[order]
+                if undeformed is None:
+                    undeformed=np.array([self.assign_PointObj_GetCoordCartesian(joint)[1:4] for joint in joints],
+                                        dtype=float)
+                    if Target is None:
+                        target=undeformed.copy()
+                    elif isinstance(Target,dict):
+                        target=np.array([Target[joint] for joint in joints],dtype=float)
+                    else:
+                        target=np.asarray(Target,dtype=float).reshape(len(joints),3)
+                deviation=undeformed+displacement-target
+                maxDeviation=float(np.abs(deviation).max())
+                entry={"iteration":iteration+1,"maxDeviation":maxDeviation,
+                       "rmsDeviation":float(np.sqrt((deviation**2).mean())),"SF":0.0,"relaxation":relaxation}
+                history.append(entry)
+                if maxDeviation<=Tolerance:
+                    converged=True
+                    break
+                if firstDeviation is None:
+                    firstDeviation=maxDeviation
+                elif maxDeviation>2*firstDeviation:
+                    diverged=True
+                    break
+                else:
+                    previousMax=history[-2]["maxDeviation"]
+                    stalled=stalled+1 if maxDeviation>(1-StallRatio)*previousMax else 0
+                    if stalled==2:
+                        break
+                if iteration==MaxIterations-1:
+                    break
+                if Acceleration=="aitken" and previousDeviation is not None:
+                    change=(deviation-previousDeviation).ravel()
+                    if change.dot(change)>0:
+                        relaxation=-relaxation*previousDeviation.ravel().dot(change)/change.dot(change)
+                        relaxation=float(np.clip(relaxation,RelaxationBounds[0],RelaxationBounds[1]))
+                elif Acceleration not in ("aitken","none"):
+                    raise ValueError("Acceleration must be aitken or none")
+                direction=displacement.ravel()
+                if direction.dot(direction)==0:
+                    break
+                SF=-relaxation*deviation.ravel().dot(direction)/direction.dot(direction)
+                entry["SF"]=SF
+                entry["relaxation"]=relaxation
+                self.analyze_ModifyUnDeformedGeometry(CaseName,SF,Stage)
+                undeformed=undeformed+SF*displacement
+                previousDeviation=deviation
+        finally:
+            for case,run in zip(runFlags[2],runFlags[3]):
+                self.analyze_SetRunCaseFlag(case,run)
+        rolledBack=False
+        if not converged and (Rollback=="failed" or (Rollback=="diverged" and diverged)):
+            self.analyze_ModifyUnDeformedGeometry(CaseName,1.0,Stage,True)
+            rolledBack=True
+        return {"converged":converged,"diverged":diverged,"iterations":len(history),"rolledBack":rolledBack,
+                "joints":joints,
+                "deviation":deviation,"history":history}
+
+    def _caseUpstream(self,CaseName):
+        """
+        ---[CaseName,prerequisite,...]: the case and the initial and modal cases it needs, transitively, from the
+        relations read from SAP2000 (or known by the dirty case tracking)---
+        """
+        graph=self._dirty if self._dirty is not None else self._loadCaseLinks()
+        cases=[CaseName]
+        for case in cases:
+            for relation in ("initialCase","modalCase"):
+                upstream=(graph or {}).get(relation,{}).get(case)
+                if upstream and upstream not in cases:
+                    cases.append(upstream)
+        return cases
+
+    def _formFindingDispl(self,CaseName,group):
+        """
+        ---[joints,displacements(numJoints,3)] of the point objects of a group for one case, last result of each joint---
+        """
+        self.results_Setup_DeselectAllCasesAndCombosForOutput()
+        self.results_Setup_SetCaseSelectedForOutput(CaseName)
+        result=self.results_JointDispl(group,2)
+        objects=np.asarray(result[2],dtype=object)
+        cases=np.asarray(result[4],dtype=object)
+        values=np.column_stack([np.asarray(result[7+each],dtype=float) for each in range(3)])
+        rows=np.nonzero(cases==CaseName)[0]
+        if len(rows)==0:
+            raise ValueError("no joint displacement of the case "+CaseName)
+        last={}
+        for row in rows:
+            last[objects[row]]=row
+        names=list(last)
+        return [str(each) for each in names],values[[last[each] for each in names]]
+
     def analyze_RunAnalysis(self):
         """
         ---This function runs the analysis. The analysis model is automatically created as part of this function.
@@ -7808,9 +11125,455 @@ class SAP2000Py():
         IMPORTANT NOTE: Your model must have a file path defined before running the analysis. If the model is opened
         from an existing file, a file path is defined. If the model is created from scratch, the File.Save function
         must be called with a file name before running the analysis. Saving the file creates the file path.
+        With analyze_DirtyCases_Enable, only the dirty cases and their dependents are run. With
+        analyze_SolverProfile_Enable, the tuned solver options are set first. With analyze_History_Enable, the run
+        is recorded in the run history.
         ---
         """
-        self.SapModel.Analyze.RunAnalysis()
+        if self._solverProfile is not None:
+            self._solverProfileApply()
+        if self._dirty is not None:
+            self._dirtyPrepareRun()
+        if self._history is None:
+            self.SapModel.Analyze.RunAnalysis()
+        else:
+            self._historyRun()
+        if self._dirty is not None:
+            self._dirtyFinishRun()
+
+    async def analyze_RunAnalysisAsync(self,PollInterval=1.0,progress=None):
+        """
+        ---This coroutine runs the analysis like analyze_RunAnalysis without blocking the event loop, with the same
+        dirty case tracking, tuning profile and run history options. The solve is
+        called on a dedicated thread with its own COM apartment, while a second thread polls
+        analyze_GetCaseStatus every PollInterval seconds and a progress event is published for every case status
+        change. Other SAP2000Py instances of the process stay usable during the run, but this instance should not
+        be called until the coroutine returns---
+        inputs:
+        PollInterval(float)-The seconds between two case status polls.
+        progress(function)-If not None, progress(event) is called for each status change, it can be a coroutine
+            function. event is {"case":str,"status":int,"previous":int,"elapsed":float}, status and previous are
+            1 = Not run, 2 = Could not start, 3 = Not finished, 4 = Finished, previous is None for the first poll.
+        return:
+        [index,NumberItems,CaseName,Status]-The case status after the run, as analyze_GetCaseStatus
+        """
+        loop=asyncio.get_running_loop()
+        finished=loop.create_future()
+        statuses=asyncio.Queue()
+        stop=threading.Event()
+        runner=threading.Thread(target=self._asyncRunner,args=(self._comMarshal(),loop,finished,stop),daemon=True)
+        poller=threading.Thread(target=self._asyncPoller,args=(self._comMarshal(),loop,statuses,stop,PollInterval),
+                                daemon=True)
+        if self._solverProfile is not None:
+            self._solverProfileApply()
+        if self._dirty is not None:
+            self._dirtyPrepareRun()
+        before=self._historyBefore() if self._history is not None else None
+        start=time.time()
+        known={}
+        events=[]
+
+        async def publish(status):
+            for case,value in zip(status[2],status[3]):
+                if known.get(case)==value:
+                    continue
+                event={"case":case,"status":value,"previous":known.get(case),"elapsed":time.time()-start}
+                known[case]=value
+                events.append((event["elapsed"],case,value))
+                if progress is not None:
+                    reply=progress(event)
+                    if inspect.isawaitable(reply):
+                        await reply
+
+        poller.start()
+        runner.start()
+        while not finished.done():
+            getter=asyncio.ensure_future(statuses.get())
+            await asyncio.wait([getter,finished],return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                await publish(getter.result())
+            else:
+                getter.cancel()
+        await loop.run_in_executor(None,poller.join)
+        while not statuses.empty():
+            await publish(statuses.get_nowait())
+        ret=finished.result()
+        if before is not None:
+            before["start"]=start
+            self._historyRecord(before,events,ret)
+        if self._dirty is not None:
+            self._dirtyFinishRun()
+        result=self.analyze_GetCaseStatus()
+        await publish(result)
+        return result
+
+    def _comMarshal(self):
+        """
+        ---marshal SapModel for a call from another thread, see _comUnmarshal---
+        """
+        return pythoncom.CoMarshalInterThreadInterfaceInStream(pythoncom.IID_IDispatch,self.SapModel._oleobj_)
+
+    @staticmethod
+    def _comUnmarshal(stream):
+        """
+        ---SapModel proxy of the calling thread, the thread must have called pythoncom.CoInitialize---
+        """
+        return win32com.client.Dispatch(pythoncom.CoGetInterfaceAndReleaseStream(stream,pythoncom.IID_IDispatch))
+
+    def _asyncRunner(self,stream,loop,finished,stop):
+        """
+        ---RunAnalysis on its own COM apartment, the outcome is set to the finished future of the event loop---
+        """
+        pythoncom.CoInitialize()
+        try:
+            ret=self._comUnmarshal(stream).Analyze.RunAnalysis()
+            outcome=(finished.set_result,ret)
+        except Exception as error:
+            outcome=(finished.set_exception,error)
+        finally:
+            stop.set()
+            pythoncom.CoUninitialize()
+        loop.call_soon_threadsafe(*outcome)
+
+    def _asyncPoller(self,stream,loop,statuses,stop,PollInterval):
+        """
+        ---GetCaseStatus polls on its own COM apartment until the run thread stops---
+        """
+        pythoncom.CoInitialize()
+        try:
+            model=self._comUnmarshal(stream)
+            while not stop.wait(PollInterval):
+                loop.call_soon_threadsafe(statuses.put_nowait,model.Analyze.GetCaseStatus())
+        finally:
+            pythoncom.CoUninitialize()
+
+    def analyze_DirtyCases_Enable(self):
+        """
+        ---This function enables the dirty case tracking. While it is enabled, the define and assign functions
+        that modify the model are followed and analyze_RunAnalysis (and analyze_RunAnalysisAsync) only runs the
+        dirty cases and the cases that depend on them, the run flags of all other cases are set to False.
+        The relations of the existing cases (load patterns and functions of the case loads, modal and initial
+        cases) are read from SAP2000 when the tracking is enabled and when a model is initialized or opened, and
+        are then updated by the followed define_loadCases_* calls.
+        (1) a load case is dirty when one of its define_loadCases_* functions is called;
+        (2) a case is dirty when one of its load patterns receives a load assignment;
+        (3) a case is dirty when one of its time history or response spectrum functions is modified by a
+            define_functions_* function;
+        (4) a case depends on its modal case and on its initial case, the dependent cases of a dirty case are dirty;
+        (5) the relations of some cases cannot be read (staged construction, moving load, steady state, power
+            spectral density, multistep static), these cases are dirty after any followed modification;
+        (6) if the relations could not be read from SAP2000, a modified load pattern or function used by no known
+            case makes all cases dirty;
+        (7) any other modification (objects, properties, materials, constraints, mass source, ...) makes all cases
+            dirty, as do analyze_SetActiveDOF and analyze_ModifyUnDeformedGeometry;
+        (8) a case that is not finished (analyze_GetCaseStatus) is dirty.
+        All cases are dirty when the tracking is enabled or when a model is initialized or opened. Modifications
+        made in the SAP2000 application or directly through SapModel (e.g. the stage data of a staged construction
+        case) are not followed, mark them with analyze_DirtyCases_Mark. The run flags set by analyze_SetRunCaseFlag
+        are overwritten by analyze_RunAnalysis while the tracking is enabled---
+        """
+        links=self._loadCaseLinks()
+        self._dirty={"all":True,"cases":set(),"patterns":set(),"functions":set(),"casePatterns":{},
+                     "caseFunctions":{},"modalCase":{},"initialCase":{},"opaque":set(),"linksRead":links is not None}
+        if links is not None:
+            self._dirty.update(links)
+        self._modelCallInstall()
+
+    def analyze_DirtyCases_Disable(self):
+        """
+        ---This function disables the dirty case tracking, analyze_RunAnalysis then uses the run flags as set---
+        """
+        if self._dirty is None:
+            return
+        self._dirty=None
+        self._modelCallInstall()
+
+    def analyze_DirtyCases_Mark(self,Kind="all",Name=None):
+        """
+        ---This function marks a part of the model as modified, e.g. after a modification made in the SAP2000
+        application or with a function the tracking does not follow---
+        inputs:
+        Kind(str)-"case", "pattern", "function" or "all".
+        Name(str)-The name of the load case, load pattern or function, unused for "all".
+        """
+        if self._dirty is None:
+            raise ValueError("the dirty case tracking is not enabled")
+        if Kind=="all":
+            self._dirty["all"]=True
+        elif Kind in ("case","pattern","function"):
+            self._dirty[{"case":"cases","pattern":"patterns","function":"functions"}[Kind]].add(Name)
+        else:
+            raise ValueError("Kind must be case, pattern, function or all")
+
+    def analyze_DirtyCases_GetRunCases(self):
+        """
+        ---This function retrieves the load cases analyze_RunAnalysis will run with the dirty case tracking---
+        return:
+        [allCases,runCases]
+        allCases(bool)-True if all cases are dirty.
+        runCases(str list)-The names of the cases to be run.
+        """
+        if self._dirty is None:
+            raise ValueError("the dirty case tracking is not enabled")
+        status=self.analyze_GetCaseStatus()
+        caseNames=list(status[2])
+        if self._dirty["all"]:
+            return [True,caseNames]
+        dirty=self._dirty
+        seeds=set(dirty["cases"])
+        seeds.update(case for case,patterns in dirty["casePatterns"].items() if patterns&dirty["patterns"])
+        seeds.update(case for case,functions in dirty["caseFunctions"].items() if functions&dirty["functions"])
+        seeds.update(case for case,caseStatus in zip(status[2],status[3]) if caseStatus!=4)
+        if not dirty["linksRead"]:
+            linkedPatterns=set().union(*dirty["casePatterns"].values())
+            linkedFunctions=set().union(*dirty["caseFunctions"].values())
+            if dirty["patterns"]-linkedPatterns or dirty["functions"]-linkedFunctions:
+                return [True,caseNames]
+        if dirty["cases"] or dirty["patterns"] or dirty["functions"]:
+            seeds.update(dirty["opaque"])
+        dependents={}
+        for relation in ("modalCase","initialCase"):
+            for case,upstream in dirty[relation].items():
+                dependents.setdefault(upstream,set()).add(case)
+        runCases=set()
+        stack=list(seeds)
+        while stack:
+            case=stack.pop()
+            if case in runCases:
+                continue
+            runCases.add(case)
+            stack.extend(dependents.get(case,()))
+        return [False,[case for case in caseNames if case in runCases]]
+
+    def analyze_DirtyCases_GetGraph(self):
+        """
+        ---This function retrieves the relations known by the dirty case tracking---
+        return:
+        {"casePatterns":{case:[pattern,...]},"caseFunctions":{case:[function,...]},"modalCase":{case:modalCase},
+         "initialCase":{case:initialCase},"opaque":[case,...]}
+        opaque are the cases whose relations are unknown.
+        """
+        if self._dirty is None:
+            raise ValueError("the dirty case tracking is not enabled")
+        dirty=self._dirty
+        return {"casePatterns":{case:sorted(each) for case,each in dirty["casePatterns"].items()},
+                "caseFunctions":{case:sorted(each) for case,each in dirty["caseFunctions"].items()},
+                "modalCase":dict(dirty["modalCase"]),"initialCase":dict(dirty["initialCase"]),
+                "opaque":sorted(dirty["opaque"])}
+
+    # SapModel.LoadCases interface of a (CaseType,SubType) of LoadCases.GetTypeOAPI, SubType None for any sub type
+    _loadCaseInterfaces={(1,None):"StaticLinear",(2,1):"StaticNonlinear",(3,1):"ModalEigen",(3,2):"ModalRitz",
+                         (4,None):"ResponseSpectrum",(5,None):"ModHistLinear",(6,None):"ModHistNonlinear",
+                         (7,None):"DirHistLinear",(8,None):"DirHistNonlinear",(10,None):"Buckling"}
+    # positions of the LoadType, LoadName and Func lists in the GetLoads result of each interface
+    _loadCaseLoadItems={"StaticLinear":(2,3,None),"StaticNonlinear":(2,3,None),"ModalEigen":(2,3,None),
+                        "ModalRitz":(2,3,None),"Buckling":(2,3,None),"ResponseSpectrum":(None,None,3),
+                        "ModHistLinear":(2,3,4),"ModHistNonlinear":(2,3,4),"DirHistLinear":(2,3,4),
+                        "DirHistNonlinear":(2,3,4)}
+
+    def _loadCaseLinks(self):
+        """
+        ---read the relations of the load cases from SAP2000: the load patterns and functions of the case loads
+        (GetLoads), the modal case (GetModalCase) and the initial case (GetInitialCase). The cases of the other
+        types (staged construction, moving load, ...) and the cases whose loads cannot be read are opaque.
+        None is returned if the case names cannot be read---
+        return:
+        {"casePatterns":{case:{pattern,...}},"caseFunctions":{case:{function,...}},"modalCase":{case:modalCase},
+         "initialCase":{case:initialCase},"opaque":{case,...}}
+        """
+        loadCases=self.SapModel.LoadCases
+        try:
+            result=loadCases.GetNameList()
+            if self._retCode(result)!=0:
+                return None
+            caseNames=[str(each) for each in result[2][:result[1]]]
+        except Exception:
+            return None
+        links={"casePatterns":{},"caseFunctions":{},"modalCase":{},"initialCase":{},"opaque":set()}
+        for case in caseNames:
+            try:
+                caseType=loadCases.GetTypeOAPI(case)
+                interface=self._loadCaseInterfaces.get((caseType[1],None),
+                                                       self._loadCaseInterfaces.get((caseType[1],caseType[2])))
+                if self._retCode(caseType)!=0 or interface is None:
+                    raise ValueError(case)
+                loads=getattr(loadCases,interface).GetLoads(case)
+                if self._retCode(loads)!=0:
+                    raise ValueError(case)
+            except Exception:
+                links["opaque"].add(case)
+                continue
+            typeIndex,nameIndex,funcIndex=self._loadCaseLoadItems[interface]
+            number=loads[1]
+            links["casePatterns"][case]=set() if typeIndex is None else \
+                {str(name) for loadType,name in zip(loads[typeIndex][:number],loads[nameIndex][:number])
+                 if loadType=="Load"}
+            links["caseFunctions"][case]=set() if funcIndex is None else \
+                {str(name) for name in loads[funcIndex][:number]}
+            # a case type without modal or initial case has no such function or returns a nonzero value
+            for relation,getter in (("modalCase","GetModalCase"),("initialCase","GetInitialCase")):
+                try:
+                    result=getattr(getattr(loadCases,interface),getter)(case)
+                    if self._retCode(result)==0 and result[1]:
+                        links[relation][case]=str(result[1])
+                except Exception:
+                    continue
+        return links
+
+    def _dirtyPrepareRun(self):
+        """
+        ---set the run flags of the dirty cases and their dependents before an analysis---
+        """
+        allCases,runCases=self.analyze_DirtyCases_GetRunCases()
+        if allCases:
+            self.analyze_SetRunCaseFlag("",True,True)
+            return
+        self.analyze_SetRunCaseFlag("",False,True)
+        for case in runCases:
+            self.analyze_SetRunCaseFlag(case,True)
+
+    def _dirtyFinishRun(self):
+        """
+        ---after an analysis nothing is dirty anymore, cases that did not finish are found by their status---
+        """
+        dirty=self._dirty
+        dirty["all"]=False
+        dirty["cases"]=set()
+        dirty["patterns"]=set()
+        dirty["functions"]=set()
+
+    # a SAP2000 call modifying the model: a setter, adder, deleter or modifier of any SapModel interface
+    _modelCallModifier=re.compile(r"self\.SapModel(?:\.\w+)*\.(?:Set|Add|Delete|Change|Modify|New)\w*\(|"
+                                  r"getattr\(self\.SapModel(?:\.\w+)*,\"(?:Set|Add|Delete|Change|Modify)")
+    # functions modifying the model that are not followed: the model starts (initializeNewModel, newBlank and the
+    # file functions, see _resetModelCaches), the output selection and the run control
+    _modelCallExcluded=re.compile(r"(file_|results_|initializeNewModel$|newBlank$|"
+                                  r"analyze_(SetRunCaseFlag|RunAnalysis|MergeAnalysisResults|SplitRunMerge))")
+
+    @classmethod
+    def _modelCallMethods(cls):
+        """
+        ---names of the functions calling SAP2000 to modify the model, directly or through private functions,
+        followed by the dirty case tracking, the model checkpoints and the journal. Functions that only call other
+        SAP2000Py functions are not followed, their calls are; the calls made inside a followed function are not
+        followed again---
+        """
+        if "_modelCallNames" not in cls.__dict__:
+            sources={methodName:inspect.getsource(method) for methodName,method in cls.__dict__.items()
+                     if inspect.isfunction(method)}
+            helpers={methodName:set(re.findall(r"self\.(_\w+)\(",source)) for methodName,source in sources.items()}
+
+            def modifies(methodName,seen):
+                if cls._modelCallModifier.search(sources[methodName]):
+                    return True
+                seen.add(methodName)
+                return any(modifies(helper,seen) for helper in helpers[methodName]
+                           if helper in sources and helper not in seen)
+
+            cls._modelCallNames=sorted(methodName for methodName in sources if not methodName.startswith("_")
+                                       and not cls._modelCallExcluded.match(methodName)
+                                       and modifies(methodName,set()))
+        return cls._modelCallNames
+
+    def _modelCallInstall(self):
+        """
+        ---install the recorders of the followed functions while the dirty case tracking, the checkpoints, the
+        journal or a coalescing batch are enabled, remove them otherwise. The setters of an open coalescing batch keep
+        the batch recorder, and during the batch the functions of _coalesceBarriers flush it before they run---
+        """
+        coalescing=self._coalesce is not None
+        coalesced=set(self._coalescibleSetters()) if coalescing else set()
+        observed=self._dirty is not None or self._checkpoint is not None or self._journal is not None
+        for methodName in self._modelCallMethods():
+            if methodName in coalesced:
+                continue
+            if observed or coalescing:
+                setattr(self,methodName,self._modelCallRecorder(methodName))
+            else:
+                self.__dict__.pop(methodName,None)
+        for methodName in self._coalesceBarriers():
+            if coalescing:
+                setattr(self,methodName,self._modelCallRecorder(methodName,False))
+            else:
+                self.__dict__.pop(methodName,None)
+
+    def _modelCallRecorder(self,methodName,Followed=True):
+        """
+        ---the function following one model modification function. During a coalescing batch the recorded calls are
+        sent first; a function that is not followed (Followed=False) is only preceded by this flush---
+        """
+        signature=inspect.signature(getattr(type(self),methodName))
+
+        def recorder(*args,**kwargs):
+            if self._modelCallDepth==0 and self._coalesce is not None:
+                self.coalesce_Flush()
+            if not Followed:
+                return getattr(type(self),methodName)(self,*args,**kwargs)
+            if self._modelCallDepth==0:
+                bound=signature.bind(self,*args,**kwargs)
+                bound.apply_defaults()
+                arguments=dict(bound.arguments)
+                del arguments["self"]
+                self._modelCallNote(methodName,arguments)
+            self._modelCallDepth+=1
+            try:
+                return getattr(type(self),methodName)(self,*args,**kwargs)
+            finally:
+                self._modelCallDepth-=1
+        return recorder
+
+    def _modelCallNote(self,methodName,arguments):
+        """
+        ---pass one followed call to the dirty case tracking, the checkpoints and the journal---
+        """
+        if self._dirty is not None:
+            self._dirtyNote(methodName,arguments)
+        if self._checkpoint is not None:
+            self._checkpointNote(methodName,arguments)
+        if self._journal is not None:
+            self._journalNote(methodName,arguments)
+
+    # followed functions that do not change the analysis results
+    _dirtyIgnored=re.compile(r"(define_(Groups|RespCombo|generalizedDisplacements)_|_SetGroupAssign$|"
+                             r"^SetPresentCoordSystem$|^analyze_SetSolverOption)")
+
+    def _dirtyNote(self,methodName,arguments):
+        """
+        ---update the dirty state and the case relations for one call of a followed function---
+        """
+        if methodName in ("changeUnits","setUnits") or self._dirtyIgnored.search(methodName):
+            return
+        dirty=self._dirty
+        arguments={key.lower():value for key,value in arguments.items()}
+        caseCall=re.match(r"define_[lL]oad[cC]ases_[A-Za-z]+_(\w+)$",methodName)
+        if caseCall:
+            case=arguments["name"]
+            dirty["cases"].add(case)
+            if caseCall.group(1).startswith("SetLoads"):
+                loadNames=list(arguments.get("loadname") or [])
+                loadTypes=arguments.get("loadtype")
+                dirty["casePatterns"][case]=set() if loadTypes is None else \
+                    {str(name) for loadType,name in zip(loadTypes,loadNames) if loadType=="Load"}
+                dirty["caseFunctions"][case]={str(name) for name in (arguments.get("func") or [])}
+            elif caseCall.group(1)=="SetModalCase":
+                dirty["modalCase"][case]=arguments["modalcase"]
+            elif caseCall.group(1)=="SetInitialCase":
+                if arguments["initialcase"]:
+                    dirty["initialCase"][case]=arguments["initialcase"]
+                else:
+                    dirty["initialCase"].pop(case,None)
+        elif methodName=="define_LoadPatterns_Add":
+            dirty["patterns"].add(arguments["name"])
+            if arguments["addloadcase"]:
+                dirty["cases"].add(arguments["name"])
+                dirty["casePatterns"][arguments["name"]]={arguments["name"]}
+        elif "loadpat" in arguments:
+            dirty["patterns"].add(arguments["loadpat"])
+        elif methodName.startswith("define_functions_") and ("name" in arguments or "names" in arguments):
+            names=[arguments["name"]] if "name" in arguments else arguments["names"]
+            dirty["functions"].update(str(name) for name in names)
+        else:
+            dirty["all"]=True
 
     def analyze_ModifyUnDeformedGeometryModeShape(self,CaseName,Mode,MaxDisp,Direction,Original=False):
         """
@@ -7901,6 +11664,350 @@ class SAP2000Py():
         result=self.SapModel.Analyze.GetSolverOption_2()
         return result
 
+    def analyze_IDA(self,records,caseName,edp,pool=None,IMStart=0.1,IMStep=0.1,IMStepIncrease=0.05,
+                    Resolution=0.02,MaxRuns=12,CollapseEDP=None,Direction="U1",caseSetup=None):
+        """
+        ---This function is a generator that runs an incremental dynamic analysis with the hunt and fill
+        algorithm of Vamvatsikos and Cornell. For every record, the intensity measure (IM) is increased with a
+        growing step until collapse (hunt), the collapse IM is bracketed by bisection, then the largest gaps
+        between the non-collapse IM levels are filled until MaxRuns. A run is a collapse when the case does not
+        finish (analyze_GetCaseStatus) or when the EDP reaches CollapseEDP. Every run defines the nonlinear
+        direct integration case with define_loadCases_DirHistNonlinear_SetCase, SetLoads and SetTimeStep, runs
+        only this case and reads the envelope of the EDP. The results are yielded as soon as they are known---
+        inputs:
+        records(list)-[{"name":str,"function":str,"dt":float,"numSteps":int,"IM":float,"SF":float},...]
+            function is a defined time history function, IM the intensity measure of the unscaled record
+            (e.g. its Sa(T1) from define_functions_ResponseSpectrum), SF the load scale factor of the unscaled
+            record (e.g. 9.81 for a function in g).
+        caseName(str)-The name of the nonlinear direct integration case used for the runs.
+        edp(tuple or function)-("GeneralizedDispl",name), ("LinkDeformation",name,DOF) with DOF 1 to 6 for
+            U1 to R3, or a function(sapPyInstance,caseName) returning the EDP. The tuples give the largest
+            absolute value of the envelope.
+        pool(list)-None runs all records in this instance, the run flags of the cases are restored at the end.
+            Otherwise a list of model files, copies of the model, and one thread per file opens its own SAP2000
+            instance and takes the records one after another. When the generator is closed early or a thread fails,
+            the threads stop after their current run and close their SAP2000 instances.
+        IMStart,IMStep,IMStepIncrease(float)-The first IM, the first IM step and its increase after every hunt run.
+        Resolution(float)-The IM gap below which the bracketing and the filling stop.
+        MaxRuns(int)-The maximum number of runs per record.
+        CollapseEDP(float)-The EDP taken as collapse, None for non-convergence only.
+        Direction(str)-The acceleration direction of the records, "U1","U2" or "U3".
+        caseSetup(function)-If not None, caseSetup(sapPyInstance,caseName) is called after the case is
+            initialized, e.g. to set damping, the initial case or the solution control.
+        yield:
+        result(dict)-{"record","run","IM","SF","EDP","collapsed","status"}, status is the case status, 4 is
+            finished.
+        """
+        settings={"caseName":caseName,"edp":edp,"IMStart":IMStart,"IMStep":IMStep,"IMStepIncrease":IMStepIncrease,
+                  "Resolution":Resolution,"MaxRuns":MaxRuns,"CollapseEDP":CollapseEDP,"Direction":Direction,
+                  "caseSetup":caseSetup}
+        if pool is None:
+            runFlags=self.analyze_GetRunCaseFlag()
+            try:
+                for record in records:
+                    for result in self._idaRecord(record,settings):
+                        yield result
+            finally:
+                for case,run in zip(runFlags[2],runFlags[3]):
+                    self.analyze_SetRunCaseFlag(case,run)
+            return
+        for result in self._poolResults(pool,records,self._idaWorker,settings):
+            yield result
+
+    def _poolResults(self,pool,items,worker,settings):
+        """
+        ---run the items in one thread per model file of the pool and yield the results as they come. When the
+        generator is closed, or a thread fails, the other threads are told to stop after their current run and are
+        waited for, so no thread and no SAP2000 instance is left running---
+        """
+        jobs=queue.Queue()
+        for item in items:
+            jobs.put(item)
+        events=queue.Queue()
+        stop=threading.Event()
+        workers=[threading.Thread(target=worker,args=(modelFile,jobs,events,settings,stop),daemon=True)
+                 for modelFile in pool]
+        for eachWorker in workers:
+            eachWorker.start()
+        running=len(workers)
+        try:
+            while running:
+                kind,item=events.get()
+                if kind=="result":
+                    yield item
+                elif kind=="error":
+                    raise item
+                else:
+                    running-=1
+        finally:
+            stop.set()
+            for eachWorker in workers:
+                eachWorker.join()
+
+    def _idaWorker(self,modelFile,jobs,events,settings,stop):
+        """
+        ---one IDA pool thread: its own COM apartment and SAP2000 instance, records are taken from the queue until
+        it is empty or stop is set---
+        """
+        pythoncom.CoInitialize()
+        instance=None
+        try:
+            instance=type(self)()
+            instance.initializeNewModel()
+            instance.file_OpenFile(modelFile)
+            while not stop.is_set():
+                try:
+                    record=jobs.get_nowait()
+                except queue.Empty:
+                    break
+                for result in instance._idaRecord(record,settings):
+                    events.put(("result",result))
+                    if stop.is_set():
+                        break
+        except Exception as error:
+            events.put(("error",error))
+        finally:
+            if instance is not None and instance.SapObject:
+                instance.SapObject.ApplicationExit(False)
+            pythoncom.CoUninitialize()
+            events.put(("done",modelFile))
+
+    def _idaRecord(self,record,settings):
+        """
+        ---hunt, bracket and fill for one record, every run is yielded---
+        """
+        levels={}
+
+        def run(IM):
+            result=self._idaRun(record,IM,len(levels)+1,settings)
+            levels[IM]=result["collapsed"]
+            return result
+
+        IM=settings["IMStart"]
+        step=settings["IMStep"]
+        while len(levels)<settings["MaxRuns"]:
+            result=run(IM)
+            yield result
+            if result["collapsed"]:
+                break
+            step+=settings["IMStepIncrease"]
+            IM+=step
+        while len(levels)<settings["MaxRuns"] and any(levels.values()):
+            lower=max([0.0]+[each for each,collapsed in levels.items() if not collapsed])
+            upper=min(each for each,collapsed in levels.items() if collapsed)
+            if upper-lower<=settings["Resolution"]:
+                break
+            yield run(0.5*(lower+upper))
+        while len(levels)<settings["MaxRuns"]:
+            survived=sorted([0.0]+[each for each,collapsed in levels.items() if not collapsed])
+            gaps=np.diff(survived)
+            if len(gaps)==0 or gaps.max()<=settings["Resolution"]:
+                break
+            widest=int(np.argmax(gaps))
+            yield run(0.5*(survived[widest]+survived[widest+1]))
+
+    def _idaRun(self,record,IM,runNumber,settings):
+        """
+        ---define, run and read one scaled record---
+        """
+        caseName=settings["caseName"]
+        SF=record.get("SF",1.0)*IM/record["IM"]
+        self.define_loadCases_DirHistNonlinear_SetCase(caseName)
+        if settings["caseSetup"] is not None:
+            settings["caseSetup"](self,caseName)
+        self.define_loadCases_DirHistNonlinear_SetLoads(caseName,1,["Accel"],[settings["Direction"]],
+                                                        [record["function"]],[SF])
+        self.define_loadCases_DirHistNonlinear_SetTimeStep(caseName,record["numSteps"],record["dt"])
+        self._runCaseOnly(caseName)
+        status=self.analyze_GetCaseStatus()
+        caseStatus=dict(zip(status[2],status[3])).get(caseName,1)
+        EDP=float("nan")
+        if caseStatus==4:
+            EDP=self._idaEDP(caseName,settings["edp"])
+        collapsed=caseStatus!=4 or (settings["CollapseEDP"] is not None and EDP>=settings["CollapseEDP"])
+        return {"record":record["name"],"run":runNumber,"IM":IM,"SF":SF,"EDP":EDP,"collapsed":collapsed,
+                "status":caseStatus}
+
+    def _idaEDP(self,caseName,edp):
+        """
+        ---largest absolute envelope value of the EDP of a direct integration case---
+        """
+        self.results_Setup_DeselectAllCasesAndCombosForOutput()
+        self.results_Setup_SetCaseSelectedForOutput(caseName)
+        self.results_Setup_SetOptionDirectHist(1)
+        if callable(edp):
+            return float(edp(self,caseName))
+        if edp[0]=="GeneralizedDispl":
+            values=self.results_GeneralizedDispl(edp[1])[7]
+        elif edp[0]=="LinkDeformation":
+            values=self.results_LinkDeformation(edp[1])[6+int(edp[2])]
+        else:
+            raise ValueError("edp must be GeneralizedDispl, LinkDeformation or a function")
+        values=np.abs(np.asarray(values,dtype=float))
+        return float(values.max()) if len(values) else float("nan")
+
+    def analyze_Pushover(self,patterns,ControlJoint,TargetDispl,DOF=1,pool=None,CasePrefix="PUSH_",
+                         InitialCase=None,MinSavedStates=20,MaxSavedStates=200,SolControl=None,MaxRetries=2,
+                         ReachTolerance=0.01,caseSetup=None):
+        """
+        ---This function is a generator that runs displacement controlled pushover analyses, one static nonlinear
+        case per load pattern, and yields the capacity curve of every run as soon as it is finished. Every case is
+        defined with define_LoadCases_StaticNonlinear_SetCase, SetLoads, SetLoadApplication (displacement control
+        of the monitored joint displacement), SetResultsSaved (multiple states) and SetSolControlParameters, then
+        only this case is run. The capacity curve is read step by step (results_Setup_SetOptionNLStatic(2)) from
+        results_JointDispl of the control joint and results_BaseReact. A run that does not finish or stops before
+        the target displacement is retried with tightened step control: the total and null steps, the Newton-Raphson
+        iterations and the saved states are doubled, event stepping is used and the event tolerance is halved.
+        The failed attempts are yielded too, the last one of a pattern with "failed" True---
+        inputs:
+        patterns(list)-The names of the load patterns, the case of a pattern is CasePrefix+pattern.
+        ControlJoint(str)-The name of the point object of the monitored displacement.
+        TargetDispl(float)-The target displacement of the control joint, its sign gives the push direction. [L]
+        DOF(int)-1, 2 or 3, the monitored degree of freedom U1, U2 or U3 of the control joint. The joint local
+            axes must be parallel to the global axes, the base shear is taken in the same global direction.
+        pool(list)-None runs all patterns in this instance, the run flags of the cases are restored at the end.
+            Otherwise a list of model files, copies of the model, and one thread per file opens its own SAP2000
+            instance and takes the patterns one after another. When the generator is closed early or a thread fails,
+            the threads stop after their current run and close their SAP2000 instances.
+        CasePrefix(str)-The prefix of the static nonlinear case names.
+        InitialCase(str)-None for zero initial conditions, otherwise e.g. the gravity nonlinear case.
+        MinSavedStates,MaxSavedStates(int)-The saved states of the first attempt.
+        SolControl(list)-[MaxTotalSteps,MaxFailedSubSteps,MaxIterCS,MaxIterNR,TolConvD,UseEventStepping,TolEventD,
+            MaxLineSearchPerIter,TolLineSearch,LineSearchStepFact] of the first attempt, None for the program
+            defaults [200,50,10,40,1e-4,True,0.01,20,0.1,1.618].
+        MaxRetries(int)-The maximum number of retries per pattern.
+        ReachTolerance(float)-The relative shortfall of the target displacement still taken as reached.
+        caseSetup(function)-If not None, caseSetup(sapPyInstance,caseName) is called after the case is
+            initialized, e.g. to set the geometric nonlinearity or the hinge unloading.
+        yield:
+        result(dict)-{"pattern","case","attempt","status","converged","failed","displ":array,"baseShear":array,
+            "solControl":list}, status is the case status (4 is finished), displ and baseShear the capacity curve
+            from the unloaded state.
+        """
+        if SolControl is None:
+            SolControl=[200,50,10,40,1e-4,True,0.01,20,0.1,1.618]
+        settings={"ControlJoint":ControlJoint,"TargetDispl":TargetDispl,"DOF":DOF,"CasePrefix":CasePrefix,
+                  "InitialCase":InitialCase,"MinSavedStates":MinSavedStates,"MaxSavedStates":MaxSavedStates,
+                  "SolControl":list(SolControl),"MaxRetries":MaxRetries,"ReachTolerance":ReachTolerance,
+                  "caseSetup":caseSetup}
+        if pool is None:
+            runFlags=self.analyze_GetRunCaseFlag()
+            try:
+                for pattern in patterns:
+                    for result in self._pushoverPattern(pattern,settings):
+                        yield result
+            finally:
+                for case,run in zip(runFlags[2],runFlags[3]):
+                    self.analyze_SetRunCaseFlag(case,run)
+            return
+        for result in self._poolResults(pool,patterns,self._pushoverWorker,settings):
+            yield result
+
+    def _pushoverWorker(self,modelFile,jobs,events,settings,stop):
+        """
+        ---one pushover pool thread: its own COM apartment and SAP2000 instance, patterns are taken from the queue
+        until it is empty or stop is set---
+        """
+        pythoncom.CoInitialize()
+        instance=None
+        try:
+            instance=type(self)()
+            instance.initializeNewModel()
+            instance.file_OpenFile(modelFile)
+            while not stop.is_set():
+                try:
+                    pattern=jobs.get_nowait()
+                except queue.Empty:
+                    break
+                for result in instance._pushoverPattern(pattern,settings):
+                    events.put(("result",result))
+                    if stop.is_set():
+                        break
+        except Exception as error:
+            events.put(("error",error))
+        finally:
+            if instance is not None and instance.SapObject:
+                instance.SapObject.ApplicationExit(False)
+            pythoncom.CoUninitialize()
+            events.put(("done",modelFile))
+
+    def _pushoverPattern(self,pattern,settings):
+        """
+        ---the attempts of one pattern, the step control is tightened after every failed attempt---
+        """
+        solControl=list(settings["SolControl"])
+        savedStates=[settings["MinSavedStates"],settings["MaxSavedStates"]]
+        for attempt in range(settings["MaxRetries"]+1):
+            result=self._pushoverRun(pattern,attempt,solControl,savedStates,settings)
+            result["failed"]=not result["converged"] and attempt==settings["MaxRetries"]
+            yield result
+            if result["converged"]:
+                break
+            solControl[0]*=2
+            solControl[1]*=2
+            solControl[3]*=2
+            solControl[5]=True
+            solControl[6]*=0.5
+            savedStates=[2*each for each in savedStates]
+
+    def _pushoverRun(self,pattern,attempt,solControl,savedStates,settings):
+        """
+        ---define, run and read one pushover case---
+        """
+        caseName=settings["CasePrefix"]+pattern
+        self.define_LoadCases_StaticNonlinear_SetCase(caseName)
+        if settings["InitialCase"] is not None:
+            self.define_loadCases_StaticNonlinear_SetInitialCase(caseName,settings["InitialCase"])
+        if settings["caseSetup"] is not None:
+            settings["caseSetup"](self,caseName)
+        self.define_loadCases_StaticNonlinear_SetLoads(caseName,1,["Load"],[pattern],[1.0])
+        self.define_loadCases_StaticNonlinear_SetLoadApplication(caseName,2,2,settings["TargetDispl"],1,
+                                                                 settings["DOF"],settings["ControlJoint"],"")
+        self.define_loadCases_StaticNonlinear_SetResultsSaved(caseName,True,savedStates[0],savedStates[1],True)
+        self.define_loadCases_StaticNonlinear_SetSolControlParameters(caseName,*solControl)
+        self._runCaseOnly(caseName)
+        status=self.analyze_GetCaseStatus()
+        caseStatus=dict(zip(status[2],status[3])).get(caseName,1)
+        displ,baseShear=np.zeros(0),np.zeros(0)
+        if caseStatus==4:
+            displ,baseShear=self._pushoverCurve(caseName,settings["ControlJoint"],settings["DOF"])
+        target=abs(settings["TargetDispl"])
+        reached=len(displ)>0 and np.abs(displ).max()>=(1-settings["ReachTolerance"])*target
+        return {"pattern":pattern,"case":caseName,"attempt":attempt,"status":caseStatus,"converged":bool(reached),
+                "displ":displ,"baseShear":baseShear,"solControl":list(solControl)}
+
+    def _runCaseOnly(self,caseName):
+        """
+        ---run only one case and its prerequisites, also with the dirty case tracking, which would set the run flags
+        of the dirty cases otherwise. The run flags are left as set here, the caller restores them---
+        """
+        self.analyze_SetRunCaseFlag("",False,True)
+        self.analyze_SetRunCaseFlag(caseName,True)
+        dirty=self._dirty
+        self._dirty=None
+        try:
+            self.analyze_RunAnalysis()
+        finally:
+            self._dirty=dirty
+
+    def _pushoverCurve(self,caseName,ControlJoint,DOF):
+        """
+        ---[displ,baseShear] of the saved steps of a static nonlinear case, matched by step number---
+        """
+        self.results_Setup_DeselectAllCasesAndCombosForOutput()
+        self.results_Setup_SetCaseSelectedForOutput(caseName)
+        self.results_Setup_SetOptionNLStatic(2)
+        joint=self.results_JointDispl(ControlJoint,0)
+        react=self.results_BaseReact()
+        jointRows=np.asarray(joint[4],dtype=object)==caseName
+        reactRows=np.asarray(react[2],dtype=object)==caseName
+        jointSteps=np.asarray(joint[6],dtype=float)[jointRows]
+        reactSteps=np.asarray(react[4],dtype=float)[reactRows]
+        displ=np.asarray(joint[6+DOF],dtype=float)[jointRows]
+        force=-np.asarray(react[4+DOF],dtype=float)[reactRows]
+        steps,jointIndex,reactIndex=np.intersect1d(jointSteps,reactSteps,return_indices=True)
+        return displ[jointIndex],force[reactIndex]
+
     def results_Setup_SelectAllSectionCutsForOutput(self,Selected):
         """
         ---This function selects or deselects all section cuts for output.The function returns 0 if the selected flag
@@ -9502,6 +13609,175 @@ class SAP2000Py():
         result=self.SapModel.Results.StepLabel()
         return result
 
+    def coalesce_Begin(self,GroupPrefix="_coalesceGroup"):
+        """
+        ---This function starts a coalescing batch. Until coalesce_End is called, calls of the per-object
+        assign_*Obj_Set* functions that accept an ItemType (e.g. assign_PointObj_SetRestraint,
+        assign_FrameObj_SetReleases, assign_AreaObj_SetProperty, assign_LinkObj_SetProperty) with ItemType=Object are
+        recorded instead of being sent to SAP2000. At flush, calls of the same function with identical non-name
+        arguments are merged; when a set of objects receives enough identical calls, the objects are put in a scratch
+        group once and each call is issued once for the group with ItemType=Group, then the group is deleted.
+        A second call of the same function on an already recorded object flushes the batch first, so the final state
+        equals the one of the per-object calls. Calls of different recorded functions may be reordered, but every
+        other function modifying the model, running the analysis or opening and saving files (e.g.
+        assign_FrameObj_ChangeName, define_Groups_SetGroup, analyze_RunAnalysis, file_Save) flushes the batch
+        first. A recorded call is not sent yet and returns 0; the get functions see the model without the recorded
+        calls until the next flush.
+        ---
+        inputs:
+        GroupPrefix(str)-The name prefix of the scratch groups.
+        """
+        if self._coalesce is not None:
+            self.coalesce_End()
+        self._coalesce={"groupPrefix":GroupPrefix,"pending":{},"arguments":{},"objects":set(),"numGroups":0,
+                        "recorded":0,"issued":0,"groupAssignCalls":0}
+        for methodName in self._coalescibleSetters():
+            setattr(self,methodName,self._coalesceRecorder(methodName))
+        self._modelCallInstall()
+
+    def coalesce_Flush(self):
+        """
+        ---This function sends all calls recorded in the current coalescing batch to SAP2000. The scratch groups
+        take names not used by the groups of the model---
+        """
+        batch=self._coalesce
+        if batch is None or not batch["pending"]:
+            return
+        # the issued calls were followed when they were recorded
+        self._modelCallDepth+=1
+        try:
+            self._coalesceIssue(batch)
+        finally:
+            self._modelCallDepth-=1
+        batch["pending"]={}
+        batch["arguments"]={}
+        batch["objects"]=set()
+
+    def _coalesceIssue(self,batch):
+        """
+        ---send the recorded calls of a coalescing batch---
+        """
+        groupNames=self._groupNamesFree(batch["groupPrefix"])
+        objectSets={}
+        for key,objNames in batch["pending"].items():
+            objType=key[0].split("_")[1]
+            objectSets.setdefault((objType,tuple(sorted(objNames))),[]).append(key)
+        for (objType,objNames),keys in objectSets.items():
+            numObj=len(objNames)
+            # a scratch group costs SetGroup, one SetGroupAssign per object and Delete, then one call per key
+            useGroup=numObj>1 and numObj*len(keys)>numObj+2+len(keys)
+            if useGroup:
+                batch["numGroups"]+=1
+                groupName=next(groupNames)
+                self.define_Groups_SetGroupFromObjects(groupName,objType,objNames)
+                batch["groupAssignCalls"]+=numObj
+                batch["issued"]+=numObj+2
+                targets,itemType=[groupName],1
+            else:
+                targets,itemType=objNames,0
+            for key in keys:
+                methodName,nameArg,itemTypeArg,otherArgs=key
+                for eachTarget in targets:
+                    arguments=dict(batch["arguments"][key])
+                    arguments[nameArg]=eachTarget
+                    arguments[itemTypeArg]=itemType
+                    getattr(type(self),methodName)(self,**arguments)
+                    batch["issued"]+=1
+            if useGroup:
+                self.define_Groups_Delete(groupName)
+
+    def coalesce_End(self):
+        """
+        ---This function flushes and closes the current coalescing batch---
+        return:
+        {"recorded":int,"issued":int,"groupAssignCalls":int}
+        recorded(int)-The number of setter calls recorded in the batch.
+        issued(int)-The number of SAP2000 calls issued for them, including the group definition calls.
+        groupAssignCalls(int)-The number of SetGroupAssign calls among the issued calls.
+        """
+        if self._coalesce is None:
+            return {"recorded":0,"issued":0,"groupAssignCalls":0}
+        self.coalesce_Flush()
+        for methodName in self._coalescibleSetters():
+            self.__dict__.pop(methodName,None)
+        batch=self._coalesce
+        self._coalesce=None
+        self._modelCallInstall()
+        return {"recorded":batch["recorded"],"issued":batch["issued"],"groupAssignCalls":batch["groupAssignCalls"]}
+
+    @classmethod
+    def _coalescibleSetters(cls):
+        """
+        ---names of the assign_*Obj_Set* functions whose first input is the object name and which accept an ItemType---
+        """
+        if "_coalescibleNames" not in cls.__dict__:
+            names=[]
+            for methodName,method in cls.__dict__.items():
+                if not re.match(r"assign_[A-Za-z]+Obj_Set[A-Za-z0-9_]+$",methodName):
+                    continue
+                if methodName.endswith("_SetGroupAssign"):
+                    continue
+                params=list(inspect.signature(method).parameters)
+                if len(params)>1 and params[1].lower()=="name" and [p for p in params if p.lower()=="itemtype"]:
+                    names.append(methodName)
+            cls._coalescibleNames=sorted(names)
+        return cls._coalescibleNames
+
+    @classmethod
+    def _coalesceBarriers(cls):
+        """
+        ---names of the functions calling SAP2000 that are not followed but must see the calls of a coalescing batch:
+        the model starts, the file functions and the run control---
+        """
+        if "_coalesceBarrierNames" not in cls.__dict__:
+            cls._coalesceBarrierNames=sorted(methodName for methodName,method in cls.__dict__.items()
+                                             if inspect.isfunction(method) and not methodName.startswith("results_")
+                                             and cls._modelCallExcluded.match(methodName))
+        return cls._coalesceBarrierNames
+
+    def _coalesceRecorder(self,methodName):
+        """
+        ---the function recording one coalescible setter during a coalescing batch---
+        """
+        signature=inspect.signature(getattr(type(self),methodName))
+        params=list(signature.parameters)
+        nameArg=params[1]
+        itemTypeArg=[p for p in params if p.lower()=="itemtype"][0]
+
+        def hashable(value):
+            if isinstance(value,(list,tuple,np.ndarray)):
+                return tuple(hashable(each) for each in value)
+            if isinstance(value,dict):
+                return tuple(sorted((k,hashable(v)) for k,v in value.items()))
+            return value
+
+        def recorder(*args,**kwargs):
+            if self._modelCallDepth>0:
+                # a call made inside another model function keeps its place among the calls of that function
+                return getattr(type(self),methodName)(self,*args,**kwargs)
+            bound=signature.bind(self,*args,**kwargs)
+            bound.apply_defaults()
+            arguments=dict(bound.arguments)
+            del arguments["self"]
+            self._modelCallNote(methodName,arguments)
+            batch=self._coalesce
+            if arguments[itemTypeArg]!=0:
+                self.coalesce_Flush()
+                return getattr(type(self),methodName)(self,**arguments)
+            objName=arguments.pop(nameArg)
+            del arguments[itemTypeArg]
+            otherArgs=tuple((k,hashable(v)) for k,v in arguments.items())
+            key=(methodName,nameArg,itemTypeArg,otherArgs)
+            if (methodName,objName) in batch["objects"]:
+                # repeated call on the same object (a new value, or an additive load), keep the call order
+                self.coalesce_Flush()
+            batch["objects"].add((methodName,objName))
+            batch["pending"].setdefault(key,[]).append(objName)
+            batch["arguments"].setdefault(key,arguments)
+            batch["recorded"]+=1
+            return 0
+        return recorder
+
 
 
 
@@ -9522,6 +13798,7 @@ class SAP2000Py():
 
 #########################################################################
 if __name__ == '__main__':
+    pass
     #############################################
     # sapPyInstance=SAP2000Py()
     # sapPyInstance.initializeNewModel()
@@ -9534,13 +13811,46 @@ if __name__ == '__main__':
     # sapPyInstance.define_material_SetORebar_1("myMat", 62, 93, 70, 102, 2, 2, 0.02, 0.1, -0.1, False)
     # sapPyInstance.define_material_SetOSteel_1("myMat",55, 68, 60, 70, 0)
     # sapPyInstance.define_material_SetSSCurve("myMat",[-0.2,-0.1,0,0.1,0.2],[-5,-2,0,1,4])
+    # strain=np.linspace(0,0.02,2001)
+    # curves,reports=sapPyInstance.define_curve_Simplify([(strain,345*np.tanh(strain/0.0017))],1.0,0.01)
+    # print(reports)
+    # sapPyInstance.define_material_SetSSCurve("myMat",strain,345*np.tanh(strain/0.0017),Tolerance=1.0)
     # sapPyInstance.define_material_SetOConcrete_1("myMat",5, False, 0, 1, 2, 0.0022, 0.0052, -0.1)
     # sapPyInstance.define_material_TendonUser("mytondon",18, 2000, 2e-5)
     # sapPyInstance.define_material_AddMaterial("myConcrete", 2, "China", "JTG", "JTG D62-2004 C15")
     # sapPyInstance.define_material_AddMaterial("mysteel345",1,"China","JTG","GB/T 714-2008 Q690q")
+    # sapPyInstance.define_registry_Enable()
+    # sapPyInstance.define_material_AddMaterial("pierConcrete", 2, "China", "JTG", "JTG D62-2004 C40")
+    # sapPyInstance.define_material_AddMaterial("capConcrete", 2, "China", "JTG", "JTG D62-2004 C40")
+    # print(sapPyInstance.define_registry_Resolve("material","capConcrete"))
+    # print(sapPyInstance.define_registry_GetHashMap("material"))
+    # print(sapPyInstance.define_registry_GetStatistics())
+    # sapPyInstance.define_registry_Disable()
+    #############################################
+    # sapPyInstance.file_checkpoint_Enable(MaxBytes=20*2**30,MaxAgeDays=30)
+    # base=[("define_material_SetMatrial",("C40",2)),("define_material_SetMPIsotropic",("C40",3.25e7,0.2,1e-5))]
+    # for depth in [1.6,1.8,2.0]:
+    #     variant=base+[("define_section_PropFrame_SetGeneral",("beam","C40",depth,0.5,0.5,0.1,0.2,0.05))]
+    #     result=sapPyInstance.file_checkpoint_Build(variant,"c:\\sweep\\beam%.1f.sdb"%depth,SaveAt=[len(base)])
+    #     print(result["restoredSteps"],result["appliedSteps"])
+    # print(sapPyInstance.file_checkpoint_List())
+
+    # sapPyInstance.file_journal_Start("C:/work/bridge.sapjournal")
+    # sapPyInstance.newBlank()
+    # sapPyInstance.define_material_SetMatrial("C30",2)
+    # sapPyInstance.file_journal_Stop()
+    # sapPyInstance.file_journal_Filter("C:/work/bridge.sapjournal","C:/work/bridgeNoLoads.sapjournal",Exclude="_SetLoad")
+    # result=sapPyInstance.file_journal_Diff("C:/work/bridge.sapjournal","C:/work/bridgeNoLoads.sapjournal")
+    # print(result["commonPrefix"],[(each["tag"],each["a"],each["b"]) for each in result["changes"]])
+    # newInstance=SAP2000Py()
+    # newInstance.initializeNewModel()
+    # result=newInstance.file_journal_Replay("C:/work/bridge.sapjournal")
     #############################################
     # sapPyInstance.define_section_Cable_SetPro("caleSect","mytondon",0.2)
     # sapPyInstance.define_section_PropFrame_SetGeneral("myRect","myMat",2,1.6667,1.6667,0.6667,0.1667,0.4578)
+    # boxes=[[[(0,0),(6,0),(6,d),(0,d)],[(0.3,0.3),(5.7,0.3),(5.7,d-0.3),(0.3,d-0.3)]] for d in np.linspace(2,4,50)]
+    # props=sapPyInstance.define_section_PropFrame_SetGeneralBulk(["box%d"%each for each in range(50)],"myMat",boxes)
+    # print(props["A"],props["J"],props["As2"])
     # sapPyInstance.define_section_Tendon_SetProp("mytonden","mytondon",1,0.02)
     # sapPyInstance.define_section_Area_SetPlane("myplaneArea",1,"myMat",0.23)
     # sapPyInstance.define_section_Area_SetShell_1("myshell",1,"myMat",0.22)
@@ -9562,8 +13872,25 @@ if __name__ == '__main__':
                                                             # {"U2":2001},{"U2":300},{"U2":0.2})
     # sapPyInstance.define_section_PropLink_SetFrictionIsolator("myFrictionIso",["U2"],[],["U2"],{"U2":1000},{"U2":0.05},
                                     # {"U2":1002},{"U2":0.01},{"U2":2.21},{"U2":0.12},{"U2":0},0.043)
+    # props=np.zeros(1000,dtype=sapPyInstance.define_section_PropLink_GetDtype("RubberIsolator"))
+    # props["name"]=["LRB%d"%each for each in range(1000)]
+    # props["DOF"][:,:3]=True
+    # props["Nonlinear"][:,1:3]=True
+    # props["Ke"][:,:3]=[2e6,1500,1500]
+    # props["k"][:,1:3]=15000
+    # props["yieldF"][:,1:3]=np.linspace(50,150,1000)[:,None]
+    # props["Ratio"][:,1:3]=0.1
+    # sapPyInstance.define_section_PropLink_SetBulk("RubberIsolator",props)
+    # sweep=sapPyInstance.define_section_PropLink_SweepGenerate("RubberIsolator",
+    #     {"DOF":[["U1","U2","U3"]],"Nonlinear":[["U2","U3"]],"Ke":{"U1":2e6,"U2":1500,"U3":1500},
+    #      "k":{"U2":15000,"U3":15000}},{"yieldF:U2,U3":(50,150),"Ratio:U2,U3":(0.05,0.15)},200,seed=2021)
+    # for assignments in sapPyInstance.define_section_PropLink_SweepAssign(sweep,["1","2","3","4"],
+    #                                                                      ManifestPath="sweep.json"):
+    #     sapPyInstance.analyze_RunAnalysis()
     #############################################
     # sapPyInstance.define_Groups_SetGroup("mygrop1")
+    # sapPyInstance.define_Groups_SetGroupFromObjects("mygrop2","FrameObj",["1","2","3"])
+    # sapPyInstance.define_Groups_Delete("mygrop2")
 
 
     #############################################
@@ -9587,7 +13914,21 @@ if __name__ == '__main__':
     # sapPyInstance.define_functions_FuncRS_SetJTGB022013("myJTGB02", 1, 0.18, 0.36, 0.4, 1, 0.04)
     # sapPyInstance.define_functions_FuncRS_SetCJJ1662011("myCJJ166", 1, 0.35, 0.25, 0.04)
     # sapPyInstance.define_functions_FuncRS_SetUser("myUserResFunc",[0.1,0.2,0.3,0.4],[0.4,0.6,0.8,0.3],0.05)
+    # alphaMax,Tg=sapPyInstance.define_functions_Chinese2010Parameters(4,"II",1,"rare")
+    # periods=np.linspace(0,6,301)
+    # target=sapPyInstance.define_functions_FuncRS_Chinese2010Curve(periods,alphaMax,4,Tg,1,0.05)
+    # sapPyInstance.define_functions_FuncRS_SetChinese2010("rareGB", alphaMax, 4, Tg, 1, 0.05)
+    # print(sapPyInstance.define_functions_FuncRS_VerifyCurve("rareGB",periods,target))
     # sapPyInstance.define_functions_FuncTH_SetUser("myUserRTH",[0.1,0.2,0.3,0.4],[0.4,0.6,0.8,0.3])
+    # import glob
+    # records=sapPyInstance.define_functions_FuncTH_IngestRecords(glob.glob("records/*.AT2"),TargetDt=0.01,
+    #                                                             FilterBand=(0.1,25),ScaleFactor=9.81,
+    #                                                             CacheDir="records/cache")
+    # spectra=sapPyInstance.define_functions_FuncRS_SetUserFromRecords(list(records.keys()),list(records.values()),
+    #                                                                 np.logspace(-2,1,100),0.05,"PSA",1/9.81)
+    # decimated,report=sapPyInstance.define_functions_FuncTH_Decimate(list(records.values()),list(records.keys()),
+    #                                                                Tolerance=0.05,Define=True)
+    # print(report["factor"],report["speedUp"])
     #############################################
     # sapPyInstance.define_LoadPatterns_Add("quakePattern",5,0)
     #############################################
@@ -9834,6 +14175,11 @@ if __name__ == '__main__':
     # result=sapPyInstance.assign_FrameObj_GetLoadTemperature("1")
     # print(result)
 
+    # table=[["1","DEAD","DistForce",10,0,1,5,5,"Global"],["2","DEAD","DistForce",10,0,1,5,5,"Global"],
+    #        ["1","TEMP","Temperature",1,0,0,25,0,""],["2","TEMP","Temperature",1,0,0,25,0,""]]
+    # result=sapPyInstance.assign_FrameObj_SetLoadTable(table)
+    # print(result)
+
     # sapPyInstance.assign_FrameObj_SetLoadTransfer("1", False)
 
     # sapPyInstance.assign_FrameObj_SetLocalAxes("3", 30)
@@ -10049,6 +14395,12 @@ if __name__ == '__main__':
     # sapPyInstance.file_New2DFrame(0, 2, 144, 2, 288)
     # sapPyInstance.assign_AreaObj_AddByPoint(4,["1","4","5","2"],UserName="MyArea")
 
+    # nodes,elemPtr,elemNodes=sapPyInstance.assign_AreaObj_MeshQuadrilateral([[0,0,0],[40,0,0],[44,12,0],[4,12,0]],20,6)
+    # pointNames,areaNames=sapPyInstance.assign_AreaObj_AddByMesh(nodes,elemPtr,elemNodes,"myshell","DECK")
+    # nodes,elemPtr,elemNodes=sapPyInstance.assign_AreaObj_MeshPolygon([[0,0],[12,0],[12,8],[6,11],[0,8]],0.5,
+    #                                                                  [[[4,3],[6,3],[6,5],[4,5]]],z=3.0)
+    # pointNames,areaNames=sapPyInstance.assign_AreaObj_AddByMesh(nodes,elemPtr,elemNodes,"myshell")
+
     # sapPyInstance.file_NewWall(2, 48, 2, 48)
     # sapPyInstance.assign_AreaObj_SetAutoMesh("1",3,PointOnEdgeFromLine=True,PointOnEdgeFromPoint=True)
     # result=sapPyInstance.assign_AreaObj_GetAutoMesh("1")
@@ -10158,6 +14510,10 @@ if __name__ == '__main__':
     # Point=["1","10","4","13","2","11","5","14"]
     # sapPyInstance.assign_SolidObj_AddByPoint(Point,UserName="MySolid")
 
+    # nodes,connectivity=sapPyInstance.assign_SolidObj_MeshBlock([[0,0,0],[8,0,0],[0,3,0],[8,3,0],[0,0,2],[8,0,2],
+    #                                                              [0,3,2],[8,3,2]],16,6,4,grading=(1,1,0.5))
+    # pointNames,solidNames=sapPyInstance.assign_SolidObj_AddByPointBulk(nodes,connectivity,"mySold")
+
     # sapPyInstance.file_NewSolidBlock(300, 400, 200,True,"Default",2, 2, 2)
     # result=sapPyInstance.assign_SolidObj_Count()
     # print(result)
@@ -10307,6 +14663,47 @@ if __name__ == '__main__':
     # result=sapPyInstance.analyze_GetSolverOption_2()
     # print(result)
 
+    # import asyncio
+    # result=asyncio.run(sapPyInstance.analyze_RunAnalysisAsync(PollInterval=5.0,progress=print))
+    # print(result)
+
+    # partitions=sapPyInstance.analyze_PartitionCases(4,Dependencies={"RSX":["MODAL"],"RSY":["MODAL"]})
+    # print(partitions)
+    # result=sapPyInstance.analyze_SplitRunMerge(4,Dependencies={"RSX":["MODAL"],"RSY":["MODAL"]})
+    # print(result["wallTime"],result["status"])
+
+    # result=sapPyInstance.analyze_SolverTune(Cases=["DEAD","MODAL"],SolverTypes=(1,2),ParallelRuns=(1,0,4))
+    # print(result["bucket"],result["best"])
+    # sapPyInstance.analyze_SolverProfile_Enable()
+    # sapPyInstance.analyze_RunAnalysis()
+
+    # sapPyInstance.analyze_History_Enable(Label="initial sections")
+    # sapPyInstance.analyze_RunAnalysis()
+    # result=sapPyInstance.analyze_History_SlowestCases(Days=30,Limit=10)
+    # print(result)
+    # result=sapPyInstance.analyze_History_CaseTrend("MODAL")
+    # print(result)
+
+    # sapPyInstance.analyze_DirtyCases_Enable()
+    # sapPyInstance.analyze_RunAnalysis()
+    # sapPyInstance.assign_PointObj_SetLoadForce("3","LIVE",[0,0,-10,0,0,0])
+    # result=sapPyInstance.analyze_DirtyCases_GetRunCases()
+    # print(result)
+    # sapPyInstance.analyze_RunAnalysis()
+
+    # result=sapPyInstance.analyze_FormFinding("DEAD",["2","3","4"],Tolerance=1e-3,MaxIterations=8)
+    # print(result["converged"],result["iterations"],result["deviation"])
+
+    # for result in sapPyInstance.analyze_Pushover(["PUSHX","PUSHY"],"roof",0.5,DOF=1,InitialCase="GRAVNL",
+    #                                              pool=["C:/work/copy1.sdb","C:/work/copy2.sdb"]):
+    #     print(result["pattern"],result["attempt"],result["converged"],result["displ"][-1:])
+
+    # records=[{"name":"RSN1","function":"RSN1","dt":0.01,"numSteps":4000,"IM":0.35,"SF":9.81},
+    #          {"name":"RSN2","function":"RSN2","dt":0.01,"numSteps":3000,"IM":0.52,"SF":9.81}]
+    # for result in sapPyInstance.analyze_IDA(records,"IDA",("GeneralizedDispl","roofDrift"),CollapseEDP=0.1,
+    #                                         pool=["c:\\ida\\copy1.sdb","c:\\ida\\copy2.sdb"]):
+    #     print(result["record"],result["IM"],result["EDP"],result["collapsed"])
+
     #############################################
     # sapPyInstance.file_New2DFrame(0,3, 124, 3, 200)
     # sapPyInstance.results_Setup_SelectAllSectionCutsForOutput(True)
@@ -10475,6 +14872,20 @@ if __name__ == '__main__':
     # sapPyInstance.results_Setup_SetCaseSelectedForOutput("MODAL")
     # result=sapPyInstance.results_Setup_ModalParticipatingMassRatios()
     # print(result)
+
+    # mask=np.zeros((4,6),dtype=bool)
+    # mask[:,:3]=True
+    # result=sapPyInstance.assign_PointObj_SetRestraintBulk(["1","2","3","4"],mask)
+    # k=np.array([[1e5,1e5,0,0,0,0],[1e5,1e5,0,0,0,0],[2e5,2e5,0,0,0,0],[1e5,1e5,0,0,0,0]])
+    # result=sapPyInstance.assign_PointObj_SetSpringBulk(["1","2","3","4"],k)
+    # print(result)
+
+    # sapPyInstance.coalesce_Begin()
+    # for each in ["1","2","3","4"]:
+    #     sapPyInstance.assign_PointObj_SetRestraint(each,[True,True,True,False,False,False])
+    #     sapPyInstance.assign_PointObj_SetSpring(each,[1e5,1e5,0,0,0,0])
+    # result=sapPyInstance.coalesce_End()
+    # print(result)
     #############################################
     # sapPyInstance.saveModel("F:\pythonInteractSAP2000\savedModel.sdb")
     # sapPyInstance.openModel("F:\pythonInteractSAP2000资料\curvedBridge.sdb")
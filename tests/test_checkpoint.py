@@ -0,0 +1,69 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Model checkpoints: stream hash of the modifying calls and the store index
+#########################################################################
+import os
+import sys
+import threading
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+@pytest.mark.parametrize("call",[lambda sapPy:sapPy.define_RespCombo_Add("COMB1",0),
+                                 lambda sapPy:sapPy.analyze_SetActiveDOF([True,False,True,False,True,False]),
+                                 lambda sapPy:sapPy.define_Groups_SetGroup("G1"),
+                                 lambda sapPy:sapPy.assign_PointObj_SetGroupAssign("1","G1"),
+                                 lambda sapPy:sapPy.analyze_SetSolverOption_2(1,0,0,""),
+                                 lambda sapPy:sapPy.SetPresentCoordSystem("Global")])
+def test_everyModificationIsHashed(tmp_path,call):
+    sapPy=standInSAP2000Py()
+    sapPy.file_checkpoint_Enable(str(tmp_path))
+    before=sapPy.file_checkpoint_GetHash()
+    call(sapPy)
+    assert sapPy.file_checkpoint_GetHash()!=before
+
+
+def test_templateReseedsHash(tmp_path):
+    hashes=[]
+    for prefix in ([],[("define_material_SetMatrial",("C30",2))]):
+        sapPy=standInSAP2000Py()
+        sapPy.file_checkpoint_Enable(str(tmp_path))
+        for methodName,args in prefix:
+            getattr(sapPy,methodName)(*args)
+        sapPy.file_New2DFrame(0,3,3.0,2,6.0)
+        hashes.append(sapPy.file_checkpoint_GetHash())
+    assert hashes[0]==hashes[1]
+    sapPy.file_New2DFrame(0,4,3.0,2,6.0)
+    assert sapPy.file_checkpoint_GetHash()!=hashes[0]
+
+
+def test_concurrentSavesKeepIndex(tmp_path):
+    store=str(tmp_path/"store")
+    errors=[]
+
+    def session(number):
+        try:
+            sapPy=standInSAP2000Py()
+            sapPy.file_checkpoint_Enable(store)
+            modelFile=str(tmp_path/("model%d.sdb" % number))
+            for each in range(10):
+                sapPy.define_material_SetMatrial("M%d_%d" % (number,each),2)
+                with open(modelFile,"wb") as f:
+                    f.write(b"model")
+                sapPy.file_checkpoint_Save(modelFile)
+        except Exception as error:
+            errors.append(error)
+
+    sessions=[threading.Thread(target=session,args=(number,)) for number in range(4)]
+    for each in sessions:
+        each.start()
+    for each in sessions:
+        each.join()
+    assert not errors
+    sapPy=standInSAP2000Py()
+    sapPy.file_checkpoint_Enable(store)
+    assert len(sapPy.file_checkpoint_List())==40
+    assert not os.path.exists(os.path.join(store,"index.lock"))
@@ -0,0 +1,63 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Coalescing batch: flush before other model calls and scratch group names
+#########################################################################
+import os
+import sys
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+FIXED=[True,True,True,False,False,False]
+
+
+def batchModel(groups=()):
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.responses["GroupDef.GetNameList"]=lambda *args:(0,len(groups),list(groups))
+    sapPy.SapModel.stream=[]
+    sapPy.coalesce_Begin()
+    return sapPy
+
+
+def paths(sapPy):
+    return [path for path,args in sapPy.SapModel.stream]
+
+
+def test_recordedCallReturnsZeroAndIsNotSent():
+    sapPy=batchModel()
+    assert sapPy.assign_PointObj_SetRestraint("1",FIXED)==0
+    assert "PointObj.SetRestraint" not in paths(sapPy)
+    sapPy.coalesce_End()
+    assert paths(sapPy).count("PointObj.SetRestraint")==1
+
+
+def test_otherModelCallsFlushTheBatchFirst():
+    sapPy=batchModel()
+    sapPy.assign_PointObj_SetRestraint("1",FIXED)
+    sapPy.assign_PointObj_ChangeName("1","BASE")
+    assert paths(sapPy).index("PointObj.SetRestraint")<paths(sapPy).index("PointObj.ChangeName")
+    sapPy.assign_PointObj_SetRestraint("BASE",FIXED)
+    sapPy.define_Groups_SetGroup("USER")
+    assert paths(sapPy).count("PointObj.SetRestraint")==2
+    sapPy.assign_PointObj_SetSpring("BASE",[1e5]*3+[0]*3)
+    sapPy.analyze_RunAnalysis()
+    stream=paths(sapPy)
+    assert stream.index("PointObj.SetSpring")<stream.index("Analyze.RunAnalysis")
+    sapPy.coalesce_End()
+    assert "assign_PointObj_ChangeName" not in sapPy.__dict__
+    assert "analyze_RunAnalysis" not in sapPy.__dict__
+
+
+def test_scratchGroupSkipsUserGroups():
+    sapPy=batchModel(groups=["_coalesceGroup1"])
+    for point in range(8):
+        for setter in (sapPy.assign_PointObj_SetRestraint,sapPy.assign_PointObj_SetSpring):
+            setter(str(point),FIXED if setter==sapPy.assign_PointObj_SetRestraint else [1e5]*3+[0]*3)
+        sapPy.assign_PointObj_SetMass(str(point),[1.0]*3+[0]*3)
+    summary=sapPy.coalesce_End()
+    created=[args[0] for path,args in sapPy.SapModel.stream if path=="GroupDef.SetGroup"]
+    deleted=[args[0] for path,args in sapPy.SapModel.stream if path=="GroupDef.Delete"]
+    assert created==["_coalesceGroup2"] and deleted==["_coalesceGroup2"]
+    assert summary["recorded"]==24 and summary["groupAssignCalls"]==8
@@ -0,0 +1,24 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Client-side code response spectra against hand-computed values
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+pytest.importorskip("win32com.client")
+from pythonInterSAP2000 import SAP2000Py
+
+
+def test_JTGB022013DampingFactor():
+    # dampRatio=0.02: Cd=1+(0.05-0.02)/(0.08+1.6*0.02)=1+0.03/0.112=1.267857
+    values=SAP2000Py().define_functions_FuncRS_JTGB022013Curve([0.0,0.3,0.8],1,0.1,0.4,1.0,1.0,0.02)
+    Smax=2.25*1.267857*0.1
+    assert np.allclose(values,[0.45*Smax,Smax,Smax*0.4/0.8],rtol=1e-6)
+
+
+def test_JTGB022013DampingFactorLowerBound():
+    # dampRatio=0.5: 1+(0.05-0.5)/(0.08+0.8)=0.488636, limited to 0.55
+    values=SAP2000Py().define_functions_FuncRS_JTGB022013Curve([0.3],1,0.2,0.4,1.3,1.0,0.5)
+    assert np.allclose(values,[2.25*1.3*0.55*0.2])
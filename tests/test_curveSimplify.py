@@ -0,0 +1,92 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Error bounded simplification of stress-strain and backbone curves
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def steelCurve(numPoints=400):
+    strain=np.linspace(-0.05,0.05,numPoints+1)
+    stress=345.0*np.tanh(strain/0.0017)+2000.0*strain
+    return strain,stress
+
+
+def backboneCurve():
+    # a force-deformation backbone with a peak and a softening branch
+    x=np.linspace(0.0,10.0,501)
+    y=100.0*x*np.exp(1.0-x/3.0)/3.0
+    return x,y
+
+
+def checkBound(original,simplified,Tolerance):
+    x,y=original
+    xs,ys=simplified
+    assert np.all(np.isin(xs,x))
+    assert xs[0]==x[0] and xs[-1]==x[-1]
+    assert np.max(np.abs(np.interp(x,xs,ys)-y))<=Tolerance+1e-9
+
+
+def test_errorStaysWithinTolerance():
+    sapPy=standInSAP2000Py()
+    curves=[steelCurve(),backboneCurve()]
+    simplified,reports=sapPy.define_curve_Simplify(curves,2.0)
+    for original,each,report in zip(curves,simplified,reports):
+        checkBound(original,each,2.0)
+        assert report["maxError"]<=2.0 and report["kept"]==len(each[0])
+        assert report["reduction"]>0.8
+    # the zero strain point and the peak of the backbone are kept
+    assert 0.0 in simplified[0][0]
+    assert backboneCurve()[0][np.argmax(backboneCurve()[1])] in simplified[1][0]
+
+
+def test_batchEqualsOneCurveAtATime():
+    sapPy=standInSAP2000Py()
+    curves=[steelCurve(),backboneCurve(),steelCurve(37)]
+    together=sapPy.define_curve_Simplify(curves,0.5)[0]
+    for curve,each in zip(curves,together):
+        alone=sapPy.define_curve_Simplify([curve],0.5)[0][0]
+        assert np.array_equal(alone[0],each[0]) and np.array_equal(alone[1],each[1])
+
+
+def test_straightLineKeepsItsEnds():
+    sapPy=standInSAP2000Py()
+    x=np.linspace(-1.0,2.0,31)
+    (xs,ys),=sapPy.define_curve_Simplify([(x,3.0*x)],1e-6)[0]
+    assert xs.tolist()==[-1.0,0.0,2.0] and ys.tolist()==pytest.approx([-3.0,0.0,6.0])
+
+
+def test_energyTolerance():
+    sapPy=standInSAP2000Py()
+    curve=backboneCurve()
+    loose=sapPy.define_curve_Simplify([curve],20.0)[1][0]
+    tight=sapPy.define_curve_Simplify([curve],20.0,EnergyTolerance=0.001)[1][0]
+    assert tight["energyError"]<=0.001<loose["energyError"]
+    assert tight["kept"]>loose["kept"]
+
+
+@pytest.mark.parametrize("curve,message",[(([0.0],[0.0]),"two points"),(([0.0,1.0,1.0],[0.0,1.0,2.0]),
+                                                                        "monotonically"),
+                                          (([0.0,1.0],[0.0]),"same length")])
+def test_invalidCurves(curve,message):
+    sapPy=standInSAP2000Py()
+    with pytest.raises(ValueError,match=message):
+        sapPy.define_curve_Simplify([curve],1.0)
+
+
+def test_stressStrainCurveIsSentSimplified():
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.stream=[]
+    strain,stress=steelCurve()
+    sapPy.define_material_SetSSCurve("S355",strain.tolist(),stress.tolist(),Tolerance=2.0)
+    (path,args),=[each for each in sapPy.SapModel.stream if each[0]=="PropMaterial.SetSSCurve"]
+    matName,numPoint,pointID,strainList,stressList=args
+    assert numPoint==len(strainList)<len(strain)//5 and pointID==list(range(numPoint))
+    assert 0.0 in strainList and stressList[strainList.index(0.0)]==0.0
+    checkBound((strain,stress),(np.array(strainList),np.array(stressList)),2.0)
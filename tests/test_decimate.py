@@ -0,0 +1,50 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Decimation of time history records: peak, start time and Arias intensity
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def syntheticRecord(dt=0.005,duration=20.0,seed=3):
+    random=np.random.RandomState(seed)
+    myTime=np.arange(int(duration/dt))*dt
+    envelope=np.sin(np.pi*myTime/duration)**2
+    value=np.zeros_like(myTime)
+    for frequency in np.linspace(0.3,4.0,12):
+        value+=random.uniform(0.5,1.0)*np.sin(2*np.pi*frequency*myTime+random.uniform(0,2*np.pi))
+    return myTime,0.3*envelope*value
+
+
+def arias(myTime,value,grid):
+    # SAP2000 interpolates the function linearly between its points
+    value=np.interp(grid,myTime,value)
+    return np.sum(value**2)*(grid[1]-grid[0])
+
+
+def test_decimatedRecordKeepsPeakStartAndArias():
+    myTime,value=syntheticRecord()
+    sapPy=standInSAP2000Py()
+    decimated,report=sapPy.define_functions_FuncTH_Decimate([(myTime,value)])
+    newTime,newValue=decimated[0]
+    assert report["factor"][0]>1 and report["points"][0]<len(value)
+    assert newTime[0]==0.0 and newValue[0]==value[0]
+    peak=int(np.argmax(np.abs(value)))
+    assert myTime[peak] in newTime
+    assert np.max(np.abs(newValue))==pytest.approx(np.max(np.abs(value)),rel=1e-12)
+    assert report["peakError"][0]<=0.05
+    assert arias(newTime,newValue,myTime)==pytest.approx(arias(myTime,value,myTime),rel=0.05)
+
+
+def test_recordNoFactorSatisfiesIsUnchanged():
+    myTime,value=syntheticRecord()
+    sapPy=standInSAP2000Py()
+    decimated,report=sapPy.define_functions_FuncTH_Decimate([(myTime,value)],Tolerance=0.0,AriasTolerance=0.0)
+    assert report["factor"][0]==1
+    assert np.array_equal(decimated[0][1],value)
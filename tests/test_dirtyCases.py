@@ -0,0 +1,88 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Dirty case tracking with the case relations read from the model
+#########################################################################
+import os
+import sys
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+# case:(CaseType,SubType,GetLoads result,modalCase,initialCase)
+CASES={"DEAD":(1,1,(0,1,["Load"],["DEAD"],[1.0]),"",""),
+       "LIVE":(1,1,(0,1,["Load"],["LIVE"],[1.0]),"",""),
+       "MODAL":(3,1,(0,0,[],[],[],[]),"",""),
+       "RS":(4,1,(0,1,["U1"],["spec"],[9.81],["Global"],[0.0]),"MODAL",""),
+       "PUSH":(2,1,(0,1,["Load"],["DEAD"],[1.0]),"","DEAD"),
+       "STAGED":(2,2,(0,0,[],[],[]),"","")}
+
+
+def standInModel(cases=CASES):
+    sapPy=standInSAP2000Py()
+    names=list(cases)
+    responses=sapPy.SapModel.responses
+    responses["LoadCases.GetNameList"]=lambda *args:(0,len(names),names)
+    responses["LoadCases.GetTypeOAPI"]=lambda name:(0,cases[name][0],cases[name][1])
+    for interface in ("StaticLinear","StaticNonlinear","ModalEigen","ResponseSpectrum"):
+        responses["LoadCases."+interface+".GetLoads"]=lambda name:cases[name][2]
+        responses["LoadCases."+interface+".GetModalCase"]=lambda name:(0,cases[name][3])
+        responses["LoadCases."+interface+".GetInitialCase"]=lambda name:(0,cases[name][4])
+    responses["Analyze.GetCaseStatus"]=lambda *args:(0,len(names),names,[4]*len(names))
+    return sapPy
+
+
+def test_linksReadFromModel():
+    sapPy=standInModel()
+    sapPy.analyze_DirtyCases_Enable()
+    graph=sapPy.analyze_DirtyCases_GetGraph()
+    assert graph["casePatterns"]["LIVE"]==["LIVE"]
+    assert graph["caseFunctions"]["RS"]==["spec"]
+    assert graph["modalCase"]=={"RS":"MODAL"}
+    assert graph["initialCase"]=={"PUSH":"DEAD"}
+    assert graph["opaque"]==["STAGED"]
+
+
+def test_loadOnPatternOfReadCase():
+    sapPy=standInModel()
+    sapPy.analyze_DirtyCases_Enable()
+    sapPy.analyze_RunAnalysis()
+    sapPy.assign_PointObj_SetLoadForce("3","LIVE",[0,0,-10,0,0,0])
+    assert sapPy.analyze_DirtyCases_GetRunCases()==[False,["LIVE","STAGED"]]
+    sapPy.analyze_RunAnalysis()
+    sapPy.assign_PointObj_SetLoadForce("3","DEAD",[0,0,-10,0,0,0])
+    assert sapPy.analyze_DirtyCases_GetRunCases()==[False,["DEAD","PUSH","STAGED"]]
+
+
+def test_unlinkedPatternWithoutReadLinks():
+    sapPy=standInModel()
+    del sapPy.SapModel.responses["LoadCases.GetNameList"]
+    sapPy.analyze_DirtyCases_Enable()
+    sapPy.analyze_RunAnalysis()
+    sapPy.assign_PointObj_SetLoadForce("3","LIVE",[0,0,-10,0,0,0])
+    assert sapPy.analyze_DirtyCases_GetRunCases()[0]
+
+
+def test_activeDOFMakesAllCasesDirty():
+    sapPy=standInModel()
+    sapPy.analyze_DirtyCases_Enable()
+    sapPy.analyze_RunAnalysis()
+    sapPy.analyze_SetActiveDOF([True,False,True,False,True,False])
+    assert sapPy.analyze_DirtyCases_GetRunCases()[0]
+
+
+def test_partitionReadsDependencies():
+    cases={"MODAL":(3,1,(0,0,[],[],[],[]),"",""),
+           "RS1":(4,1,(0,1,["U1"],["spec"],[9.81],["Global"],[0.0]),"MODAL",""),
+           "RS2":(4,1,(0,1,["U2"],["spec"],[9.81],["Global"],[0.0]),"MODAL",""),
+           "DEAD":(1,1,(0,1,["Load"],["DEAD"],[1.0]),"",""),
+           "PUSH":(2,1,(0,1,["Load"],["DEAD"],[1.0]),"","DEAD")}
+    partitions=standInModel(cases).analyze_PartitionCases(2,["RS1","RS2","PUSH"])
+    # every partition holds the modal case of its response spectrum cases and the initial case of PUSH
+    assert len(partitions)==2
+    for partition in partitions:
+        assert "MODAL" in partition or not {"RS1","RS2"}&set(partition)
+        assert "DEAD" in partition or "PUSH" not in partition
+    assert sorted(case for partition in partitions for case in partition if case!="MODAL")==\
+        ["DEAD","PUSH","RS1","RS2"]
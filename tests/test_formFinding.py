@@ -0,0 +1,53 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Form finding loop: input checks, run flags and output selection
+#########################################################################
+import os
+import sys
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+CASES=["DEAD","LIVE","PUSH"]
+
+
+def standInModel(log):
+    sapPy=standInSAP2000Py()
+    responses=sapPy.SapModel.responses
+    responses["LoadCases.GetNameList"]=lambda *args:(0,len(CASES),CASES)
+    responses["LoadCases.GetTypeOAPI"]=lambda name:(0,2 if name=="PUSH" else 1,1)
+    responses["LoadCases.StaticLinear.GetLoads"]=lambda name:(0,1,["Load"],[name],[1.0])
+    responses["LoadCases.StaticNonlinear.GetLoads"]=lambda name:(0,1,["Load"],["LIVE"],[1.0])
+    responses["LoadCases.StaticNonlinear.GetInitialCase"]=lambda name:(0,"DEAD")
+    responses["Analyze.GetRunCaseFlag"]=lambda:(0,len(CASES),CASES,[True,False,True])
+    responses["PointObj.GetCoordCartesian"]=lambda *args:(0,0.0,0.0,0.0)
+    for path in ("Analyze.SetRunCaseFlag","Analyze.RunAnalysis","Results.Setup.DeselectAllCasesAndCombosForOutput",
+                 "Results.Setup.SetCaseSelectedForOutput"):
+        responses[path]=lambda *args,path=path:log.append((path,)+args) or 0
+
+    def jointDispl(*args):
+        log.append(("Results.JointDispl",))
+        return (0,2,["1","2"],["1","2"],["PUSH","PUSH"],["",""],[0.0,0.0],[0.0,0.0],[0.0,0.0],[0.0,0.0],
+                [0.0,0.0],[0.0,0.0],[0.0,0.0])
+    responses["Results.JointDispl"]=jointDispl
+    return sapPy
+
+
+def test_maxIterationsAtLeastOne():
+    with pytest.raises(ValueError):
+        standInModel([]).analyze_FormFinding("PUSH",["1","2"],MaxIterations=0)
+
+
+def test_runsCaseWithPrerequisitesAndRestoresFlags():
+    log=[]
+    result=standInModel(log).analyze_FormFinding("PUSH",["1","2"])
+    assert result["converged"]
+    flags=[each[1:] for each in log if each[0]=="Analyze.SetRunCaseFlag"]
+    assert flags[:3]==[("",False,True),("PUSH",True,False),("DEAD",True,False)]
+    assert flags[3:]==[("DEAD",True,False),("LIVE",False,False),("PUSH",True,False)]
+    calls=[each[0] for each in log]
+    assert calls.index("Analyze.RunAnalysis")<calls.index("Results.Setup.DeselectAllCasesAndCombosForOutput")< \
+        calls.index("Results.Setup.SetCaseSelectedForOutput")<calls.index("Results.JointDispl")
+    assert ("Results.Setup.SetCaseSelectedForOutput","PUSH",True) in log
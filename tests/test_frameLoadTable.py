@@ -0,0 +1,48 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Frame load table: repeated rows, gravity rows and scratch group names
+#########################################################################
+import os
+import sys
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def loadStream(table,groups=()):
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.responses["GroupDef.GetNameList"]=lambda *args:(0,len(groups),list(groups))
+    sapPy.SapModel.stream=[]
+    summary=sapPy.assign_FrameObj_SetLoadTable(table)
+    return summary,sapPy.SapModel.stream
+
+
+def test_repeatedRowsAreAssignedOncePerRow():
+    row=["F1","LIVE","DistForce",10,0.0,1.0,-5.0,-5.0,"Global"]
+    summary,stream=loadStream([row,row,["F2"]+row[1:]])
+    dist=[args for path,args in stream if path=="FrameObj.SetLoadDistributed"]
+    assert sorted(args[0] for args in dist)==["F1","F1","F2"]
+    assert all(args[-2]==False for args in dist)
+    assert summary["loadCalls"]==3
+
+
+def test_gravityRowsAreSummedPerFrame():
+    table=[["F1","DEAD","Gravity",6,0,0,-1.0,0,"Global"],
+           ["F1","DEAD","Gravity",6,0,0,-0.5,0,"Global"],
+           ["F1","DEAD","Gravity",4,0,0,0.2,0,"Global"]]
+    summary,stream=loadStream(table)
+    gravity=[args for path,args in stream if path=="FrameObj.SetLoadGravity"]
+    assert gravity==[("F1","DEAD",0.2,0.0,-1.5,False,"Global",0)]
+
+
+def test_scratchGroupSkipsUserGroups():
+    frames=["F"+str(each) for each in range(6)]
+    table=[[frame,pattern,"PointForce",10,0.5,0,-1.0,0,"Global"] for frame in frames for pattern in ("L1","L2","L3")]
+    summary,stream=loadStream(table,groups=["ALL","_frameLoadGroup1"])
+    created=[args[0] for path,args in stream if path=="GroupDef.SetGroup"]
+    deleted=[args[0] for path,args in stream if path=="GroupDef.Delete"]
+    assert created==["_frameLoadGroup2"] and deleted==["_frameLoadGroup2"]
+    points=[args for path,args in stream if path=="FrameObj.SetLoadPoint"]
+    assert len(points)==3 and all(args[0]=="_frameLoadGroup2" and args[-1]==1 for args in points)
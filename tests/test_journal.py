@@ -0,0 +1,60 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Journal: the replay of a journal makes the SAP2000 calls of the
+#  recorded session
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def session(sapPy):
+    sapPy.file_New2DFrame(0,2,3.0,2,6.0)
+    sapPy.SetPresentCoordSystem("Global")
+    sapPy.define_material_SetMatrial("C30",2)
+    sapPy.define_LoadPatterns_Add("LIVE",3)
+    sapPy.define_Groups_SetGroup("TOP")
+    sapPy.assign_PointObj_AddCartesianBulk(np.arange(60,dtype=float).reshape(20,3))
+    sapPy.assign_PointObj_SetGroupAssign("3","TOP")
+    sapPy.assign_PointObj_SetRestraint("1",[True]*6)
+    sapPy.assign_PointObj_SetRestraint("2",[True,True,True,False,False,False])
+    sapPy.assign_PointObj_SetLoadForce("TOP","LIVE",[0,0,-10.0,0,0,0],ItemType=1)
+    sapPy.define_generalizedDisplacements_Add("GD1",1)
+    sapPy.define_RespCombo_Add("COMB1",0)
+    sapPy.define_RespCombo_SetCaseList("COMB1",0,"LIVE",1.6)
+    sapPy.analyze_SetActiveDOF([True,False,True,False,True,False])
+    sapPy.analyze_SetSolverOption_2(1,0,0,"")
+
+
+def test_replayMatchesCallStream(tmp_path):
+    journal=str(tmp_path/"model.jrn")
+    recorded=standInSAP2000Py()
+    recorded.SapModel.stream=[]
+    recorded.file_journal_Start(journal)
+    session(recorded)
+    recorded.file_journal_Stop()
+    records=recorded.file_journal_Read(journal)
+    assert records[0]["function"]=="file_New2DFrame"
+    replayed=standInSAP2000Py()
+    replayed.SapModel.stream=[]
+    replayed.file_journal_Replay(journal,Bulk=False,Coalesce=False)
+    assert len(replayed.SapModel.stream)==len(recorded.SapModel.stream)
+    for (pathA,argsA),(pathB,argsB) in zip(recorded.SapModel.stream,replayed.SapModel.stream):
+        assert pathA==pathB
+        assert repr(argsA)==repr(argsB)
+
+
+def test_filterKeepsTemplateStart(tmp_path):
+    journal=str(tmp_path/"model.jrn")
+    sapPy=standInSAP2000Py()
+    sapPy.file_journal_Start(journal)
+    session(sapPy)
+    sapPy.file_journal_Stop()
+    sapPy.file_journal_Filter(journal,str(tmp_path/"groups.jrn"),Include="Groups")
+    assert [each["function"] for each in sapPy.file_journal_Read(str(tmp_path/"groups.jrn"))]==\
+        ["file_New2DFrame","define_Groups_SetGroup"]
@@ -0,0 +1,80 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Batch link property compiler: packing, validation and bulk definition
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def singleCall(setter,*args,**kwargs):
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.stream=[]
+    getattr(sapPy,setter)(*args,**kwargs)
+    return sapPy.SapModel.stream[0][1]
+
+
+def test_linearMatchesTheSinglePropertyFunction():
+    sapPy=standInSAP2000Py()
+    arguments=sapPy.define_section_PropLink_Compile("Linear",{"name":["L1","L2"],"DOF":[["U1","U2"],["U1","R3"]],
+                                                              "Fixed":[[],["R3"]],
+                                                              "Ke":{"U1":[2000.0,3000.0],"U2":[50.0,0.0]},
+                                                              "Ce":{"U1":0.03},"dj2":[0.5,0.0]})
+    assert arguments[0]==singleCall("define_section_PropLink_SetLinear","L1",["U1","U2"],[],{"U1":2000.0,"U2":50.0},
+                                    {"U1":0.03},0.5,0.0)
+    assert arguments[1]==singleCall("define_section_PropLink_SetLinear","L2",["U1","R3"],["R3"],{"U1":3000.0},
+                                    {"U1":0.03})
+
+
+def test_coupledLinearTerms():
+    sapPy=standInSAP2000Py()
+    arguments=sapPy.define_section_PropLink_Compile("Linear",{"name":["C1"],"DOF":[["U1","R2"]],
+                                                              "Ke":{"U1U1":100.0,"U1R2":7.0,"R2R2":40.0}})
+    assert arguments[0]==singleCall("define_section_PropLink_SetLinear","C1",["U1","R2"],[],
+                                    {"U1U1":100.0,"U1R2":7.0,"R2R2":40.0},{},KeCoupled=True)
+    assert arguments[0][-2:]==(True,False)
+
+
+def test_structuredArrayLayout():
+    sapPy=standInSAP2000Py()
+    props=np.zeros(3,dtype=sapPy.define_section_PropLink_GetDtype("RubberIsolator"))
+    props["name"]=["R1","R2","R3"]
+    props["DOF"][:,:3]=True
+    props["Nonlinear"][:,1:3]=True
+    props["Ke"][:,0]=2e6
+    props["k"][:,1:3]=np.array([[1500.0],[1600.0],[1700.0]])
+    props["yieldF"][:,1:3]=100.0
+    props["Ratio"][:,1:3]=0.1
+    arguments=sapPy.define_section_PropLink_Compile("RubberIsolator",props)
+    name,DOF,Fixed,Nonlinear,Ke,Ce,k,yieldF,Ratio,dj2,dj3=arguments[2]
+    assert name=="R3" and DOF==[True]*3+[False]*3 and Nonlinear==[False,True,True,False,False,False]
+    assert k==[0.0,1700.0,1700.0,0.0,0.0,0.0] and yieldF[1]==100.0 and Ratio[2]==0.1 and Ke[0]==2e6
+    assert Fixed==[False]*6 and Ce==[0.0]*6 and (dj2,dj3)==(0.0,0.0)
+
+
+@pytest.mark.parametrize("props,message",[
+    ({"name":["A","A"]},"unique"),
+    ({"name":["A"],"DOF":[["U1"]],"Fixed":[["U2"]]},"Fixed/Nonlinear"),
+    ({"name":["A"],"DOF":[["U1"]],"Fixed":[["U1"]],"Nonlinear":[["U1"]]},"Fixed/Nonlinear"),
+    ({"name":["A"],"DOF":[["U7"]]},"unknown degrees"),
+    ({"name":["A","B"],"DOF":[["U1"],["U1"]],"Ke":{"U1":[1.0,-1.0]}},"must not be negative: B"),
+    ({"name":["A"],"DOF":[["U1"]],"c":{"U1":np.nan}},"c terms must be finite")])
+def test_invalidRecordsAreRejectedBeforeAnyCall(props,message):
+    sapPy=standInSAP2000Py()
+    with pytest.raises(ValueError,match=message):
+        sapPy.define_section_PropLink_SetBulk("Damper",props)
+    assert sapPy.SapModel.totalCalls()==0
+
+
+def test_setBulkDefinesEveryProperty():
+    sapPy=standInSAP2000Py()
+    names=["D"+str(each) for each in range(50)]
+    defined=sapPy.define_section_PropLink_SetBulk("Damper",{"name":names,"DOF":[["U1"]],"Nonlinear":[["U1"]],
+                                                             "c":{"U1":np.linspace(1,2,50)},"cexp":{"U1":0.3}})
+    assert defined==names
+    assert sapPy.SapModel.calls["PropLink.SetDamper"]==50
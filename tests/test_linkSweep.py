@@ -0,0 +1,73 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Latin hypercube sweep of link properties: design, properties, rounds
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+BASE={"DOF":[["U1","U2","U3"]],"Nonlinear":[["U2","U3"]],"Ke":{"U1":2e6,"U2":1500.0,"U3":1500.0}}
+RANGES={"yieldF:U2,U3":(50.0,150.0),"k:U2,U3":(1e3,1e5,"log")}
+
+
+def test_latinHypercubeStratifiesEveryParameter():
+    sapPy=standInSAP2000Py()
+    samples=sapPy.define_section_PropLink_SampleParameters({"a":(2.0,4.0),"b":(1e-2,1e2,"log")},40,seed=7)
+    strata=np.floor((samples["a"]-2.0)/2.0*40).astype(int)
+    assert sorted(strata.tolist())==list(range(40))
+    strata=np.floor((np.log10(samples["b"])+2.0)/4.0*40).astype(int)
+    assert sorted(strata.tolist())==list(range(40))
+    again=sapPy.define_section_PropLink_SampleParameters({"a":(2.0,4.0),"b":(1e-2,1e2,"log")},40,seed=7)
+    assert np.array_equal(samples["a"],again["a"]) and np.array_equal(samples["b"],again["b"])
+    with pytest.raises(ValueError):
+        sapPy.define_section_PropLink_SampleParameters({"a":(0,1)},4,method="sobol")
+
+
+def test_sweepPropertiesFollowTheSamples():
+    sapPy=standInSAP2000Py()
+    sweep=sapPy.define_section_PropLink_SweepGenerate("RubberIsolator",BASE,RANGES,30,seed=1,Digits=4)
+    props=sweep["props"]
+    assert len(props)==30 and len(set(props["name"].tolist()))==30
+    chosen=props[sweep["sampleToProp"]]
+    assert np.allclose(chosen["yieldF"][:,1],sweep["samples"]["yieldF:U2,U3"],rtol=1e-3)
+    assert np.array_equal(chosen["yieldF"][:,1],chosen["yieldF"][:,2])
+    assert np.allclose(chosen["k"][:,2],sweep["samples"]["k:U2,U3"],rtol=1e-3)
+    assert np.all(props["Ke"][:,0]==2e6) and np.all(props["Nonlinear"][:,1:3])
+    # the names are content hashes: the same seed gives the same names
+    again=sapPy.define_section_PropLink_SweepGenerate("RubberIsolator",BASE,RANGES,30,seed=1,Digits=4)
+    assert again["props"]["name"].tolist()==props["name"].tolist()
+
+
+def test_roundedDuplicatesShareOneProperty():
+    sapPy=standInSAP2000Py()
+    sweep=sapPy.define_section_PropLink_SweepGenerate("RubberIsolator",BASE,{"yieldF:U2":(100.0,104.0)},20,
+                                                      seed=3,Digits=2)
+    assert len(sweep["props"])<20
+    values=sweep["props"]["yieldF"][sweep["sampleToProp"],1]
+    assert set(values.tolist())<={100.0,101.0,102.0,103.0,104.0}
+    with pytest.raises(ValueError,match="unknown sweep parameter"):
+        sapPy.define_section_PropLink_SweepGenerate("RubberIsolator",BASE,{"DOF:U1":(0,1)},4)
+
+
+def test_sweepRoundsAndManifest(tmp_path):
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.responses["GroupDef.GetNameList"]=lambda *args:(0,1,["_sweepGroup1"])
+    sweep=sapPy.define_section_PropLink_SweepGenerate("RubberIsolator",BASE,RANGES,5,seed=2)
+    manifest=str(tmp_path/"sweep.json")
+    sapPy.SapModel.stream=[]
+    rounds=list(sapPy.define_section_PropLink_SweepAssign(sweep,["L1","L2","L3"],ManifestPath=manifest))
+    assert [[each["sample"] for each in assignments] for assignments in rounds]==[[0],[1],[2],[3],[4]]
+    stream=sapPy.SapModel.stream
+    assert [args[0] for path,args in stream if path=="GroupDef.SetGroup"]==["_sweepGroup2"]
+    properties=[args for path,args in stream if path=="LinkObj.SetProperty"]
+    assert [args[1] for args in properties]==[each["property"] for assignments in rounds for each in assignments]
+    assert all(args[0]=="_sweepGroup2" and args[2]==1 for args in properties)
+    loaded=sapPy.define_section_PropLink_SweepLoad(manifest)
+    assert loaded["props"]["name"].tolist()==sweep["props"]["name"].tolist()
+    assert np.array_equal(loaded["props"]["k"],sweep["props"]["k"])
+    assert loaded["assignments"]==sweep["assignments"] and loaded["linkNames"]==["L1","L2","L3"]
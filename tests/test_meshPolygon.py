@@ -0,0 +1,93 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Python side slab mesh generators: coverage, conformity and orientation
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def polygonArea(xy):
+    x,y=xy[:,0],xy[:,1]
+    return 0.5*(x.dot(np.roll(y,-1))-y.dot(np.roll(x,-1)))
+
+
+def elements(mesh):
+    nodes,elemPtr,elemNodes=mesh
+    return [elemNodes[start:end] for start,end in zip(elemPtr[:-1],elemPtr[1:])]
+
+
+def checkMesh(mesh,area,meshSize):
+    nodes=mesh[0]
+    areas=[polygonArea(nodes[each,:2]) for each in elements(mesh)]
+    # every element is counterclockwise and not degenerate, together they cover the slab exactly
+    assert min(areas)>0.0
+    assert sum(areas)==pytest.approx(area,rel=1e-9)
+    edges={}
+    for each in elements(mesh):
+        for start,end in zip(each,np.roll(each,-1)):
+            edges.setdefault((min(start,end),max(start,end)),[]).append(each)
+        sides=np.hypot(*(nodes[np.roll(each,-1),:2]-nodes[each,:2]).T)
+        assert sides.max()<=meshSize*np.sqrt(2)+1e-9
+    # no hanging node: an edge has one or two elements, the boundary length equals the perimeter
+    assert max(len(each) for each in edges.values())==2
+    return {edge for edge,owners in edges.items() if len(owners)==1}
+
+
+def boundaryLength(mesh,edges):
+    nodes=mesh[0]
+    return sum(np.hypot(*(nodes[a,:2]-nodes[b,:2])) for a,b in edges)
+
+
+def perimeter(xy):
+    return np.hypot(*(np.roll(xy,-1,axis=0)-xy).T).sum()
+
+
+def test_rectangleIsAllQuads():
+    sapPy=standInSAP2000Py()
+    mesh=sapPy.assign_AreaObj_MeshPolygon([[0,0],[6,0],[6,4],[0,4]],1.0)
+    assert len(elements(mesh))==24 and all(len(each)==4 for each in elements(mesh))
+    assert len(mesh[0])==35
+    checkMesh(mesh,24.0,1.0)
+
+
+def test_slantedOutlineHasNoGaps():
+    sapPy=standInSAP2000Py()
+    outline=np.array([[0,0],[12,0],[12,8],[6,11],[0,8]],dtype=float)
+    mesh=sapPy.assign_AreaObj_MeshPolygon(outline,0.7)
+    edges=checkMesh(mesh,polygonArea(outline),0.7)
+    assert boundaryLength(mesh,edges)==pytest.approx(perimeter(outline),rel=1e-9)
+    assert np.allclose(mesh[0][:,2],0.0)
+
+
+def test_curvedOutlineWithSlantedOpening():
+    sapPy=standInSAP2000Py()
+    angle=np.linspace(0,2*np.pi,17)[:-1]
+    outline=np.column_stack((5*np.cos(angle),5*np.sin(angle)))
+    opening=np.array([[0,-1.5],[1.5,0],[0,1.5],[-1.5,0]])
+    mesh=sapPy.assign_AreaObj_MeshPolygon(outline,0.6,openings=[opening],z=3.0)
+    edges=checkMesh(mesh,polygonArea(outline)-polygonArea(opening),0.6)
+    assert boundaryLength(mesh,edges)==pytest.approx(perimeter(outline)+perimeter(opening),rel=1e-9)
+    assert np.allclose(mesh[0][:,2],3.0)
+
+
+def test_triangleElements():
+    sapPy=standInSAP2000Py()
+    outline=np.array([[0,0],[10,0],[4,7]],dtype=float)
+    mesh=sapPy.assign_AreaObj_MeshPolygon(outline,1.0,elemType="Tri")
+    assert all(len(each)==3 for each in elements(mesh))
+    checkMesh(mesh,polygonArea(outline),1.0)
+
+
+def test_quadrilateralMesh():
+    sapPy=standInSAP2000Py()
+    mesh=sapPy.assign_AreaObj_MeshQuadrilateral([[0,0,0],[8,0,0],[9,5,0],[1,4,0]],4,3)
+    assert len(elements(mesh))==12 and len(mesh[0])==20
+    areas=[polygonArea(mesh[0][each,:2]) for each in elements(mesh)]
+    assert min(areas)>0.0
+    assert sum(areas)==pytest.approx(polygonArea(np.array([[0,0],[8,0],[9,5],[1,4]],dtype=float)))
@@ -0,0 +1,36 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Bulk restraint and spring assignment of point objects
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+NAMES=[str(each) for each in range(10)]
+MASK=np.array([[True]*3+[False]*3]*6+[[True]*6]*4)
+
+
+def test_defaultIsOneCallPerPoint():
+    sapPy=standInSAP2000Py()
+    summary=sapPy.assign_PointObj_SetRestraintBulk(NAMES,MASK)
+    assert summary=={"patterns":2,"issued":10}
+    assert sapPy.SapModel.calls["PointObj.SetRestraint"]==10
+    assert sapPy.SapModel.calls.get("GroupDef.GetNameList",0)==0
+
+
+def test_keptGroupsSkipUserGroupsAndAreReused():
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.responses["GroupDef.GetNameList"]=lambda *args:(0,1,["_restraintGroup1"])
+    sapPy.SapModel.stream=[]
+    sapPy.assign_PointObj_SetRestraintBulk(NAMES,MASK,KeepGroups=True)
+    created=[args[0] for path,args in sapPy.SapModel.stream if path=="GroupDef.SetGroup"]
+    assert created==["_restraintGroup2","_restraintGroup3"]
+    sapPy.SapModel.stream=[]
+    summary=sapPy.assign_PointObj_SetRestraintBulk(NAMES,~MASK)
+    assert summary=={"patterns":2,"issued":2}
+    assert sorted(args[0] for path,args in sapPy.SapModel.stream if path=="PointObj.SetRestraint")==created
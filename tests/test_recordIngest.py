@@ -0,0 +1,72 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Ground motion reading, processing and the ingestion cache
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+VALUES=np.round(0.1*np.sin(np.arange(203)*0.37)*np.exp(-np.arange(203)/150.0),7)
+
+
+def writeAT2(path,values=VALUES,dt=0.01):
+    lines=["PEER NGA STRONG MOTION DATABASE RECORD","TEST RECORD, 0 DEG","ACCELERATION TIME SERIES IN UNITS OF G",
+           "NPTS=  %d, DT=   %.4f SEC" % (len(values),dt)]
+    rows=[values[start:start+5] for start in range(0,len(values),5)]
+    lines+=["".join("%15.7E" % each for each in row) for row in rows]
+    path.write_text("\n".join(lines)+"\n")
+    return str(path)
+
+
+def test_readFormatsInSmallChunks(tmp_path):
+    sapPy=standInSAP2000Py()
+    myTime,value=sapPy.define_functions_ReadRecord(writeAT2(tmp_path/"rec.AT2"),ChunkSize=7)
+    assert np.allclose(value,VALUES) and np.allclose(myTime,np.arange(203)*0.01)
+    (tmp_path/"rec.csv").write_text("time,acc\n"+"".join("%g,%g\n" % (0.02*i,v) for i,v in enumerate(VALUES)))
+    myTime,value=sapPy.define_functions_ReadRecord(str(tmp_path/"rec.csv"),ChunkSize=5)
+    assert np.allclose(value,VALUES) and np.allclose(myTime,np.arange(203)*0.02)
+    (tmp_path/"rec.txt").write_text("".join("%g\n" % v for v in VALUES))
+    with pytest.raises(ValueError,match="dt is needed"):
+        sapPy.define_functions_ReadRecord(str(tmp_path/"rec.txt"))
+    myTime,value=sapPy.define_functions_ReadRecord(str(tmp_path/"rec.txt"),dt=0.005,ChunkSize=3)
+    assert np.allclose(value,VALUES) and myTime[-1]==pytest.approx(202*0.005)
+
+
+def test_processingResamplesAndScales():
+    sapPy=standInSAP2000Py()
+    myTime=np.arange(1001)*0.005
+    value=np.sin(2*np.pi*1.0*myTime)
+    (newTime,newValue),=sapPy.define_functions_ProcessRecords([(myTime,value)],TargetDt=0.01,BaselineOrder=None,
+                                                               ScaleFactor=9.81)
+    assert np.allclose(np.diff(newTime),0.01) and newTime[-1]==pytest.approx(5.0)
+    assert np.allclose(newValue[20:-20],9.81*np.sin(2*np.pi*newTime[20:-20]),atol=1.0e-3)
+    (newTime,corrected),=sapPy.define_functions_ProcessRecords([(myTime,value+0.2)])
+    assert abs(corrected.mean())<abs((value+0.2).mean())
+
+
+def test_cacheSkipsReadingAndFollowsTheSettings(tmp_path):
+    sapPy=standInSAP2000Py()
+    files=[writeAT2(tmp_path/"A.AT2"),writeAT2(tmp_path/"B.AT2",VALUES[::-1])]
+    cache=str(tmp_path/"cache")
+    reads=[]
+    read=sapPy.define_functions_ReadRecord
+    sapPy.define_functions_ReadRecord=lambda filePath,dt=None:reads.append(filePath) or read(filePath,dt)
+    sapPy.SapModel.stream=[]
+    first=sapPy.define_functions_FuncTH_IngestRecords(files,ScaleFactor=9.81,CacheDir=cache)
+    assert list(first)==["A","B"] and len(reads)==2 and len(os.listdir(cache))==2
+    assert [args[:2] for path,args in sapPy.SapModel.stream if path=="Func.FuncTH.SetUser"]==[("A",203),("B",203)]
+    second=sapPy.define_functions_FuncTH_IngestRecords(files,ScaleFactor=9.81,CacheDir=cache,Define=False)
+    assert len(reads)==2
+    for name in first:
+        assert np.array_equal(first[name][1],second[name][1])
+    sapPy.define_functions_FuncTH_IngestRecords(files,ScaleFactor=1.0,CacheDir=cache,Define=False)
+    assert len(reads)==4
+    writeAT2(tmp_path/"A.AT2",VALUES*2)
+    third=sapPy.define_functions_FuncTH_IngestRecords(files,ScaleFactor=9.81,CacheDir=cache,Define=False)
+    assert reads[4:]==[files[0]]
+    assert np.allclose(third["A"][1],2*first["A"][1])
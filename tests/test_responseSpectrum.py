@@ -0,0 +1,79 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Nigam-Jennings response spectra against the single degree of freedom theory
+#########################################################################
+import os
+import sys
+import math
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def harmonicDisplacement(myTime,a0,w,wn,zeta):
+    """the exact relative displacement from rest under a ground acceleration a0*sin(w*t)"""
+    denominator=(wn**2-w**2)**2+(2*zeta*wn*w)**2
+    particular=-a0*((wn**2-w**2)*np.sin(w*myTime)-2*zeta*wn*w*np.cos(w*myTime))/denominator
+    u0=2*zeta*wn*w*a0/denominator
+    v0=-a0*(wn**2-w**2)*w/denominator
+    wd=wn*math.sqrt(1-zeta**2)
+    C1=-u0
+    C2=(zeta*wn*C1-v0)/wd
+    return particular+np.exp(-zeta*wn*myTime)*(C1*np.cos(wd*myTime)+C2*np.sin(wd*myTime))
+
+
+def test_harmonicInputMatchesTheClosedForm():
+    sapPy=standInSAP2000Py()
+    dt=0.002
+    myTime=np.arange(0,20.0+dt/2,dt)
+    a0,w=2.0,math.pi
+    periods=[0.3,1.0,1.9,4.0]
+    spectra=sapPy.define_functions_ResponseSpectrum([(myTime,a0*np.sin(w*myTime))],periods,DampRatio=[0.02,0.05])
+    assert spectra["PSA"].shape==(1,2,4)
+    for zetaIndex,zeta in enumerate([0.02,0.05]):
+        for periodIndex,period in enumerate(periods):
+            wn=2*math.pi/period
+            SD=np.abs(harmonicDisplacement(myTime,a0,w,wn,zeta)).max()
+            assert spectra["SD"][0,zetaIndex,periodIndex]==pytest.approx(SD,rel=1.0e-3)
+            assert spectra["PSA"][0,zetaIndex,periodIndex]==pytest.approx(wn**2*SD,rel=1.0e-3)
+
+
+def test_steadyStateAmplitudeOfALongHarmonic():
+    sapPy=standInSAP2000Py()
+    dt=0.005
+    myTime=np.arange(0,200.0+dt/2,dt)
+    a0,w,zeta,period=1.0,2*math.pi,0.2,0.5
+    wn=2*math.pi/period
+    envelope=np.minimum(myTime/50.0,1.0)
+    spectra=sapPy.define_functions_ResponseSpectrum([(myTime,a0*envelope*np.sin(w*myTime))],[period],DampRatio=zeta)
+    amplitude=a0/math.sqrt((wn**2-w**2)**2+(2*zeta*wn*w)**2)
+    assert spectra["SD"][0,0,0]==pytest.approx(amplitude,rel=0.02)
+    assert spectra["PSV"][0,0,0]==pytest.approx(wn*spectra["SD"][0,0,0])
+
+
+def test_undampedAbsoluteAccelerationEqualsPseudoAcceleration():
+    sapPy=standInSAP2000Py()
+    myTime=np.arange(0,10.0,0.01)
+    value=np.sin(3.0*myTime)*np.exp(-0.2*myTime)
+    spectra=sapPy.define_functions_ResponseSpectrum([(myTime,value)],[0.2,0.7,2.5],DampRatio=0.0)
+    assert np.allclose(spectra["SA"],spectra["PSA"],rtol=1.0e-9)
+
+
+def test_zeroPeriodAndRecordsOfDifferentLengths():
+    sapPy=standInSAP2000Py()
+    longTime=np.arange(0,8.0,0.01)
+    shortTime=np.arange(0,3.0,0.02)
+    longValue=np.sin(5.0*longTime)*np.exp(-0.3*longTime)
+    shortValue=-1.5*np.sin(9.0*shortTime)
+    periods=[0.0,0.5,1.5]
+    both=sapPy.define_functions_ResponseSpectrum([(longTime,longValue),(shortTime,shortValue)],periods)
+    assert both["PSA"][0,0,0]==pytest.approx(np.abs(longValue).max())
+    assert both["PSA"][1,0,0]==pytest.approx(np.abs(shortValue).max())
+    assert both["SD"][:,0,0].tolist()==[0.0,0.0]
+    alone=sapPy.define_functions_ResponseSpectrum([(shortTime,shortValue)],periods)
+    assert np.allclose(both["PSA"][1],alone["PSA"][0])
+    with pytest.raises(ValueError):
+        sapPy.define_functions_ResponseSpectrum([(shortTime,shortValue)],periods,DampRatio=1.0)
@@ -0,0 +1,89 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Asynchronous analysis run, progress events and the final case status
+#########################################################################
+import os
+import sys
+import time
+import asyncio
+import threading
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def slowSolve(sapPy,monkeypatch,failure=None):
+    """a stand-in whose RunAnalysis finishes DEAD and then MODAL, the threads share the stand-in SapModel"""
+    monkeypatch.setattr(sapPy,"_comMarshal",lambda:sapPy.SapModel)
+    monkeypatch.setattr(sapPy,"_comUnmarshal",lambda stream:stream)
+    state={"DEAD":1,"MODAL":1}
+    lock=threading.Lock()
+
+    def getCaseStatus():
+        with lock:
+            return (0,len(state),list(state),list(state.values()))
+
+    def runAnalysis():
+        for case in state:
+            with lock:
+                state[case]=3
+            time.sleep(0.05)
+            if failure is not None:
+                raise failure
+            with lock:
+                state[case]=4
+            time.sleep(0.05)
+        return 0
+
+    sapPy.SapModel.responses["Analyze.GetCaseStatus"]=getCaseStatus
+    sapPy.SapModel.responses["Analyze.RunAnalysis"]=runAnalysis
+
+
+def test_progressEventsAndFinalStatus(monkeypatch):
+    sapPy=standInSAP2000Py()
+    slowSolve(sapPy,monkeypatch)
+    events=[]
+    result=asyncio.run(sapPy.analyze_RunAnalysisAsync(PollInterval=0.005,progress=events.append))
+    assert result==(0,2,["DEAD","MODAL"],[4,4])
+    for case in ("DEAD","MODAL"):
+        mine=[(each["previous"],each["status"]) for each in events if each["case"]==case]
+        assert mine[0][0] is None and mine[-1][1]==4
+        assert all(previous==mine[index][1] for index,(previous,status) in enumerate(mine[1:]))
+        assert (3,4) in mine
+    assert all(each["elapsed"]>=0 for each in events)
+    assert sapPy.SapModel.calls["Analyze.RunAnalysis"]==1
+
+
+def test_coroutineProgressAndResponsiveLoop(monkeypatch):
+    sapPy=standInSAP2000Py()
+    slowSolve(sapPy,monkeypatch)
+    seen=[]
+
+    async def progress(event):
+        await asyncio.sleep(0)
+        seen.append((event["case"],event["status"]))
+
+    async def main():
+        ticks=0
+        run=asyncio.ensure_future(sapPy.analyze_RunAnalysisAsync(PollInterval=0.005,progress=progress))
+        while not run.done():
+            ticks+=1
+            await asyncio.sleep(0.01)
+        return ticks,run.result()
+
+    ticks,result=asyncio.run(main())
+    assert ticks>=5
+    assert result[3]==[4,4]
+    assert ("DEAD",4) in seen and ("MODAL",4) in seen
+
+
+def test_solverErrorIsRaisedAndThePollerStops(monkeypatch):
+    sapPy=standInSAP2000Py()
+    slowSolve(sapPy,monkeypatch,failure=RuntimeError("solver crashed"))
+    before=set(threading.enumerate())
+    with pytest.raises(RuntimeError,match="solver crashed"):
+        asyncio.run(sapPy.analyze_RunAnalysisAsync(PollInterval=0.005))
+    time.sleep(0.05)
+    assert not [each for each in set(threading.enumerate())-before if each.is_alive()]
@@ -0,0 +1,128 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  IDA hunt, bracket and fill, pushover retries, run flags and the pool
+#########################################################################
+import os
+import sys
+import time
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+IDA={"caseName":"IDA","edp":None,"IMStart":0.1,"IMStep":0.1,"IMStepIncrease":0.05,"Resolution":0.02,
+     "MaxRuns":12,"CollapseEDP":None,"Direction":"U1","caseSetup":None}
+
+
+def idaRuns(collapseIM,**settings):
+    sapPy=standInSAP2000Py()
+    sapPy._idaRun=lambda record,IM,runNumber,settings:{"record":record["name"],"run":runNumber,"IM":IM,
+                                                         "collapsed":IM>=collapseIM}
+    return list(sapPy._idaRecord({"name":"R1"},dict(IDA,**settings)))
+
+
+def test_idaHuntBracketAndFill():
+    runs=idaRuns(0.73)
+    IMs=[run["IM"] for run in runs]
+    assert [run["run"] for run in runs]==list(range(1,13))
+    # hunt: the step grows by IMStepIncrease after every run until the first collapse
+    assert IMs[:5]==pytest.approx([0.1,0.25,0.45,0.7,1.0])
+    assert runs[4]["collapsed"] and not any(run["collapsed"] for run in runs[:4])
+    # bracket: bisection between the largest survivor and the smallest collapse down to the resolution
+    lower,upper=0.7,1.0
+    position=5
+    while upper-lower>IDA["Resolution"]:
+        assert IMs[position]==pytest.approx(0.5*(lower+upper))
+        if runs[position]["collapsed"]:
+            upper=IMs[position]
+        else:
+            lower=IMs[position]
+        position+=1
+    assert lower<0.73<=upper
+    # fill: the midpoint of the widest gap between survivors, the widest first
+    survived=[0.0,0.1,0.25,0.45,0.7]
+    for run in runs[position:]:
+        gaps=[b-a for a,b in zip(survived,survived[1:])]
+        widest=gaps.index(max(gaps))
+        assert run["IM"]==pytest.approx(0.5*(survived[widest]+survived[widest+1]))
+        survived=sorted(survived+[run["IM"]])
+
+
+def test_idaStopsAtMaxRunsAndWithoutCollapse():
+    assert len(idaRuns(0.73,MaxRuns=6))==6
+    runs=idaRuns(100.0,MaxRuns=5)
+    assert len(runs)==5 and not any(run["collapsed"] for run in runs)
+
+
+def pushoverAttempts(convergedAttempt,MaxRetries=2):
+    sapPy=standInSAP2000Py()
+    seen=[]
+
+    def run(pattern,attempt,solControl,savedStates,settings):
+        seen.append((list(solControl),list(savedStates)))
+        return {"pattern":pattern,"attempt":attempt,"converged":attempt==convergedAttempt}
+
+    sapPy._pushoverRun=run
+    settings={"SolControl":[200,50,10,40,1e-4,False,0.01,20,0.1,1.618],"MinSavedStates":20,
+              "MaxSavedStates":200,"MaxRetries":MaxRetries}
+    return list(sapPy._pushoverPattern("PX",settings)),seen
+
+
+def test_pushoverRetriesWithTightenedControl():
+    results,seen=pushoverAttempts(2)
+    assert [result["attempt"] for result in results]==[0,1,2]
+    assert not any(result["failed"] for result in results)
+    first,second,third=seen
+    assert second[0][:2]==[400,100] and second[0][3]==80 and second[0][5] is True
+    assert second[0][6]==pytest.approx(0.005) and second[1]==[40,400]
+    assert third[0][:2]==[800,200] and third[0][6]==pytest.approx(0.0025) and third[1]==[80,800]
+
+
+def test_pushoverLastFailedAttemptIsMarked():
+    results,seen=pushoverAttempts(None,MaxRetries=1)
+    assert [result["failed"] for result in results]==[False,True]
+    results,seen=pushoverAttempts(0)
+    assert len(results)==1 and not results[0]["failed"]
+
+
+def test_idaRunsOnlyItsCaseAndRestoresRunFlags():
+    sapPy=standInSAP2000Py()
+    responses=sapPy.SapModel.responses
+    responses["Analyze.GetRunCaseFlag"]=lambda *args:(0,3,["DEAD","MODAL","IDA"],[True,False,True])
+    responses["Analyze.GetCaseStatus"]=lambda *args:(0,1,["IDA"],[4])
+    sapPy.analyze_DirtyCases_Enable()
+    sapPy.SapModel.stream=[]
+    record={"name":"R1","function":"R1","dt":0.01,"numSteps":100,"IM":1.0}
+    generator=sapPy.analyze_IDA([record],"IDA",lambda sapPy,caseName:0.01,CollapseEDP=0.05,MaxRuns=3)
+    next(generator)
+    flags=[args for path,args in sapPy.SapModel.stream if path=="Analyze.SetRunCaseFlag"]
+    assert flags==[("",False,True),("IDA",True,False)]
+    generator.close()
+    flags=[args for path,args in sapPy.SapModel.stream if path=="Analyze.SetRunCaseFlag"]
+    assert flags[-3:]==[("DEAD",True,False),("MODAL",False,False),("IDA",True,False)]
+    assert sapPy._dirty is not None
+
+
+def test_poolStopsWorkersWhenClosed():
+    sapPy=standInSAP2000Py()
+    finished=[]
+
+    def worker(modelFile,jobs,events,settings,stop):
+        try:
+            while not stop.is_set():
+                try:
+                    item=jobs.get_nowait()
+                except Exception:
+                    break
+                time.sleep(0.01)
+                events.put(("result",(modelFile,item)))
+        finally:
+            finished.append(modelFile)
+            events.put(("done",modelFile))
+
+    generator=sapPy._poolResults(["a.sdb","b.sdb"],range(1000),worker,{})
+    next(generator)
+    generator.close()
+    # close returns after every worker has ended
+    assert sorted(finished)==["a.sdb","b.sdb"]
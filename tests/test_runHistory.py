@@ -0,0 +1,80 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Run history: database schema, recorded runs, queries and case durations
+#########################################################################
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+CASES=["DEAD","MODAL","RS"]
+
+
+def recordRun(sapPy,modelFile,events,final,runFlags=(True,True,False),start=None):
+    responses=sapPy.SapModel.responses
+    responses["GetModelFilename"]=lambda *args:modelFile
+    responses["Analyze.GetCaseStatus"]=lambda *args:(0,len(CASES),CASES,list(final))
+    before={"start":time.time()-10.0 if start is None else start,"runFlags":(0,3,CASES,list(runFlags)),
+            "options":(0,1,2,4,"DEAD"),"status":(0,3,CASES,[1,1,1])}
+    return sapPy._historyRecord(before,events,0)
+
+
+@pytest.fixture
+def history(tmp_path):
+    sapPy=standInSAP2000Py()
+    sapPy.analyze_History_Enable(DatabasePath=str(tmp_path/"history.sqlite"),Label="v1")
+    modelFile=tmp_path/"bridge.sdb"
+    modelFile.write_bytes(b"model")
+    return sapPy,str(modelFile)
+
+
+def test_schema(history):
+    sapPy,modelFile=history
+    columns={table:[row[1] for row in sapPy.analyze_History_Query("PRAGMA table_info("+table+")")]
+             for table in ("runs","cases","transitions")}
+    assert columns["runs"]==["runId","start","wallTime","host","modelFile","modelHash","solverType",
+                             "solverProcessType","numberParallelRuns","ret","label"]
+    assert columns["cases"]==["runId","caseName","run","status","duration"]
+    assert columns["transitions"]==["runId","caseName","status","time"]
+
+
+def test_durationStartsAtThePreviousFinish(history):
+    sapPy,modelFile=history
+    # MODAL is seen "not finished" (3) at 5 s, that is not its start
+    events=[(2.0,"DEAD",4),(2.0,"MODAL",1),(5.0,"MODAL",3),(7.0,"MODAL",4)]
+    runId=recordRun(sapPy,modelFile,events,[4,4,1])
+    rows=sapPy.analyze_History_Query("SELECT caseName,run,status,duration FROM cases WHERE runId=? ORDER BY caseName",
+                                     (runId,))
+    assert rows==[("DEAD",1,4,pytest.approx(2.0)),("MODAL",1,4,pytest.approx(5.0)),("RS",0,1,None)]
+    transitions=sapPy.analyze_History_Query("SELECT caseName,status,time FROM transitions WHERE runId=?",(runId,))
+    assert transitions==[("DEAD",4,2.0),("MODAL",3,5.0),("MODAL",4,7.0)]
+    run=sapPy.analyze_History_Query("SELECT modelFile,modelHash,solverType,label FROM runs WHERE runId=?",(runId,))
+    assert run==[(modelFile,hashlib.sha1(b"model").hexdigest(),1,"v1")]
+
+
+def test_casesSeenFinishingInOnePollShareTheInterval(history):
+    sapPy,modelFile=history
+    runId=recordRun(sapPy,modelFile,[(3.0,"DEAD",4),(3.0,"MODAL",4)],[4,4,1])
+    rows=sapPy.analyze_History_Query("SELECT duration FROM cases WHERE runId=? AND run=1",(runId,))
+    assert [row[0] for row in rows]==[pytest.approx(3.0),pytest.approx(3.0)]
+
+
+def test_slowestCasesAndTrend(history):
+    sapPy,modelFile=history
+    recordRun(sapPy,modelFile,[(2.0,"DEAD",4),(7.0,"MODAL",4)],[4,4,1],start=time.time()-100.0)
+    sapPy.analyze_History_SetLabel("v2")
+    recordRun(sapPy,modelFile,[(1.0,"DEAD",4),(9.0,"MODAL",4)],[4,4,1])
+    slowest=sapPy.analyze_History_SlowestCases()
+    assert [row[0] for row in slowest]==["MODAL","DEAD"]
+    assert slowest[0][2:]==(pytest.approx(8.0),pytest.approx(6.5),2)
+    old=sapPy.analyze_History_SlowestCases(Days=30/86400.0)
+    assert old[0][2:]==(pytest.approx(8.0),pytest.approx(8.0),1)
+    trend=sapPy.analyze_History_CaseTrend("MODAL",ModelFile=modelFile)
+    assert [(row[3],row[5]) for row in trend]==[("v1",pytest.approx(5.0)),("v2",pytest.approx(8.0))]
+    assert sapPy.analyze_History_CaseTrend("RS")==[]
@@ -0,0 +1,77 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Polygon section properties against closed form rectangle and box
+#########################################################################
+import os
+import sys
+import numpy as np
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def rectangle(b,h,x0=0.0,y0=0.0):
+    return [[x0,y0],[x0+b,y0],[x0+b,y0+h],[x0,y0+h]]
+
+
+def box(B,H,t):
+    # the hole is given clockwise, the orientation of the rings does not matter
+    return [rectangle(B,H),rectangle(B-2*t,H-2*t,t,t)[::-1]]
+
+
+def test_rectangle():
+    sapPy=standInSAP2000Py()
+    b,h=0.4,0.8
+    props=sapPy.define_section_PolygonProperties([[rectangle(b,h,1.0,-2.0)]],Resolution=200)
+    assert props["A"][0]==pytest.approx(b*h)
+    assert (props["xc"][0],props["yc"][0])==(pytest.approx(1.0+b/2),pytest.approx(-2.0+h/2))
+    assert props["I33"][0]==pytest.approx(b*h**3/12) and props["I22"][0]==pytest.approx(h*b**3/12)
+    assert props["I23"][0]==pytest.approx(0.0,abs=1e-12)
+    # Saint-Venant torsion of a rectangle, long side a and short side c
+    a,c=h,b
+    J=a*c**3*(1/3-0.21*c/a*(1-c**4/(12*a**4)))
+    assert props["J"][0]==pytest.approx(J,rel=0.01)
+    assert props["As2"][0]==pytest.approx(5/6*b*h,rel=0.01) and props["As3"][0]==pytest.approx(5/6*b*h,rel=0.01)
+
+
+def test_hollowBox():
+    sapPy=standInSAP2000Py()
+    B,H,t=2.0,1.0,0.1
+    props=sapPy.define_section_PolygonProperties([box(B,H,t)],Resolution=200)
+    assert props["A"][0]==pytest.approx(B*H-(B-2*t)*(H-2*t))
+    assert (props["xc"][0],props["yc"][0])==(pytest.approx(B/2),pytest.approx(H/2))
+    assert props["I33"][0]==pytest.approx((B*H**3-(B-2*t)*(H-2*t)**3)/12)
+    assert props["I22"][0]==pytest.approx((H*B**3-(H-2*t)*(B-2*t)**3)/12)
+    # Bredt on the wall mid line, the walls are thick enough for the grid to be a little stiffer
+    bredt=4*((B-t)*(H-t))**2*t/(2*((B-t)+(H-t)))
+    assert bredt<props["J"][0]<1.1*bredt
+    assert props["JThinWalled"][0]==pytest.approx(bredt,rel=0.05)
+    # the webs carry the vertical shear, the flanges the horizontal shear
+    assert props["As2"][0]==pytest.approx(2*t*H,rel=0.05) and props["As3"][0]==pytest.approx(2*t*B,rel=0.1)
+
+
+def test_repeatedSectionsAreComputedOnce():
+    sapPy=standInSAP2000Py()
+    calls=[]
+    compute=sapPy._sectionCompute
+    sapPy._sectionCompute=lambda sections,Resolution:calls.append(len(sections)) or compute(sections,Resolution)
+    sections=[box(2.0,1.0,0.1),[rectangle(0.4,0.8)],box(2.0,1.0,0.1)]
+    first=sapPy.define_section_PolygonProperties(sections,Resolution=40)
+    second=sapPy.define_section_PolygonProperties(sections[:2],Resolution=40)
+    assert calls==[2]
+    assert first["hash"][0]==first["hash"][2]!=first["hash"][1]
+    assert np.array_equal(first["J"][:2],second["J"])
+
+
+def test_generalSectionsAreDefined():
+    sapPy=standInSAP2000Py()
+    sapPy.SapModel.stream=[]
+    props=sapPy.define_section_PropFrame_SetGeneralBulk(["G1","G2"],"C40",[[rectangle(0.4,0.8)],box(2.0,1.0,0.1)],
+                                                        Resolution=60,Torsion="thinWalled")
+    calls=[args for path,args in sapPy.SapModel.stream if path=="PropFrame.SetGeneral"]
+    assert [args[:2] for args in calls]==[("G1","C40"),("G2","C40")]
+    assert all(value in args for args,value in zip(calls,props["JThinWalled"]))
+    with pytest.raises(ValueError):
+        sapPy.define_section_PropFrame_SetGeneralBulk(["G1"],"C40",[],Resolution=60)
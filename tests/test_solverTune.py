@@ -0,0 +1,102 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Solver option tuning and the tuning profile
+#########################################################################
+import os
+import sys
+import json
+import time
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def tunedModel(points=150):
+    """a stand-in whose run time depends on the solver options, the multi-threaded solver fails"""
+    sapPy=standInSAP2000Py()
+    model=sapPy.SapModel
+    options={"current":(0,1,1,"MODAL")}
+    model.responses["PointObj.Count"]=points
+    model.responses["Analyze.GetRunCaseFlag"]=(0,3,["DEAD","MODAL","EQX"],[True,False,True])
+    model.responses["Analyze.GetSolverOption_2"]=lambda:(0,)+options["current"]
+
+    def setSolverOption(*args):
+        options["current"]=args
+        return 0
+
+    def runAnalysis():
+        SolverType,SolverProcessType,NumberParallelRuns,StiffCase=options["current"]
+        if SolverType==2:
+            return 1
+        time.sleep(0.0 if (SolverType,SolverProcessType)==(1,2) else 0.02)
+        return 0
+
+    model.responses["Analyze.SetSolverOption_2"]=setSolverOption
+    model.responses["Analyze.RunAnalysis"]=runAnalysis
+    model.stream=[]
+    return sapPy,options
+
+
+def test_fastestSucceedingCombinationIsStored(tmp_path):
+    sapPy,options=tunedModel()
+    ProfilePath=str(tmp_path/"profiles"/"solverProfile.json")
+    tune=sapPy.analyze_SolverTune(ProfilePath=ProfilePath)
+    assert len(tune["results"])==3*2*2
+    assert [result["ret"] for result in tune["results"]]==[0]*8+[1]*4
+    assert (tune["best"]["SolverType"],tune["best"]["SolverProcessType"])==(1,2)
+    assert tune["objects"]==150 and tune["bucket"]=="1e2"
+    with open(ProfilePath) as f:
+        profile=json.load(f)
+    assert profile["1e2"]["SolverType"]==1 and profile["1e2"]["cases"]==["DEAD","EQX"]
+    assert options["current"]==(1,2,tune["best"]["NumberParallelRuns"],"MODAL")
+    flags=[args for path,args in sapPy.SapModel.stream if path=="Analyze.SetRunCaseFlag"]
+    assert flags[-3:]==[("DEAD",True,False),("MODAL",False,False),("EQX",True,False)]
+    assert sapPy.SapModel.calls["Analyze.RunAnalysis"]==12
+
+
+def test_optionsRestoredAndGivenCasesAndRepeats(tmp_path):
+    sapPy,options=tunedModel()
+    ProfilePath=str(tmp_path/"solverProfile.json")
+    tune=sapPy.analyze_SolverTune(Cases=["MODAL"],SolverTypes=(0,1),ProcessTypes=(2,),ParallelRuns=(1,),Repeats=3,
+                                  ProfilePath=ProfilePath,Apply=False)
+    assert sapPy.SapModel.calls["Analyze.RunAnalysis"]==6
+    assert tune["best"]["SolverType"]==1
+    assert options["current"]==(0,1,1,"MODAL")
+    runs=[]
+    for path,args in sapPy.SapModel.stream:
+        if path=="Analyze.SetRunCaseFlag":
+            runs.append(args)
+        elif path=="Analyze.RunAnalysis":
+            assert runs[-2:]==[("",False,True),("MODAL",True,False)]
+
+
+def test_everyCombinationFailing(tmp_path):
+    sapPy,options=tunedModel()
+    ProfilePath=str(tmp_path/"solverProfile.json")
+    with pytest.raises(ValueError):
+        sapPy.analyze_SolverTune(SolverTypes=(2,),ProfilePath=ProfilePath)
+    assert not os.path.exists(ProfilePath)
+
+
+def test_profileAppliedBySizeBucket(tmp_path):
+    sapPy,options=tunedModel()
+    ProfilePath=str(tmp_path/"solverProfile.json")
+    sapPy.analyze_SolverTune(ParallelRuns=(4,),ProfilePath=ProfilePath)
+    with open(ProfilePath) as f:
+        entry=json.load(f)["1e2"]
+    other,otherOptions=tunedModel(points=300)
+    assert other.analyze_SolverProfile_Get(ProfilePath)==["1e2",entry]
+    other.analyze_SolverProfile_Enable(ProfilePath)
+    other.analyze_RunAnalysis()
+    assert otherOptions["current"]==(1,2,4,"MODAL")
+    larger,largerOptions=tunedModel(points=5000)
+    larger.analyze_SolverProfile_Enable(ProfilePath)
+    assert larger.analyze_SolverProfile_Get()==["1e3.5",None]
+    larger.analyze_RunAnalysis()
+    assert largerOptions["current"]==(0,1,1,"MODAL")
+    other.analyze_SolverProfile_Disable()
+    otherOptions["current"]=(0,0,0,"")
+    other.analyze_RunAnalysis()
+    assert otherOptions["current"]==(0,0,0,"")
@@ -0,0 +1,65 @@
+#-*-coding: UTF-8-*-
+#########################################################################
+#  Case partitioning and the split, run and merge of model copies
+#########################################################################
+import os
+import sys
+import pytest
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),".."))
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","benchmarks"))
+pytest.importorskip("win32com.client")
+from standInSapModel import standInSAP2000Py
+
+
+def test_partitionsBalanceTheWeights():
+    sapPy=standInSAP2000Py()
+    weights={"A":5.0,"B":4.0,"C":3.0,"D":3.0,"E":2.0,"F":1.0}
+    partitions=sapPy.analyze_PartitionCases(2,Cases=list(weights),Weights=weights)
+    assert sorted(case for partition in partitions for case in partition)==sorted(weights)
+    assert [sum(weights[case] for case in partition) for partition in partitions]==[9.0,9.0]
+    # the cases keep their given order inside a partition
+    assert partitions==[["A","D","F"],["B","C","E"]]
+
+
+def test_upstreamCasesFollowTheirDependents():
+    sapPy=standInSAP2000Py()
+    cases=["GRAV","PUSH","MODAL","RS1","RS2","RS3","RS4"]
+    dependencies={"PUSH":["GRAV"],"RS1":["MODAL"],"RS2":["MODAL"],"RS3":["MODAL"],"RS4":["MODAL"]}
+    partitions=sapPy.analyze_PartitionCases(3,Cases=cases,Dependencies=dependencies)
+    assert len(partitions)==3
+    for partition in partitions:
+        if "PUSH" in partition:
+            assert "GRAV" in partition
+        if any(case.startswith("RS") for case in partition):
+            assert "MODAL" in partition
+    assert sum("GRAV" in partition for partition in partitions)==1
+    assert sorted(case for partition in partitions for case in partition if case.startswith("RS"))==cases[3:]
+
+
+def test_sharedUpstreamCaseIsCopiedOnlyWhenItShortensTheRun():
+    sapPy=standInSAP2000Py()
+    dependencies={"RS1":["MODAL"],"RS2":["MODAL"]}
+    weights={"NL":20.0,"MODAL":10.0,"RS1":1.0,"RS2":1.0}
+    # a copy of MODAL in the second partition ends at 11 instead of 12
+    partitions=sapPy.analyze_PartitionCases(2,Cases=["MODAL","RS1","RS2"],Dependencies=dependencies,Weights=weights)
+    assert partitions==[["MODAL","RS1"],["MODAL","RS2"]]
+    # next to a longer case both response spectrum cases share one MODAL
+    partitions=sapPy.analyze_PartitionCases(2,Cases=["NL","MODAL","RS1","RS2"],Dependencies=dependencies,
+                                            Weights=weights)
+    assert partitions==[["NL"],["MODAL","RS1","RS2"]]
+
+
+def test_emptyPartitionsAreRemoved():
+    sapPy=standInSAP2000Py()
+    assert sapPy.analyze_PartitionCases(4,Cases=["DEAD","LIVE"])==[["DEAD"],["LIVE"]]
+
+
+def test_copiesAreDeletedWhenARunFails(tmp_path):
+    sapPy=standInSAP2000Py()
+    masterFile=tmp_path/"bridge.sdb"
+    masterFile.write_bytes(b"model")
+    sapPy.SapModel.responses["GetModelFilename"]=lambda *args:str(masterFile)
+    sapPy._splitWorker=lambda modelFile,cases,errors:errors.append(RuntimeError("license"))
+    with pytest.raises(RuntimeError):
+        sapPy.analyze_SplitRunMerge(2,Cases=["DEAD","LIVE"])
+    assert sorted(os.listdir(tmp_path))==["bridge.sdb"]